@@ -0,0 +1,96 @@
+"""Runs the `EnvLoader` benchmark suite and checks it against a stored baseline.
+
+Usage:
+    poetry run python -m benchmarks --save-baseline   # record the baseline
+    poetry run python -m benchmarks                   # compare against it
+
+Results are written as JSON to `--output`. The run fails with exit code 1 if
+any case is slower than its baseline by more than `--tolerance`.
+"""
+
+import argparse
+import fnmatch
+import json
+import pathlib
+import platform
+import sys
+import timeit
+
+from benchmarks.cases import CASES
+
+BENCHMARKS_DIR = pathlib.Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results.json"
+
+
+def measure(name: str, repeat: int) -> float:
+    """Returns the best time per operation of a case, in nanoseconds."""
+    func = CASES[name]()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    regressions = []
+    print(f"{'case':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<45} {'-':>12} {current:>10.0f}ns {'new':>8}")
+            continue
+
+        change = current / previous - 1
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<45} {previous:>10.0f}ns {current:>10.0f}ns {change:>+7.0%}{flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="*", help="glob of cases to run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--baseline", type=pathlib.Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=pathlib.Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if fnmatch.fnmatchcase(name, args.filter)]
+    results = {name: measure(name, args.repeat) for name in names}
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Saved baseline of {len(results)} cases to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+    else:
+        print(f"No baseline found at {args.baseline}; run with --save-baseline")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Measures `python -m typedenv check` over many env files, by number of jobs.
+
+Usage: poetry run python -m benchmarks.bench_check
+"""
+
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+
+NUM_FILES = 2000
+NUM_FIELDS = 200
+
+CONFIG_MODULE = f"""
+import typedenv
+
+
+class Config(typedenv.EnvLoader):
+    __annotations__ = {{f"CHECK_KEY_{{i}}": list[int] for i in range({NUM_FIELDS})}}
+"""
+
+
+def run_check(cwd: pathlib.Path, env: dict[str, str], jobs: int) -> float:
+    files = sorted(str(path) for path in cwd.glob("*.env"))
+    command = [sys.executable, "-m", "typedenv", "check", "config:Config", *files]
+    start = time.perf_counter()
+    subprocess.run(
+        [*command, "--jobs", str(jobs)],
+        cwd=cwd,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    root = pathlib.Path(__file__).resolve().parent.parent
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([".", str(root)]))
+    content = "".join(
+        f"CHECK_KEY_{i}={','.join(['1'] * 50)}\n" for i in range(NUM_FIELDS)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cwd = pathlib.Path(tmp_dir)
+        (cwd / "config.py").write_text(CONFIG_MODULE)
+        for i in range(NUM_FILES):
+            (cwd / f"deploy_{i}.env").write_text(content)
+
+        print(f"{NUM_FILES} files with {NUM_FIELDS} list[int] keys each")
+        cpus = os.cpu_count() or 1
+        for jobs in sorted({1, 2, cpus}):
+            elapsed = run_check(cwd, env, jobs)
+            print(f"jobs={jobs:<3} {elapsed:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compares instantiation cost of the generic loader loop against `compiled=True`.
+
+Usage: poetry run python -m benchmarks.bench_compiled
+"""
+
+import os
+import timeit
+
+import typedenv
+
+
+def make_loader(num_fields: int, compiled: bool) -> type[typedenv.EnvLoader]:
+    annotations = {f"BENCH_KEY_{i}": (int if i % 2 else str) for i in range(num_fields)}
+    namespace = {"__annotations__": annotations}
+    return type(
+        f"Bench{num_fields}", (typedenv.EnvLoader,), namespace, compiled=compiled
+    )
+
+
+def main() -> None:
+    for i in range(1000):
+        os.environ[f"BENCH_KEY_{i}"] = str(i)
+
+    print(f"{'fields':>8} {'loop (us)':>12} {'compiled (us)':>14} {'speedup':>8}")
+    for num_fields in (10, 100, 1000):
+        number = max(10, 20_000 // num_fields)
+        timings = []
+        for compiled in (False, True):
+            cls = make_loader(num_fields, compiled)
+            cls()  # warm up the cached plan and generated loader
+            best = min(timeit.repeat(cls, number=number, repeat=5))
+            timings.append(best / number * 1e6)
+
+        loop_us, compiled_us = timings
+        print(
+            f"{num_fields:>8} {loop_us:>12.1f} {compiled_us:>14.1f} {loop_us / compiled_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measures parsing of a generated 100k-line `.env` file.
+
+Usage: poetry run python -m benchmarks.bench_env_file
+"""
+
+import pathlib
+import tempfile
+import time
+
+import typedenv
+from typedenv.sources import parse_env_file
+
+NUM_LINES = 100_000
+PEM_BODY_LINES = 20
+PEM_VALUE = (
+    '"-----BEGIN KEY-----\n' + ("A" * 64 + "\n") * PEM_BODY_LINES + '-----END KEY-----"'
+)
+
+
+def write_env_file(path: pathlib.Path) -> None:
+    with open(path, "w") as file:
+        line = 0
+        while line < NUM_LINES:
+            if line % 100 == 0:
+                file.write(f"# section {line}\n")
+                line += 1
+            elif line % 100 == 1:
+                file.write(f"PEM_{line}={PEM_VALUE}\n")
+                line += PEM_BODY_LINES + 2
+            elif line % 3 == 0:
+                file.write(f"export QUOTED_{line}=\"value {line}\"\n")
+                line += 1
+            else:
+                file.write(f"KEY_{line}=value-{line}  # comment\n")
+                line += 1
+
+
+def best_of(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / ".env"
+        write_env_file(path)
+
+        class Config(typedenv.EnvLoader):
+            KEY_23: str
+            QUOTED_24: str
+            PEM_101: str
+            KEY_99999: str | None
+
+        all_keys = best_of(lambda: parse_env_file(path))
+        declared_keys = best_of(lambda: Config.from_env_file(path))
+
+        size_mb = path.stat().st_size / 1e6
+        print(f"file: {NUM_LINES} lines, {size_mb:.1f} MB")
+        print(f"parse all keys:        {all_keys * 1e3:8.1f} ms")
+        print(f"load 4 declared keys:  {declared_keys * 1e3:8.1f} ms")
+
+        try:
+            import dotenv  # type: ignore[import-not-found]
+        except ImportError:
+            return
+
+        reference = best_of(lambda: dotenv.dotenv_values(path), repeat=1)
+        print(f"python-dotenv:         {reference * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures the memory held by 100k loaded instances, with and without slots.
+
+Usage: poetry run python -m benchmarks.bench_memory
+"""
+
+import gc
+import os
+import tracemalloc
+
+import typedenv
+
+NUM_INSTANCES = 100_000
+NUM_FIELDS = 10
+
+
+def make_loader(**options) -> type[typedenv.EnvLoader]:
+    annotations = {f"MEMORY_KEY_{i}": int for i in range(NUM_FIELDS)}
+    return type("Config", (typedenv.EnvLoader,), {"__annotations__": annotations}, **options)
+
+
+def measure(cls: type[typedenv.EnvLoader]) -> int:
+    # The load plan is built outside of the measurement
+    cls()
+    gc.collect()
+
+    tracemalloc.start()
+    instances = [cls() for _ in range(NUM_INSTANCES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del instances
+    return size
+
+
+def main() -> None:
+    for i in range(NUM_FIELDS):
+        os.environ[f"MEMORY_KEY_{i}"] = str(i)
+
+    print(f"{NUM_INSTANCES} instances with {NUM_FIELDS} keys each")
+    for name, options in (
+        ("default", {}),
+        ("slots", {"slots": True}),
+        ("compiled", {"compiled": True}),
+        ("compiled + slots", {"compiled": True, "slots": True}),
+    ):
+        size = measure(make_loader(**options))
+        per_instance = size / NUM_INSTANCES
+        print(f"{name:18} {size / 1e6:8.1f} MB  {per_instance:6.0f} B/instance")
+
+
+if __name__ == "__main__":
+    main()
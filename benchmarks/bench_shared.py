@@ -0,0 +1,62 @@
+"""Measures how a worker gets its config: by loading it, or from a shared published instance.
+
+Usage: poetry run python -m benchmarks.bench_shared
+"""
+
+import os
+import timeit
+import typing
+
+import typedenv
+from typedenv import shared
+
+NUM_FIELDS = 500
+NUMBER = 200
+
+
+def int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",")]
+
+
+class Config(typedenv.EnvLoader):
+    __annotations__ = {
+        f"SHARED_KEY_{i}": typing.Annotated[list[int], typedenv.Converter(int_list)]
+        for i in range(NUM_FIELDS)
+    }
+
+
+def best_of(func: typing.Callable[[], typing.Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main() -> None:
+    for i in range(NUM_FIELDS):
+        os.environ[f"SHARED_KEY_{i}"] = ",".join(["1"] * 20)
+
+    published = shared.publish(Config())
+    attached = shared.attach(Config, published.name)
+    try:
+        load = best_of(Config)
+        attach = best_of(lambda: shared.attach(Config, published.name).close())
+        hit = best_of(attached.get)
+
+        def get_new_version() -> Config:
+            # Forget the version read last, as if a new one had been published
+            attached._counter = -1
+            return attached.get()
+
+        unpickle = best_of(get_new_version)
+    finally:
+        attached.close()
+        published.close()
+        published.unlink()
+
+    print(f"config: {NUM_FIELDS} keys with a custom converter")
+    print(f"load in worker:              {load * 1e6:10.1f} us")
+    print(f"attach:                      {attach * 1e6:10.1f} us")
+    print(f"get new version:             {unpickle * 1e6:10.1f} us")
+    print(f"get unchanged version:       {hit * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
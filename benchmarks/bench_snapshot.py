@@ -0,0 +1,87 @@
+"""Measures the cold start of a worker process, with and without a snapshot.
+
+Usage: poetry run python -m benchmarks.bench_snapshot
+"""
+
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+
+NUM_FIELDS = 500
+REPEAT = 10
+
+CONFIG_MODULE = f"""
+import typing
+
+import typedenv
+
+
+def int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",")]
+
+
+class Config(typedenv.EnvLoader):
+    __annotations__ = {{
+        f"SNAPSHOT_KEY_{{i}}": typing.Annotated[
+            list[int] | None, typedenv.Converter(int_list)
+        ]
+        for i in range({NUM_FIELDS})
+    }}
+"""
+
+# Each load is timed inside a fresh interpreter, after the module defining
+# the class was imported, so interpreter startup noise is not measured
+TIMED_LOAD = """
+import time
+import config
+start = time.perf_counter()
+{load}
+print(time.perf_counter() - start)
+"""
+LOAD_PLAIN = "config.Config()"
+LOAD_SNAPSHOT = (
+    "from typedenv import snapshot\n"
+    "snapshot.load(config.Config, 'config.snapshot')"
+)
+
+
+def best_of(load: str, cwd: pathlib.Path, env: dict[str, str]) -> float:
+    code = TIMED_LOAD.format(load=load)
+    timings = []
+    for _ in range(REPEAT):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=cwd,
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(float(result.stdout))
+    return min(timings)
+
+
+def main() -> None:
+    root = pathlib.Path(__file__).resolve().parent.parent
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([".", str(root)]))
+    env.update({f"SNAPSHOT_KEY_{i}": ",".join(["1"] * 20) for i in range(NUM_FIELDS)})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cwd = pathlib.Path(tmp_dir)
+        (cwd / "config.py").write_text(CONFIG_MODULE)
+
+        # The first load writes the snapshot that later loads restore
+        best_of(LOAD_SNAPSHOT, cwd, env)
+        plain = best_of(LOAD_PLAIN, cwd, env)
+        restored = best_of(LOAD_SNAPSHOT, cwd, env)
+
+    print(f"config: {NUM_FIELDS} keys with a custom converter")
+    print(f"load without snapshot:  {plain * 1e3:8.1f} ms")
+    print(f"load from snapshot:     {restored * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Benchmark cases for the `EnvLoader` hot paths.
+
+Every case is a zero-argument callable performing one operation, built by a
+setup function so class creation and environment setup are not measured.
+"""
+
+import array
+import os
+import tempfile
+import typing
+
+import typedenv
+
+Case = typing.Callable[[], typing.Any]
+CASES: dict[str, typing.Callable[[], Case]] = {}
+
+
+def case(name: str):
+    def register(setup: typing.Callable[[], Case]) -> typing.Callable[[], Case]:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+# Every case sees the same environment, since its size affects load time
+for _i in range(1000):
+    os.environ[f"BENCH_KEY_{_i}"] = str(_i)
+
+
+def _make_loader(
+    num_fields: int,
+    hint: typing.Any = int,
+    **options: typing.Any,
+) -> type[typedenv.EnvLoader]:
+    annotations = {f"BENCH_KEY_{i}": hint for i in range(num_fields)}
+    return type(
+        "BenchEnv", (typedenv.EnvLoader,), {"__annotations__": annotations}, **options
+    )
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(value)] * 4
+
+
+for _num_fields in (1, 10, 100, 1000):
+    for _compiled in (False, True):
+        _suffix = "compiled" if _compiled else "loop"
+
+        def _setup(num_fields: int = _num_fields, compiled: bool = _compiled) -> Case:
+            return _make_loader(num_fields, compiled=compiled)
+
+        case(f"instantiate[{_num_fields} fields, {_suffix}]")(_setup)
+
+
+@case("instantiate[10 nullable fields]")
+def _nullable() -> Case:
+    return _make_loader(10, hint=int | None)
+
+
+@case("instantiate[10 missing nullable fields]")
+def _missing_nullable() -> Case:
+    annotations = {f"BENCH_MISSING_{i}": int | None for i in range(10)}
+    return type("BenchEnv", (typedenv.EnvLoader,), {"__annotations__": annotations})
+
+
+@case("instantiate[10 class converter fields]")
+def _class_converter() -> Case:
+    return _make_loader(
+        10, hint=list[int], converters=[typedenv.Converter(_int_list)]
+    )
+
+
+@case("instantiate[10 annotated converter fields]")
+def _annotated_converter() -> Case:
+    return _make_loader(
+        10, hint=typing.Annotated[list[int], typedenv.Converter(_int_list)]
+    )
+
+
+@case("instantiate[subclass chain depth 50]")
+def _subclass_chain() -> Case:
+    cls: type = typedenv.EnvLoader
+    for i in range(50):
+        cls = type(f"Depth{i}", (cls,), {"__annotations__": {f"BENCH_KEY_{i}": int}})
+    return cls
+
+
+@case("resolve fields[100 annotated fields]")
+def _resolve_fields() -> Case:
+    cls = _make_loader(
+        100, hint=typing.Annotated[list[int] | None, typedenv.Converter(_int_list)]
+    )
+
+    def resolve() -> typing.Any:
+        del cls.__env_fields__
+        return typedenv.fields(cls)
+
+    typedenv.fields(cls)
+    return resolve
+
+
+@case("singleton hit")
+def _singleton_hit() -> Case:
+    cls = _make_loader(10, singleton=True)
+    cls()
+    return cls
+
+
+@case("singleton hit[ttl]")
+def _singleton_hit_ttl() -> Case:
+    cls = _make_loader(10, singleton=True, ttl=3600)
+    cls()
+    return cls
+
+
+@case("getattr[env key]")
+def _getattr_env() -> Case:
+    env = _make_loader(1)()
+    return lambda: getattr(env, "BENCH_KEY_0")
+
+
+for _frozen in (True, False):
+    _suffix = "frozen" if _frozen else "unfrozen"
+
+    def _setattr_other(frozen: bool = _frozen) -> Case:
+        env = _make_loader(10, frozen=frozen)()
+        return lambda: setattr(env, "other_attr", 1)
+
+    case(f"setattr[non-env attr, {_suffix}]")(_setattr_other)
+
+
+@case("setattr[env key, unfrozen]")
+def _setattr_env() -> Case:
+    env = _make_loader(10, frozen=False)()
+    return lambda: setattr(env, "BENCH_KEY_0", 1)
+
+
+@case("setattr[plain object]")
+def _setattr_plain() -> Case:
+    class Plain:
+        pass
+
+    obj = Plain()
+    return lambda: setattr(obj, "other_attr", 1)
+
+
+os.environ["BENCH_IDS"] = ",".join(str(i) for i in range(10_000))
+
+_COLLECTION_HINTS = {
+    "list[int]": list[int],
+    "frozenset[int]": frozenset[int],
+    "array.array": array.array,
+}
+
+for _name, _hint in _COLLECTION_HINTS.items():
+
+    def _collection(hint: typing.Any = _hint) -> Case:
+        annotations = {"BENCH_IDS": hint}
+        return type("BenchEnv", (typedenv.EnvLoader,), {"__annotations__": annotations})
+
+    case(f"instantiate[10k ids, {_name}]")(_collection)
+
+
+for _i in range(10):
+    for _key in ("HOST", "PORT"):
+        os.environ[f"BENCH_GROUP_{_i}_{_key}"] = "1"
+
+
+@case("instantiate[10 nested groups]")
+def _nested_groups() -> Case:
+    group = type(
+        "BenchGroup", (typedenv.EnvLoader,), {"__annotations__": {"HOST": str, "PORT": int}}
+    )
+    annotations = {f"BENCH_GROUP_{i}": group for i in range(10)}
+    return type("BenchEnv", (typedenv.EnvLoader,), {"__annotations__": annotations})
+
+
+_TENANTS = [{f"BENCH_KEY_{i}": str(n + i) for i in range(10)} for n in range(1000)]
+
+for _bulk in (False, True):
+    _suffix = "load_many" if _bulk else "from_mapping loop"
+
+    def _tenants(bulk: bool = _bulk) -> Case:
+        cls = _make_loader(10)
+        if bulk:
+            return lambda: cls.load_many(_TENANTS)
+        return lambda: [cls.from_mapping(mapping) for mapping in _TENANTS]
+
+    case(f"load 1000 mappings[10 fields, {_suffix}]")(_tenants)
+
+
+_SECRETS_DIR = tempfile.mkdtemp(prefix="typedenv-bench-")
+for _i in range(10):
+    _path = os.path.join(_SECRETS_DIR, f"secret_{_i}")
+    with open(_path, "w") as _file:
+        _file.write(f"secret-{_i}\n")
+    os.environ[f"BENCH_SECRET_{_i}_FILE"] = _path
+
+
+@case("instantiate[10 secret files]")
+def _secret_files() -> Case:
+    annotations = {f"BENCH_SECRET_{i}": str for i in range(10)}
+    return type(
+        "BenchEnv",
+        (typedenv.EnvLoader,),
+        {"__annotations__": annotations},
+        sources=[typedenv.SecretFiles()],
+    )
@@ -0,0 +1,102 @@
+import json
+import pathlib
+import typing
+
+import pytest
+
+import typedenv
+from typedenv import cli
+
+
+class CheckEnv(typedenv.EnvLoader):
+    CHECK_NAME: str
+    CHECK_PORT: int
+    CHECK_DEBUG: bool = False
+
+
+class LazyCheckEnv(typedenv.EnvLoader):
+    CHECK_ROUTES: typedenv.Json[dict[str, int]]
+    CHECK_PORT: typing.Annotated[int, typedenv.Lazy]
+
+
+SPEC = f"{__name__}:CheckEnv"
+
+
+@pytest.fixture
+def env_files(tmp_path: pathlib.Path) -> list[str]:
+    files = {
+        "good.env": "CHECK_NAME=app\nCHECK_PORT=80\n",
+        "bad.env": "CHECK_PORT=eighty\n",
+        "defaults.env": "CHECK_NAME=app\nCHECK_PORT=81\nCHECK_DEBUG=true\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content)
+    return [str(tmp_path / name) for name in files]
+
+
+def test__cli__import_loader():
+    assert cli.import_loader(SPEC) is CheckEnv
+
+    with pytest.raises(ValueError):
+        cli.import_loader(__name__)
+    with pytest.raises(TypeError):
+        cli.import_loader(f"{__name__}:SPEC")
+    with pytest.raises(ImportError):
+        cli.import_loader("missing_module:CheckEnv")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test__cli__check(env_files: list[str], jobs: int):
+    reports = cli.check(SPEC, env_files, jobs=jobs)
+
+    assert [report["file"] for report in reports] == env_files
+    assert [report["ok"] for report in reports] == [True, False, True]
+    assert reports[0]["errors"] == []
+    assert {error["key"] for error in reports[1]["errors"]} == {"CHECK_NAME", "CHECK_PORT"}
+    assert all(error["error"] == "ValueError" for error in reports[1]["errors"])
+
+
+def test__cli__check_ignores_the_environment(
+    env_files: list[str], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("CHECK_NAME", "from env")
+
+    (report,) = cli.check(SPEC, env_files[1:2], jobs=1)
+    assert [error["key"] for error in report["errors"]] == ["CHECK_NAME", "CHECK_PORT"]
+
+
+def test__cli__check_lazy_keys(tmp_path: pathlib.Path):
+    path = tmp_path / "lazy.env"
+    path.write_text("CHECK_ROUTES={not json\nCHECK_PORT=abc\n")
+
+    (report,) = cli.check(f"{__name__}:LazyCheckEnv", [str(path)], jobs=1)
+    assert report["ok"] is False
+    assert {error["key"] for error in report["errors"]} == {"CHECK_ROUTES", "CHECK_PORT"}
+
+
+def test__cli__check_unreadable_file(tmp_path: pathlib.Path):
+    (report,) = cli.check(SPEC, [str(tmp_path / "missing.env")], jobs=1)
+
+    assert report["ok"] is False
+    assert report["errors"][0]["key"] is None
+    assert report["errors"][0]["error"] == "FileNotFoundError"
+
+
+def test__cli__main(env_files: list[str], capsys: pytest.CaptureFixture[str]):
+    assert cli.main(["check", SPEC, *env_files, "--jobs", "1"]) == 1
+
+    out, err = capsys.readouterr()
+    reports = [json.loads(line) for line in out.splitlines()]
+    assert [report["ok"] for report in reports] == [True, False, True]
+    assert "checked 3 files" in err
+    assert "1 failed" in err
+
+    assert cli.main(["check", SPEC, env_files[0]]) == 0
+
+
+def test__cli__main_invalid_loader(capsys: pytest.CaptureFixture[str]):
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["check", "missing_module:CheckEnv", "app.env"])
+
+    assert exc_info.value.code == 2
+    assert "missing_module" in capsys.readouterr().err
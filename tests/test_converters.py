@@ -1,5 +1,11 @@
+import array
+import enum
+import types
+import typing
+
 import pytest
 
+import typedenv
 import typedenv.converters
 
 
@@ -74,3 +80,245 @@ def test__converter__valid():
 
     assert converter.type_ == list[int]
     assert converter.convert("1,2,3") == [1, 2, 3]
+
+
+def test__converter_cache__hits_and_misses():
+    calls = []
+
+    def str_list(value: str) -> list[str]:
+        calls.append(value)
+        return value.split(",")
+
+    cache = typedenv.converters.ConverterCache()
+    cached = cache.wrap(str_list)
+
+    assert cached("a,b") == ["a", "b"]
+    assert cached("a,b") == ["a", "b"]
+    assert cached("c") == ["c"]
+    assert calls == ["a,b", "c"]
+    assert cache.cache_info() == (1, 2, 1024, 2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 1024, 0)
+
+
+def test__converter_cache__lru_eviction():
+    cache = typedenv.converters.ConverterCache(maxsize=2)
+
+    cache.convert(int, "1")
+    cache.convert(int, "2")
+    cache.convert(int, "1")
+    cache.convert(int, "3")
+
+    assert cache.cache_info().currsize == 2
+    cache.convert(int, "1")
+    cache.convert(int, "2")
+    assert cache.cache_info().hits == 2
+    assert cache.cache_info().misses == 4
+
+
+def test__converter_cache__keyed_on_converter():
+    cache = typedenv.converters.ConverterCache()
+
+    assert cache.convert(int, "1") == 1
+    assert cache.convert(float, "1") == 1.0
+    assert isinstance(cache.convert(float, "1"), float)
+
+
+def test__converter_cache__invalid_maxsize():
+    with pytest.raises(ValueError):
+        typedenv.converters.ConverterCache(maxsize=0)
+
+
+def _collection_converter(type_, delimited=None):
+    converters = typedenv.converters.ConverterDict()
+    converters[str] = str
+    converters[int] = int
+    converters[float] = float
+    converters[bool] = typedenv.converters.cast_to_bool
+
+    result = typedenv.converters.create_collection_converter(
+        type_, converters, delimited
+    )
+    assert result is not None
+    return result
+
+
+@pytest.mark.parametrize(
+    "type_, value, expected",
+    [
+        (list[int], "1,2,3", [1, 2, 3]),
+        (list[str], " a, b ,c", ["a", "b", "c"]),
+        (list[bool], "true, 0", [True, False]),
+        (set[str], "a,b,a", {"a", "b"}),
+        (frozenset[int], "1, 2, 1", frozenset({1, 2})),
+        (tuple[float, ...], "1.5,2", (1.5, 2.0)),
+        (tuple[str, int], "a,1", ("a", 1)),
+        (dict[str, int], "a=1, b=2", {"a": 1, "b": 2}),
+        (list[int], "", []),
+        (dict[str, str], "", {}),
+    ],
+)
+def test__create_collection_converter(type_, value, expected):
+    convert, _ = _collection_converter(type_)
+    result = convert(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "type_, cacheable",
+    [
+        (list[int], False),
+        (set[int], False),
+        (dict[str, int], False),
+        (frozenset[int], True),
+        (tuple[int, ...], True),
+    ],
+)
+def test__create_collection_converter__cacheable(type_, cacheable: bool):
+    assert _collection_converter(type_)[1] is cacheable
+
+
+def test__create_collection_converter__delimited():
+    delimited = typedenv.Delimited(";", kv_sep=":", strip=False)
+    convert, _ = _collection_converter(dict[str, str], delimited)
+
+    assert convert("a:1; b:2") == {"a": "1", " b": "2"}
+
+
+def test__create_collection_converter__array():
+    convert, _ = _collection_converter(array.array)
+    assert convert("1,2,3") == array.array("q", [1, 2, 3])
+
+    convert, _ = _collection_converter(array.array, typedenv.Delimited(typecode="d"))
+    assert convert("1.5, 2") == array.array("d", [1.5, 2.0])
+
+    with pytest.raises(TypeError):
+        _collection_converter(array.array, typedenv.Delimited(typecode="u"))
+
+
+@pytest.mark.parametrize(
+    "type_, value",
+    [
+        (tuple[str, int], "a,1,2"),
+        (dict[str, int], "a=1,b"),
+        (list[int], "1,,2"),
+    ],
+)
+def test__create_collection_converter__invalid_value(type_, value: str):
+    convert, _ = _collection_converter(type_)
+
+    with pytest.raises(ValueError):
+        convert(value)
+
+
+@pytest.mark.parametrize(
+    "type_",
+    # A dict with only a key type, which cannot be spelled in a checked annotation
+    [list, list[bytes], list[list[int]], types.GenericAlias(dict, (str,))],
+)
+def test__create_collection_converter__unsupported(type_):
+    with pytest.raises(TypeError):
+        _collection_converter(type_)
+
+
+def test__create_collection_converter__not_a_collection():
+    converters = typedenv.converters.ConverterDict()
+    assert typedenv.converters.create_collection_converter(int, converters) is None
+
+
+@pytest.mark.parametrize("sep, kv_sep", [("", "="), (",", ""), (",", ",")])
+def test__delimited__invalid(sep: str, kv_sep: str):
+    with pytest.raises(ValueError):
+        typedenv.Delimited(sep, kv_sep=kv_sep)
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Port(int):
+    pass
+
+
+UserId = typing.NewType("UserId", int)
+
+
+def _builtin_converters() -> typedenv.converters.ConverterDict:
+    converters = typedenv.converters.ConverterDict()
+    converters[str] = str
+    converters[int] = int
+    converters[bool] = typedenv.converters.cast_to_bool
+    return converters
+
+
+@pytest.mark.parametrize(
+    "type_, value, expected",
+    [
+        (Color, "red", Color.RED),
+        (Color, "GREEN", Color.GREEN),
+        (Level, "2", Level.HIGH),
+        (Level, "LOW", Level.LOW),
+        (typing.Literal["a", "b"], "b", "b"),
+        (typing.Literal[1, 2], "2", 2),
+        (typing.Literal[True, "auto"], "true", True),
+        (typing.Literal[True, False], "True", True),
+        (typing.Literal[True, False], "0", False),
+        (typing.Literal[False, 1], "1", 1),
+        (typing.Literal[Color.RED], "red", Color.RED),
+        (UserId, "7", 7),
+        (Port, "80", Port(80)),
+    ],
+)
+def test__converter_dict__resolve(type_, value: str, expected):
+    convert = _builtin_converters().resolve(type_)
+
+    assert convert is not None
+    assert convert(value) == expected
+    assert type(convert(value)) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "type_, value",
+    [
+        (Color, "blue"),
+        (typing.Literal["a", "b"], "c"),
+        (typing.Literal[1], "01"),
+        (typing.Literal[True], "0"),
+    ],
+)
+def test__converter_dict__resolve_invalid_value(type_, value: str):
+    convert = _builtin_converters().resolve(type_)
+
+    assert convert is not None
+    with pytest.raises(ValueError):
+        convert(value)
+
+
+def test__converter_dict__resolve_unsupported():
+    assert _builtin_converters().resolve(bytes) is None
+    assert _builtin_converters().resolve(list[int]) is None
+
+
+def test__converter_dict__resolve_cached():
+    converters = _builtin_converters()
+
+    assert converters.resolve(Color) is converters.resolve(Color)
+    assert _builtin_converters().resolve(Color) is converters.resolve(Color)
+    assert converters.resolve(Port) is converters.resolve(Port)
+
+
+def test__converter_dict__resolve_after_registering():
+    converters = _builtin_converters()
+    assert converters.resolve(bytes) is None
+
+    converters[bytes] = str.encode
+    assert converters.resolve(bytes) is str.encode
@@ -1,3 +1,4 @@
+import enum
 import json
 import typing
 
@@ -42,7 +43,7 @@ def test__env_loader__invalid_type(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("MY_KEY", "string")
 
     class MyEnv(typedenv.EnvLoader):
-        MY_KEY: list[str]
+        MY_KEY: list[bytes]
 
     with pytest.raises(TypeError):
         MyEnv()
@@ -246,6 +247,27 @@ def test__env_loader__mutable(monkeypatch: pytest.MonkeyPatch):
     assert env.MY_KEY == "new value"
 
 
+def test__env_loader__frozen_delete(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "env value")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+        DEFAULT_KEY: str = "default"
+
+    env = MyEnv()
+    with pytest.raises(AttributeError):
+        del env.MY_KEY
+    with pytest.raises(AttributeError):
+        env.DEFAULT_KEY = "new value"
+
+    assert env.MY_KEY == "env value"
+    assert env.DEFAULT_KEY == "default"
+    assert MyEnv.DEFAULT_KEY == "default"
+    # Keys without a default are not class attributes, as before loading
+    assert not hasattr(MyEnv, "MY_KEY")
+    assert getattr(MyEnv, "MY_KEY", "fallback") == "fallback"
+
+
 def test__env_loader__regular_attrs_mutable():
     class MyEnv(typedenv.EnvLoader):
         regular_attr: str
@@ -305,6 +327,32 @@ def test__env_loader__inheritance__mutable_child(monkeypatch: pytest.MonkeyPatch
     assert child.CHILD_KEY == "new child value"
 
 
+def test__env_loader__inheritance__mutable_child_loaded_first(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("BASE_KEY", "old base value")
+
+    class Base(typedenv.EnvLoader):
+        BASE_KEY: str
+        DEFAULT_KEY: str = "default"
+
+    class Child(Base, frozen=False):
+        pass
+
+    child = Child()
+    base = Base()
+
+    child.BASE_KEY = "new base value"
+    child.DEFAULT_KEY = "new default"
+    with pytest.raises(AttributeError):
+        base.BASE_KEY = "new base value"
+
+    assert child.BASE_KEY == "new base value"
+    assert child.DEFAULT_KEY == "new default"
+    assert Child.DEFAULT_KEY == "default"
+    assert base.BASE_KEY == "old base value"
+
+
 def test__env_loader__inheritance__narrowed_type(monkeypatch: pytest.MonkeyPatch):
     class Base(typedenv.EnvLoader):
         BASE_KEY: str | None
@@ -397,3 +445,230 @@ def test__env_loader__mixed_conversion(monkeypatch: pytest.MonkeyPatch):
     assert MyEnv().BASIC_INT == 42
     assert MyEnv().KEBAB_STR == "default string converter should be overridden"
     assert MyEnv().JSON_ENV == {"config1": "value1", "config2": "value2"}
+
+
+def test__env_loader__fields_resolved_once(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "12")
+    calls = []
+
+    def counting_int(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: typing.Annotated[int, typedenv.Converter(counting_int)]
+        OTHER_KEY: str | None = "default"
+
+    fields = typedenv.fields(MyEnv)
+    MyEnv()
+    MyEnv()
+
+    assert typedenv.fields(MyEnv) is fields
+    assert typedenv.fields(MyEnv()) is fields
+    assert [f.name for f in fields] == ["MY_KEY", "OTHER_KEY"]
+    assert fields[0].type_ is int
+    assert fields[0].convert is counting_int
+    assert fields[1].nullable is True
+    assert fields[1].default == "default"
+    assert calls == ["12", "12", "12"]
+
+
+def test__env_loader__fields_per_subclass():
+    class Base(typedenv.EnvLoader):
+        SOME_KEY: int | None
+        OTHER_KEY: str = "base"
+
+    base_fields = typedenv.fields(Base)
+
+    class Child(Base):
+        SOME_KEY: int
+        OTHER_KEY = "child"
+
+    child_fields = typedenv.fields(Child)
+
+    assert base_fields[0].nullable is True
+    assert child_fields[0].nullable is False
+    assert base_fields[1].default == "base"
+    assert child_fields[1].default == "child"
+    assert typedenv.fields(Base) is base_fields
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__from_mapping(compiled: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_INT", "1")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        MY_INT: int
+        MY_STR: str = "default"
+
+    env = MyEnv.from_mapping({"MY_INT": "42"})
+
+    assert isinstance(env, MyEnv)
+    assert env.MY_INT == 42
+    assert env.MY_STR == "default"
+
+
+def test__env_loader__from_mapping__missing_key(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "only in os.environ")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+
+    with pytest.raises(ValueError):
+        MyEnv.from_mapping({})
+
+
+def test__env_loader__from_mapping__skips_singleton(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "environ value")
+
+    class MyEnv(typedenv.EnvLoader, singleton=True):
+        MY_KEY: str
+
+    env = MyEnv()
+    mapped = MyEnv.from_mapping({"MY_KEY": "mapped value"})
+
+    assert mapped is not env
+    assert mapped.MY_KEY == "mapped value"
+    assert MyEnv() is env
+
+
+def test__env_loader__from_env_file(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_STR", "only in os.environ")
+    path = tmp_path / ".env"
+    path.write_text('MY_INT=42\nexport MY_STR="from file"\nUNDECLARED=1\n')
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_INT: int
+        MY_STR: str
+
+    env = MyEnv.from_env_file(path)
+
+    assert env.MY_INT == 42
+    assert env.MY_STR == "from file"
+    assert not hasattr(env, "UNDECLARED")
+
+
+def test__env_loader__layered_sources(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FROM_ENVIRON", "environ")
+    (tmp_path / ".env.local").write_text("FROM_ENVIRON=local\nFROM_LOCAL=local\n")
+    (tmp_path / ".env").write_text("FROM_LOCAL=base\nFROM_BASE=base\n")
+
+    environ = typedenv.Environ()
+    local = typedenv.EnvFile(tmp_path / ".env.local")
+    base = typedenv.EnvFile(tmp_path / ".env")
+
+    class MyEnv(typedenv.EnvLoader, sources=[environ, local, base]):
+        FROM_ENVIRON: str
+        FROM_LOCAL: str
+        FROM_BASE: str
+        FROM_DEFAULT: str = "default"
+
+    env = MyEnv()
+
+    assert env.FROM_ENVIRON == "environ"
+    assert env.FROM_LOCAL == "local"
+    assert env.FROM_BASE == "base"
+    assert env.FROM_DEFAULT == "default"
+    assert typedenv.origins(env) == {
+        "FROM_ENVIRON": environ,
+        "FROM_LOCAL": local,
+        "FROM_BASE": base,
+        "FROM_DEFAULT": None,
+    }
+
+
+def test__env_loader__from_sources(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "environ")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+        OTHER_KEY: int
+
+    override = typedenv.MappingSource({"MY_KEY": "override"})
+    fallback = typedenv.MappingSource({"MY_KEY": "fallback", "OTHER_KEY": "3"})
+    env = MyEnv.from_sources([override, fallback])
+
+    assert env.MY_KEY == "override"
+    assert env.OTHER_KEY == 3
+    assert typedenv.origins(env) == {"MY_KEY": override, "OTHER_KEY": fallback}
+
+
+def test__env_loader__converter_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("HOSTS", "a,b,c")
+    monkeypatch.setenv("NOW", "ignored")
+    calls = []
+
+    def str_list(value: str) -> list[str]:
+        calls.append(value)
+        return value.split(",")
+
+    def impure(value: str) -> float:
+        calls.append(value)
+        return float(len(calls))
+
+    cache = typedenv.ConverterCache()
+
+    class Foo(typedenv.EnvLoader, cache=cache, converters=[typedenv.Converter(str_list)]):
+        HOSTS: list[str]
+        NOW: typing.Annotated[float, typedenv.Converter(impure, cacheable=False)]
+
+    class Bar(typedenv.EnvLoader, cache=cache, converters=[typedenv.Converter(str_list)]):
+        HOSTS: list[str]
+
+    assert Foo().HOSTS == ["a", "b", "c"]
+    assert Foo().HOSTS == ["a", "b", "c"]
+    assert Bar().HOSTS == ["a", "b", "c"]
+    assert calls == ["a,b,c", "ignored", "ignored"]
+    assert cache.cache_info().hits == 2
+    assert cache.cache_info().misses == 1
+
+
+def test__env_loader__converter_cache_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("HOSTS", "a,b,c")
+    calls = []
+
+    def str_list(value: str) -> list[str]:
+        calls.append(value)
+        return value.split(",")
+
+    class MyEnv(typedenv.EnvLoader, converters=[typedenv.Converter(str_list)]):
+        HOSTS: list[str]
+
+    MyEnv()
+    MyEnv()
+    assert calls == ["a,b,c", "a,b,c"]
+
+
+def test__env_loader__derived_converters(monkeypatch: pytest.MonkeyPatch):
+    class Mode(enum.Enum):
+        FAST = "fast"
+        SAFE = "safe"
+
+    Seconds = typing.NewType("Seconds", int)
+
+    monkeypatch.setenv("MODE", "safe")
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    monkeypatch.setenv("TIMEOUT", "30")
+    monkeypatch.setenv("MODES", "fast,safe")
+
+    class MyEnv(typedenv.EnvLoader):
+        MODE: Mode
+        LOG_LEVEL: typing.Literal["debug", "info"]
+        TIMEOUT: Seconds
+        MODES: frozenset[Mode]
+
+    env = MyEnv()
+    assert env.MODE is Mode.SAFE
+    assert env.LOG_LEVEL == "debug"
+    assert env.TIMEOUT == 30
+    assert env.MODES == {Mode.FAST, Mode.SAFE}
+
+
+def test__env_loader__literal_invalid_value(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("LOG_LEVEL", "trace")
+
+    class MyEnv(typedenv.EnvLoader):
+        LOG_LEVEL: typing.Literal["debug", "info"]
+
+    with pytest.raises(ValueError, match="trace"):
+        MyEnv()
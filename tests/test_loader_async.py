@@ -0,0 +1,156 @@
+import asyncio
+import typing
+
+import pytest
+
+import typedenv
+
+
+async def async_upper(value: str) -> str:
+    await asyncio.sleep(0)
+    return value.upper()
+
+
+async def async_int(value: str) -> int:
+    await asyncio.sleep(0)
+    return int(value)
+
+
+def test__env_loader__aload(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ASYNC_KEY", "value")
+    monkeypatch.setenv("SYNC_KEY", "1")
+
+    class MyEnv(typedenv.EnvLoader):
+        ASYNC_KEY: typing.Annotated[str, typedenv.Converter(async_upper)]
+        SYNC_KEY: int
+        OPTIONAL_KEY: typing.Annotated[str | None, typedenv.Converter(async_upper)]
+
+    env = asyncio.run(MyEnv.aload())
+
+    assert env.ASYNC_KEY == "VALUE"
+    assert env.SYNC_KEY == 1
+    assert env.OPTIONAL_KEY is None
+
+
+def test__env_loader__aload_class_converter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "12")
+
+    class MyEnv(typedenv.EnvLoader, converters=[typedenv.Converter(async_int)]):
+        MY_KEY: int
+
+    assert asyncio.run(MyEnv.aload()).MY_KEY == 12
+
+
+def test__env_loader__aload_incompatible_converter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "12")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: typing.Annotated[int, typedenv.Converter(async_upper)]
+
+    with pytest.raises(TypeError):
+        asyncio.run(MyEnv.aload())
+
+
+def test__env_loader__aload_concurrent(monkeypatch: pytest.MonkeyPatch):
+    num_keys = 10
+    running = 0
+    max_running = 0
+
+    async def tracked(value: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    annotations = {}
+    for i in range(num_keys):
+        monkeypatch.setenv(f"KEY_{i}", str(i))
+        annotations[f"KEY_{i}"] = typing.Annotated[str, typedenv.Converter(tracked)]
+
+    MyEnv: type[typedenv.EnvLoader] = type(
+        "MyEnv", (typedenv.EnvLoader,), {"__annotations__": annotations}
+    )
+
+    env = asyncio.run(MyEnv.aload())
+    assert [getattr(env, f"KEY_{i}") for i in range(num_keys)] == [
+        str(i) for i in range(num_keys)
+    ]
+    assert max_running == num_keys
+
+    max_running = 0
+    asyncio.run(MyEnv.aload(limit=3))
+    assert max_running == 3
+
+
+def test__env_loader__aload_first_error(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FIRST", "1")
+    monkeypatch.setenv("SECOND", "2")
+
+    async def fail_slow(value: str) -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("first")
+
+    async def fail_fast(value: str) -> int:
+        raise ValueError("second")
+
+    class MyEnv(typedenv.EnvLoader):
+        FIRST: typing.Annotated[str, typedenv.Converter(fail_slow)]
+        SECOND: typing.Annotated[int, typedenv.Converter(fail_fast)]
+
+    with pytest.raises(ValueError, match="first"):
+        asyncio.run(MyEnv.aload())
+
+
+def test__env_loader__aload_missing_key():
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(async_upper)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(MyEnv.aload())
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__sync_load_async_converter(
+    compiled: bool, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(async_upper)]
+
+    class DefaultEnv(typedenv.EnvLoader, compiled=compiled):
+        DEFAULT_KEY: typing.Annotated[str, typedenv.Converter(async_upper)] = "x"
+
+    with pytest.raises(TypeError):
+        MyEnv()
+
+    assert DefaultEnv().DEFAULT_KEY == "x"
+
+
+def test__env_loader__aload_singleton(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    class MyEnv(typedenv.EnvLoader, singleton=True):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(async_upper)]
+
+    async def load_many() -> list[MyEnv]:
+        return await asyncio.gather(*(MyEnv.aload() for _ in range(5)))
+
+    instances = asyncio.run(load_many())
+
+    assert all(instance is instances[0] for instance in instances)
+    assert asyncio.run(MyEnv.aload()) is instances[0]
+    assert MyEnv() is instances[0]
+
+
+def test__env_loader__aload_frozen(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(async_upper)]
+
+    env = asyncio.run(MyEnv.aload())
+    with pytest.raises(AttributeError):
+        env.MY_KEY = "new value"
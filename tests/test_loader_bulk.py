@@ -0,0 +1,136 @@
+import typing
+
+import pytest
+
+import typedenv
+
+CONVERT_CALLS: list[str] = []
+
+
+def counting_int(value: str) -> int:
+    CONVERT_CALLS.append(value)
+    return int(value)
+
+
+class TenantEnv(typedenv.EnvLoader):
+    TENANT_NAME: str
+    TENANT_LIMIT: int
+    TENANT_REGION: str | None = None
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CONVERT_CALLS.clear()
+
+
+def test__env_loader__load_many():
+    result = TenantEnv.load_many(
+        [
+            {"TENANT_NAME": "a", "TENANT_LIMIT": "1"},
+            {"TENANT_NAME": "b", "TENANT_LIMIT": "2", "TENANT_REGION": "eu"},
+        ]
+    )
+
+    assert result.errors == {}
+    first, second = result.instances
+    assert isinstance(first, TenantEnv)
+    assert isinstance(second, TenantEnv)
+    assert (first.TENANT_NAME, first.TENANT_LIMIT, first.TENANT_REGION) == ("a", 1, None)
+    assert (second.TENANT_NAME, second.TENANT_LIMIT, second.TENANT_REGION) == ("b", 2, "eu")
+    assert typedenv.origins(first) == {
+        "TENANT_NAME": first._env_sources[0],
+        "TENANT_LIMIT": first._env_sources[0],
+        "TENANT_REGION": None,
+    }
+
+    with pytest.raises(AttributeError):
+        first.TENANT_NAME = "other"
+
+
+def test__env_loader__load_many_collects_errors_per_mapping():
+    result = TenantEnv.load_many(
+        [
+            {"TENANT_NAME": "a", "TENANT_LIMIT": "1"},
+            {"TENANT_LIMIT": "not an int"},
+            {"TENANT_NAME": "c", "TENANT_LIMIT": "3"},
+        ]
+    )
+
+    assert result.instances[1] is None
+    assert result.column("TENANT_LIMIT") == [1, None, 3]
+    assert list(result.errors) == [1]
+    assert set(result.errors[1]) == {"TENANT_NAME", "TENANT_LIMIT"}
+    assert isinstance(result.errors[1]["TENANT_LIMIT"], ValueError)
+
+    with pytest.raises(ValueError, match="Mapping 1 failed to load TENANT_NAME"):
+        result.raise_errors()
+
+
+def test__env_loader__load_many_converts_one_key_at_a_time():
+    class CountingEnv(typedenv.EnvLoader):
+        FIRST_KEY: typing.Annotated[int, typedenv.Converter(counting_int)]
+        SECOND_KEY: typing.Annotated[int, typedenv.Converter(counting_int)]
+
+    CountingEnv.load_many(
+        [
+            {"FIRST_KEY": "1", "SECOND_KEY": "10"},
+            {"FIRST_KEY": "2", "SECOND_KEY": "20"},
+        ]
+    )
+    assert CONVERT_CALLS == ["1", "2", "10", "20"]
+
+
+def test__env_loader__load_many_lazy_and_slots():
+    class LazyEnv(typedenv.EnvLoader, lazy=True, slots=True):
+        COUNTED_KEY: typing.Annotated[int, typedenv.Converter(counting_int)]
+
+    result = LazyEnv.load_many([{"COUNTED_KEY": "1"}, {"COUNTED_KEY": "2"}])
+    assert CONVERT_CALLS == []
+    assert result.column("COUNTED_KEY") == [1, 2]
+    assert CONVERT_CALLS == ["1", "2"]
+
+
+def test__env_loader__load_many_eager_lazy_keys():
+    class LazyEnv(typedenv.EnvLoader, lazy=True):
+        COUNTED_KEY: typing.Annotated[int, typedenv.Converter(counting_int)]
+
+    mappings = [{"COUNTED_KEY": "1"}, {"COUNTED_KEY": "x"}]
+
+    # Lazy keys are not converted, so their errors go unnoticed by default
+    assert LazyEnv.load_many(mappings).errors == {}
+
+    result = LazyEnv.load_many(mappings, eager=True)
+    assert CONVERT_CALLS == ["1", "x"]
+    assert list(result.errors) == [1]
+    assert list(result.errors[1]) == ["COUNTED_KEY"]
+    assert result.column("COUNTED_KEY") == [1, None]
+
+
+def test__env_loader__load_many_nested_groups():
+    class DatabaseEnv(typedenv.EnvLoader):
+        HOST: str
+        PORT: int = 5432
+
+    class ServiceEnv(typedenv.EnvLoader):
+        DB: DatabaseEnv
+
+    result = ServiceEnv.load_many([{"DB_HOST": "a"}, {"DB_HOST": "b", "DB_PORT": "1"}])
+    assert [(db.HOST, db.PORT) for db in result.column("DB")] == [("a", 5432), ("b", 1)]
+
+
+def test__env_loader__load_many_singleton_is_not_cached(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TENANT_NAME", "env")
+
+    class SingletonEnv(typedenv.EnvLoader, singleton=True):
+        TENANT_NAME: str
+
+    (instance,) = SingletonEnv.load_many([{"TENANT_NAME": "mapped"}]).instances
+    assert SingletonEnv() is not instance
+    assert SingletonEnv().TENANT_NAME == "env"
+
+
+def test__env_loader__load_many_empty():
+    result = TenantEnv.load_many([])
+    assert result.instances == []
+    assert result.errors == {}
+    result.raise_errors()
@@ -0,0 +1,114 @@
+import array
+import typing
+
+import pytest
+
+import typedenv
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__collections(compiled: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("IDS", "1,2,3")
+    monkeypatch.setenv("HOSTS", "a.example.com, b.example.com")
+    monkeypatch.setenv("ALLOWED", "x,y,x")
+    monkeypatch.setenv("WEIGHTS", "0.5,1.5")
+    monkeypatch.setenv("LIMITS", "read=10,write=5")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        IDS: list[int]
+        HOSTS: list[str]
+        ALLOWED: frozenset[str]
+        WEIGHTS: tuple[float, ...]
+        LIMITS: dict[str, int]
+
+    env = MyEnv()
+    assert env.IDS == [1, 2, 3]
+    assert env.HOSTS == ["a.example.com", "b.example.com"]
+    assert env.ALLOWED == frozenset({"x", "y"})
+    assert env.WEIGHTS == (0.5, 1.5)
+    assert env.LIMITS == {"read": 10, "write": 5}
+
+
+def test__env_loader__collection_delimited(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PATHS", "/usr/bin:/bin")
+    monkeypatch.setenv("IDS", "1 2 3")
+
+    class MyEnv(typedenv.EnvLoader):
+        PATHS: typing.Annotated[list[str], typedenv.Delimited(":")]
+        IDS: typing.Annotated[array.array, typedenv.Delimited(" ", typecode="l")]
+
+    env = MyEnv()
+    assert env.PATHS == ["/usr/bin", "/bin"]
+    assert env.IDS == array.array("l", [1, 2, 3])
+
+
+def test__env_loader__collection_item_converters(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("WORDS", "hello, world")
+
+    def shout(value: str) -> bytes:
+        return value.upper().encode()
+
+    class MyEnv(typedenv.EnvLoader, converters=[typedenv.Converter(shout)]):
+        WORDS: set[bytes]
+
+    assert MyEnv().WORDS == {b"HELLO", b"WORLD"}
+
+
+def test__env_loader__collection_defaults():
+    class MyEnv(typedenv.EnvLoader):
+        IDS: list[int] | None
+        NAMES: tuple[str, ...] = ("a",)
+
+    env = MyEnv()
+    assert env.IDS is None
+    assert env.NAMES == ("a",)
+
+
+def test__env_loader__collection_bespoke_converter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CHARS", "abc")
+
+    def char_list(value: str) -> list[str]:
+        return list(value)
+
+    class MyEnv(typedenv.EnvLoader):
+        CHARS: typing.Annotated[list[str], typedenv.Converter(char_list)]
+
+    assert MyEnv().CHARS == ["a", "b", "c"]
+
+
+def test__env_loader__mutable_collections_not_cached(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("IDS", "1,2")
+    monkeypatch.setenv("FROZEN_IDS", "1,2")
+
+    class MyEnv(typedenv.EnvLoader, cache=typedenv.ConverterCache()):
+        IDS: list[int]
+        FROZEN_IDS: frozenset[int]
+
+    first, second = MyEnv(), MyEnv()
+    assert first.IDS == second.IDS
+    assert first.IDS is not second.IDS
+    assert first.FROZEN_IDS is second.FROZEN_IDS
+
+
+def test__env_loader__uncacheable_items_not_cached(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TAGS", "a,b")
+    monkeypatch.setenv("TAG_PAIR", "a,b")
+    counter = iter(range(100))
+
+    class Tag(str):
+        pass
+
+    def tag(value: str) -> Tag:
+        return Tag(f"{value}-{next(counter)}")
+
+    class MyEnv(
+        typedenv.EnvLoader,
+        cache=typedenv.ConverterCache(),
+        converters=[typedenv.Converter(tag, cacheable=False)],
+    ):
+        TAGS: frozenset[Tag]
+        TAG_PAIR: tuple[Tag, ...]
+
+    first, second = MyEnv(), MyEnv()
+    assert first.TAGS != second.TAGS
+    assert first.TAG_PAIR != second.TAG_PAIR
@@ -0,0 +1,109 @@
+import typing
+
+import pytest
+
+import typedenv
+
+
+def str_append_foo(value: str) -> str:
+    return value + "foo"
+
+
+def test__env_loader__compiled__primitive_types(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_STR", "string")
+    monkeypatch.setenv("MY_INT", "1")
+    monkeypatch.setenv("MY_FLOAT", "1.5")
+    monkeypatch.setenv("MY_BOOL", "false")
+
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_STR: str
+        MY_INT: int
+        MY_FLOAT: float
+        MY_BOOL: bool
+
+    env = MyEnv()
+    assert env.MY_STR == "string"
+    assert env.MY_INT == 1
+    assert env.MY_FLOAT == 1.5
+    assert env.MY_BOOL is False
+    assert env._env_keys == {"MY_STR", "MY_INT", "MY_FLOAT", "MY_BOOL"}
+
+
+def test__env_loader__compiled__annotated(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "string")
+
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(str_append_foo)]
+
+    assert MyEnv().MY_KEY == "stringfoo"
+
+
+def test__env_loader__compiled__defaults():
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_INT: int = 1
+        MY_STR: str | None
+        MY_LIST: typing.Annotated[
+            str | None, typedenv.Converter(str_append_foo)
+        ] = "default"
+
+    env = MyEnv()
+    assert env.MY_INT == 1
+    assert env.MY_STR is None
+    assert env.MY_LIST == "default"
+
+
+def test__env_loader__compiled__missing_key():
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_KEY: str
+
+    with pytest.raises(ValueError, match="MY_KEY"):
+        MyEnv()
+
+
+def test__env_loader__compiled__none_default():
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_KEY: int = None  # type: ignore
+
+    with pytest.raises(ValueError, match="Cannot set MY_KEY to None"):
+        MyEnv()
+
+
+def test__env_loader__compiled__incompatible_type(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "string that cannot be cast")
+
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_KEY: int
+
+    with pytest.raises(ValueError):
+        MyEnv()
+
+
+def test__env_loader__compiled__frozen(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "env value")
+
+    class MyEnv(typedenv.EnvLoader, compiled=True):
+        MY_KEY: str
+
+    env = MyEnv()
+    env.regular_attr = "new value"
+
+    with pytest.raises(AttributeError):
+        env.MY_KEY = "new value"
+
+
+def test__env_loader__compiled__inheritance(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BASE_KEY", "base")
+
+    class Base(typedenv.EnvLoader, compiled=True):
+        BASE_KEY: str
+
+    class Child(Base, compiled=True):
+        CHILD_KEY: int = 3
+
+    base = Base()
+    child = Child()
+
+    assert base.BASE_KEY == "base"
+    assert not hasattr(base, "CHILD_KEY")
+    assert child.BASE_KEY == "base"
+    assert child.CHILD_KEY == 3
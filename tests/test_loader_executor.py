@@ -0,0 +1,132 @@
+import concurrent.futures
+import threading
+import time
+import typing
+
+import pytest
+
+import typedenv
+
+
+@pytest.fixture
+def executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def test__env_loader__executor_parallel(
+    executor: concurrent.futures.Executor, monkeypatch: pytest.MonkeyPatch
+):
+    barrier = threading.Barrier(4, timeout=5)
+
+    def blocking_upper(value: str) -> str:
+        # Only completes if all four conversions run at the same time
+        barrier.wait()
+        return value.upper()
+
+    for key in ("FIRST", "SECOND", "THIRD", "FOURTH"):
+        monkeypatch.setenv(key, key.lower())
+    monkeypatch.setenv("INLINE", "5")
+
+    class MyEnv(
+        typedenv.EnvLoader,
+        executor=executor,
+        converters=[typedenv.Converter(blocking_upper)],
+    ):
+        FIRST: str
+        SECOND: str
+        THIRD: str
+        FOURTH: str
+        INLINE: int
+
+    env = MyEnv()
+
+    assert (env.FIRST, env.SECOND, env.THIRD, env.FOURTH) == (
+        "FIRST",
+        "SECOND",
+        "THIRD",
+        "FOURTH",
+    )
+    assert env.INLINE == 5
+
+
+def test__env_loader__executor_first_error(
+    executor: concurrent.futures.Executor, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FIRST", "1")
+    monkeypatch.setenv("SECOND", "2")
+
+    def fail_slow(value: str) -> str:
+        time.sleep(0.05)
+        raise ValueError("first")
+
+    def fail_fast(value: str) -> int:
+        raise ValueError("second")
+
+    class MyEnv(typedenv.EnvLoader, executor=executor):
+        FIRST: typing.Annotated[str, typedenv.Converter(fail_slow)]
+        SECOND: typing.Annotated[int, typedenv.Converter(fail_fast)]
+
+    with pytest.raises(ValueError, match="first"):
+        MyEnv()
+
+
+def test__env_loader__executor_defaults(executor: concurrent.futures.Executor):
+    def never_called(value: str) -> str:
+        raise AssertionError("should not be called")
+
+    class MyEnv(typedenv.EnvLoader, executor=executor):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(never_called)] = "default"
+        OPTIONAL_KEY: typing.Annotated[str | None, typedenv.Converter(never_called)]
+
+    env = MyEnv()
+
+    assert env.MY_KEY == "default"
+    assert env.OPTIONAL_KEY is None
+
+
+def test__env_loader__executor_frozen(
+    executor: concurrent.futures.Executor, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    def upper(value: str) -> str:
+        return value.upper()
+
+    class MyEnv(typedenv.EnvLoader, executor=executor, compiled=True):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(upper)]
+
+    env = MyEnv()
+
+    assert env.MY_KEY == "VALUE"
+    with pytest.raises(AttributeError):
+        env.MY_KEY = "new value"
+
+
+def test__env_loader__executor_nested_group():
+    def upper(value: str) -> str:
+        return value.upper()
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    class DatabaseEnv(typedenv.EnvLoader, executor=executor):
+        HOST: typing.Annotated[str, typedenv.Converter(upper)]
+
+    class MyEnv(typedenv.EnvLoader, executor=executor):
+        DB: DatabaseEnv
+
+    # The nested load submits to the executor itself, so it must not run on
+    # the only worker of that executor
+    loads: list[MyEnv] = []
+    thread = threading.Thread(
+        target=lambda: loads.append(MyEnv.from_mapping({"DB_HOST": "host"})),
+        daemon=True,
+    )
+    try:
+        thread.start()
+        thread.join(timeout=5)
+    finally:
+        executor.shutdown(wait=False)
+
+    assert not thread.is_alive()
+    assert loads[0].DB.HOST == "HOST"
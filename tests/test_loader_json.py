@@ -0,0 +1,183 @@
+import dataclasses
+import pickle
+import typing
+
+import pytest
+
+import typedenv
+from typedenv.converters import JSON_CACHE, FrozenDict, JsonConverter
+
+
+@dataclasses.dataclass(frozen=True)
+class Route:
+    path: str
+    weight: float = 1.0
+
+
+class Feature(typing.TypedDict):
+    name: str
+    enabled: bool
+
+
+class PickledJsonEnv(typedenv.EnvLoader):
+    ROUTES: typedenv.Json[dict[str, typing.Any]]
+    FEATURE: typedenv.Json[Feature]
+
+
+@pytest.fixture(autouse=True)
+def clear_json_cache():
+    JSON_CACHE.cache_clear()
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__json(compiled: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ROUTES", '{"a": [1, 2], "b": []}')
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        ROUTES: typedenv.Json[dict[str, list[int]]]
+
+    env = MyEnv()
+    assert "ROUTES" not in env.__dict__
+    assert JSON_CACHE.cache_info().misses == 0
+
+    assert env.ROUTES == {"a": (1, 2), "b": ()}
+    assert isinstance(env.ROUTES, FrozenDict)
+    with pytest.raises(TypeError):
+        env.ROUTES["c"] = ()  # type: ignore[index]
+
+
+def test__env_loader__json_pickle(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ROUTES", '{"a": [1, 2], "b": {"c": []}}')
+    monkeypatch.setenv("FEATURE", '{"name": "x", "enabled": true}')
+
+    restored = pickle.loads(pickle.dumps(PickledJsonEnv()))
+    assert restored.ROUTES == {"a": (1, 2), "b": {"c": ()}}
+    assert restored.FEATURE == {"name": "x", "enabled": True}
+    assert isinstance(restored.ROUTES, FrozenDict)
+    assert isinstance(restored.ROUTES["b"], FrozenDict)
+    with pytest.raises(TypeError):
+        restored.ROUTES["c"] = ()  # type: ignore[index]
+    with pytest.raises(TypeError):
+        restored.FEATURE.update(name="y")
+
+
+def test__env_loader__json_shared_between_classes(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ROUTES", '{"a": 1}')
+
+    class FirstEnv(typedenv.EnvLoader):
+        ROUTES: typedenv.Json[dict[str, int]]
+
+    class SecondEnv(typedenv.EnvLoader):
+        ROUTES: typedenv.Json[dict[str, int]]
+
+    first = FirstEnv().ROUTES
+    assert FirstEnv().ROUTES is first
+    assert SecondEnv().ROUTES is first
+    assert JSON_CACHE.cache_info().misses == 1
+
+
+def test__env_loader__json_eager(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FEATURES", "[not json")
+
+    class MyEnv(typedenv.EnvLoader):
+        FEATURES: typing.Annotated[typedenv.Json[list[str]], typedenv.Lazy(False)]
+
+    with pytest.raises(ValueError):
+        MyEnv()
+
+
+def test__env_loader__json_dataclass(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ROUTES", '[{"path": "/a"}, {"path": "/b", "weight": 2}]')
+    monkeypatch.setenv("FEATURE", '{"name": "beta", "enabled": true}')
+
+    class MyEnv(typedenv.EnvLoader):
+        ROUTES: typedenv.Json[tuple[Route, ...]]
+        FEATURE: typedenv.Json[Feature]
+
+    env = MyEnv()
+    assert env.ROUTES == (Route("/a"), Route("/b", 2.0))
+    assert env.FEATURE == {"name": "beta", "enabled": True}
+
+
+def test__env_loader__json_invalid_value(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FEATURE", '{"name": "beta"}')
+
+    class MyEnv(typedenv.EnvLoader):
+        FEATURE: typedenv.Json[Feature]
+
+    env = MyEnv()
+    with pytest.raises(ValueError, match="missing keys"):
+        env.FEATURE
+
+
+def test__env_loader__json_optional(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SET_KEY", "null")
+
+    class MyEnv(typedenv.EnvLoader):
+        SET_KEY: typedenv.Json[dict[str, int] | None]
+        UNSET_KEY: typedenv.Json[dict[str, int] | None]
+
+    env = MyEnv()
+    assert env.SET_KEY is None
+    assert env.UNSET_KEY is None
+
+
+def test__env_loader__json_nullable_outside(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SET_KEY", '{"a": 1}')
+
+    def to_int(value: str) -> int:
+        return int(value)
+
+    class MyEnv(typedenv.EnvLoader):
+        SET_KEY: typedenv.Json[dict[str, int]] | None
+        UNSET_KEY: typedenv.Json[dict[str, int]] | None
+        CONVERTED_KEY: typing.Annotated[int, typedenv.Converter(to_int)] | None
+
+    env = MyEnv()
+    assert env.SET_KEY == {"a": 1}
+    assert env.UNSET_KEY is None
+    assert env.CONVERTED_KEY is None
+    assert typedenv.fields(MyEnv)[0].nullable
+
+
+@pytest.mark.parametrize(
+    "type_, value, expected",
+    [
+        (int, "1", 1),
+        (float, "1", 1.0),
+        (typing.Any, '{"a": [1]}', {"a": (1,)}),
+        (list[int | str], '[1, "a"]', (1, "a")),
+        (tuple[int, str], '[1, "a"]', (1, "a")),
+        (typing.Mapping[str, bool], '{"a": false}', {"a": False}),
+    ],
+)
+def test__json_converter(type_, value: str, expected):
+    assert JsonConverter(type_)(value) == expected
+
+
+@pytest.mark.parametrize(
+    "type_, value",
+    [
+        (int, "true"),
+        (int, "1.5"),
+        (str, "1"),
+        (list[int], '{"a": 1}'),
+        (tuple[int, str], "[1]"),
+        (Route, '{"path": "/", "other": 1}'),
+        (Route, "{}"),
+    ],
+)
+def test__json_converter__invalid(type_, value: str):
+    with pytest.raises(ValueError):
+        JsonConverter(type_)(value)
+
+
+@dataclasses.dataclass
+class MutableRoute:
+    path: str
+
+
+@pytest.mark.parametrize("type_", [bytes, dict[int, str], MutableRoute, list[set[int]]])
+def test__json_converter__unsupported_type(type_):
+    with pytest.raises(TypeError):
+        JsonConverter(type_)
@@ -0,0 +1,142 @@
+import typing
+
+import pytest
+
+import typedenv
+
+
+@pytest.fixture
+def calls() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def counting_int(calls: list[str]) -> typedenv.Converter:
+    def convert(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    return typedenv.Converter(convert)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__lazy_class(
+    compiled: bool,
+    calls: list[str],
+    counting_int: typedenv.Converter,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("MY_KEY", "42")
+
+    class MyEnv(typedenv.EnvLoader, lazy=True, compiled=compiled):
+        MY_KEY: typing.Annotated[int, counting_int]
+
+    env = MyEnv()
+    assert calls == []
+
+    assert env.MY_KEY == 42
+    assert env.MY_KEY == 42
+    assert calls == ["42"]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__lazy_annotated(
+    compiled: bool,
+    calls: list[str],
+    counting_int: typedenv.Converter,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("LAZY_KEY", "1")
+    monkeypatch.setenv("EAGER_KEY", "2")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        LAZY_KEY: typing.Annotated[int, counting_int, typedenv.Lazy]
+        EAGER_KEY: typing.Annotated[int, counting_int]
+
+    env = MyEnv()
+    assert calls == ["2"]
+
+    assert env.LAZY_KEY == 1
+    assert calls == ["2", "1"]
+
+
+def test__env_loader__lazy_opt_out(
+    calls: list[str], counting_int: typedenv.Converter, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("MY_KEY", "1")
+
+    class MyEnv(typedenv.EnvLoader, lazy=True):
+        MY_KEY: typing.Annotated[int, counting_int, typedenv.Lazy(False)]
+
+    MyEnv()
+    assert calls == ["1"]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__lazy_missing_key(compiled: bool):
+    class MyEnv(typedenv.EnvLoader, lazy=True, compiled=compiled):
+        MY_KEY: int
+
+    with pytest.raises(ValueError):
+        MyEnv()
+
+
+def test__env_loader__lazy_default(calls: list[str], counting_int: typedenv.Converter):
+    class MyEnv(typedenv.EnvLoader, lazy=True):
+        MY_KEY: typing.Annotated[int, counting_int] = 3
+        OPTIONAL_KEY: typing.Annotated[int | None, counting_int]
+
+    env = MyEnv()
+
+    assert env.MY_KEY == 3
+    assert env.OPTIONAL_KEY is None
+    assert MyEnv.MY_KEY == 3
+    assert calls == []
+
+
+def test__env_loader__lazy_conversion_error(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "not an int")
+
+    class MyEnv(typedenv.EnvLoader, lazy=True):
+        MY_KEY: int
+
+    env = MyEnv()
+    with pytest.raises(ValueError):
+        env.MY_KEY
+
+
+def test__env_loader__lazy_frozen(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "1")
+
+    class MyEnv(typedenv.EnvLoader, lazy=True):
+        MY_KEY: int
+
+    class MutableEnv(typedenv.EnvLoader, lazy=True, frozen=False):
+        MY_KEY: int
+
+    with pytest.raises(AttributeError):
+        MyEnv().MY_KEY = 2
+
+    env = MutableEnv()
+    env.MY_KEY = 2
+    assert env.MY_KEY == 2
+
+
+def test__env_loader__lazy_inheritance(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "1")
+
+    class Base(typedenv.EnvLoader, lazy=True):
+        MY_KEY: int
+        OTHER_KEY: int = 5
+
+    class Child(Base):
+        OTHER_KEY: int
+
+    base = Base()
+    child = Child()
+
+    assert base.MY_KEY == 1
+    assert base.OTHER_KEY == 5
+    assert child.MY_KEY == 1
+    assert child.OTHER_KEY == 5
+    assert "MY_KEY" in child.__dict__
@@ -0,0 +1,151 @@
+import pickle
+import typing
+
+import pytest
+
+import typedenv
+from typedenv.loader import _SINGLETONS
+
+
+class DatabaseEnv(typedenv.EnvLoader):
+    HOST: str
+    PORT: int = 5432
+
+
+class SingletonDatabaseEnv(typedenv.EnvLoader, singleton=True):
+    HOST: str
+
+
+class PickledEnv(typedenv.EnvLoader):
+    DB: DatabaseEnv
+    CACHE: SingletonDatabaseEnv
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__nested(compiled: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("DB_HOST", "db.example.com")
+    monkeypatch.setenv("CACHE_HOST", "cache.example.com")
+    monkeypatch.setenv("CACHE_PORT", "6379")
+    monkeypatch.setenv("HOST", "ignored")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        DB: typing.Annotated[DatabaseEnv, typedenv.Prefix("DB_")]
+        CACHE: DatabaseEnv
+
+    env = MyEnv()
+    assert isinstance(env.DB, DatabaseEnv)
+    assert env.DB.HOST == "db.example.com"
+    assert env.DB.PORT == 5432
+    assert env.CACHE.HOST == "cache.example.com"
+    assert env.CACHE.PORT == 6379
+
+
+def test__env_loader__nested_reuses_plan(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("A_HOST", "a")
+    monkeypatch.setenv("B_HOST", "b")
+
+    class GroupEnv(typedenv.EnvLoader):
+        HOST: str
+
+    class MyEnv(typedenv.EnvLoader):
+        A: GroupEnv
+        B: GroupEnv
+
+    MyEnv()
+    plan = GroupEnv.__dict__["__env_fields__"]
+
+    env = MyEnv()
+    assert GroupEnv.__dict__["__env_fields__"] is plan
+    assert (env.A.HOST, env.B.HOST) == ("a", "b")
+
+
+def test__env_loader__nested_deeply(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("APP_PRIMARY_HOST", "primary")
+
+    class ClusterEnv(typedenv.EnvLoader):
+        PRIMARY: DatabaseEnv
+        REPLICA: DatabaseEnv | None
+
+    class MyEnv(typedenv.EnvLoader):
+        APP: ClusterEnv
+
+    env = MyEnv()
+    assert env.APP.PRIMARY.HOST == "primary"
+    assert env.APP.REPLICA is None
+
+
+def test__env_loader__nested_missing_key():
+    class MyEnv(typedenv.EnvLoader):
+        DB: DatabaseEnv
+
+    with pytest.raises(ValueError, match="HOST.*'DB_'"):
+        MyEnv()
+
+
+def test__env_loader__nested_all_defaults():
+    class DefaultsEnv(typedenv.EnvLoader):
+        PORT: int = 80
+
+    class MyEnv(typedenv.EnvLoader):
+        WEB: DefaultsEnv
+        ADMIN: DefaultsEnv | None
+
+    env = MyEnv()
+    assert env.WEB.PORT == 80
+    assert env.ADMIN is None
+
+
+def test__env_loader__nested_reload(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("DB_HOST", "old")
+
+    class MyEnv(typedenv.EnvLoader):
+        DB: DatabaseEnv
+
+    env = MyEnv()
+    assert env.reload() == frozenset()
+
+    monkeypatch.setenv("DB_PORT", "1")
+    assert env.reload() == {"DB"}
+    assert env.DB.HOST == "old"
+    assert env.DB.PORT == 1
+
+
+def test__env_loader__nested_from_mapping():
+    class MyEnv(typedenv.EnvLoader):
+        DB: DatabaseEnv
+
+    env = MyEnv.from_mapping({"DB_HOST": "mapped"})
+    assert env.DB.HOST == "mapped"
+
+
+def test__env_loader__prefix_requires_loader_type():
+    class MyEnv(typedenv.EnvLoader):
+        DB: typing.Annotated[str, typedenv.Prefix("DB_")]
+
+    with pytest.raises(TypeError):
+        MyEnv()
+
+
+def test__env_loader__nested_pickle(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("HOST", "singleton")
+    monkeypatch.setenv("DB_HOST", "db")
+    monkeypatch.setenv("CACHE_HOST", "cache")
+
+    singleton = SingletonDatabaseEnv()
+    try:
+        env = PickledEnv()
+        restored = pickle.loads(pickle.dumps(env))
+
+        assert type(restored) is PickledEnv
+        assert (restored.DB.HOST, restored.DB.PORT) == ("db", 5432)
+        assert restored.CACHE.HOST == "cache"
+        assert typedenv.origins(restored.DB)["HOST"] is restored.DB._env_sources[0]
+        assert typedenv.origins(restored.DB)["PORT"] is None
+        with pytest.raises(AttributeError):
+            restored.DB.HOST = "other"
+
+        # Unpickling a nested singleton class leaves its singleton alone
+        assert SingletonDatabaseEnv() is singleton
+        assert singleton.HOST == "singleton"
+    finally:
+        _SINGLETONS.pop(SingletonDatabaseEnv, None)
@@ -0,0 +1,150 @@
+import typing
+
+import pytest
+
+import typedenv
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__reload_changed_keys(
+    compiled: bool, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("CHANGED", "1")
+    monkeypatch.setenv("UNCHANGED", "a,b")
+    calls = []
+
+    def str_list(value: str) -> list[str]:
+        calls.append(value)
+        return value.split(",")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        CHANGED: int
+        UNCHANGED: typing.Annotated[list[str], typedenv.Converter(str_list)]
+        OPTIONAL: str | None
+
+    env = MyEnv()
+    unchanged = env.UNCHANGED
+
+    monkeypatch.setenv("CHANGED", "2")
+    monkeypatch.setenv("OPTIONAL", "set")
+
+    assert env.reload() == {"CHANGED", "OPTIONAL"}
+    assert env.CHANGED == 2
+    assert env.OPTIONAL == "set"
+    assert env.UNCHANGED is unchanged
+    assert calls == ["a,b"]
+    assert env.reload() == frozenset()
+
+
+def test__env_loader__reload_failure_keeps_values(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FIRST", "1")
+    monkeypatch.setenv("SECOND", "2")
+
+    class MyEnv(typedenv.EnvLoader):
+        FIRST: int
+        SECOND: int
+
+    env = MyEnv()
+    monkeypatch.setenv("FIRST", "3")
+    monkeypatch.setenv("SECOND", "not an int")
+
+    with pytest.raises(ValueError):
+        env.reload()
+
+    assert env.FIRST == 1
+    assert env.SECOND == 2
+
+    monkeypatch.delenv("SECOND")
+    with pytest.raises(ValueError):
+        env.reload()
+
+
+def test__env_loader__reload_singleton(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "before")
+
+    class MyEnv(typedenv.EnvLoader, singleton=True):
+        MY_KEY: str
+
+    MyEnv()
+    monkeypatch.setenv("MY_KEY", "after")
+    MyEnv().reload()
+
+    assert MyEnv().MY_KEY == "after"
+
+
+def test__env_loader__reload_frozen(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "before")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+
+    env = MyEnv()
+    monkeypatch.setenv("MY_KEY", "after")
+    env.reload()
+
+    assert env.MY_KEY == "after"
+    with pytest.raises(AttributeError):
+        env.MY_KEY = "new value"
+
+
+def test__env_loader__reload_lazy(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "1")
+
+    class MyEnv(typedenv.EnvLoader, lazy=True):
+        MY_KEY: int
+
+    env = MyEnv()
+    assert env.MY_KEY == 1
+
+    monkeypatch.setenv("MY_KEY", "2")
+    env.reload()
+    assert env.MY_KEY == 2
+
+
+def test__env_loader__reload_callbacks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "before")
+    received = []
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+        OTHER_KEY: str = "default"
+
+    env = MyEnv()
+    env.on_reload(lambda instance, changed: received.append((instance, changed)))
+
+    env.reload()
+    monkeypatch.setenv("MY_KEY", "after")
+    env.reload()
+
+    assert received == [(env, {"MY_KEY"})]
+
+
+def test__env_loader__reload_env_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("MY_KEY=before\n")
+
+    class MyEnv(typedenv.EnvLoader, sources=[typedenv.EnvFile(path)]):
+        MY_KEY: str
+
+    env = MyEnv()
+    path.write_text("MY_KEY=after\n")
+
+    assert env.reload() == {"MY_KEY"}
+    assert env.MY_KEY == "after"
+
+
+def test__env_loader__reload_secret_files(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    secret = tmp_path / "password"
+    secret.write_text("first\n")
+    monkeypatch.setenv("DB_PASSWORD_FILE", str(secret))
+
+    class MyEnv(typedenv.EnvLoader, sources=[typedenv.SecretFiles()]):
+        DB_PASSWORD: str
+
+    env = MyEnv()
+    assert env.DB_PASSWORD == "first"
+    assert env.reload() == frozenset()
+
+    secret.write_text("rotated\n")
+    assert env.reload() == {"DB_PASSWORD"}
+    assert env.DB_PASSWORD == "rotated"
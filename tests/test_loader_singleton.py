@@ -0,0 +1,261 @@
+import asyncio
+import os
+import threading
+import time
+import typing
+
+import pytest
+
+import typedenv
+from typedenv import profiling
+from typedenv.converters import JSON_CACHE
+
+
+def test__env_loader__singleton_concurrent_load(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+    num_threads = 32
+    calls = []
+
+    def slow_str(value: str) -> str:
+        calls.append(value)
+        time.sleep(0.01)
+        return value
+
+    class MyEnv(typedenv.EnvLoader, singleton=True):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(slow_str)]
+
+    barrier = threading.Barrier(num_threads)
+    instances = []
+
+    def load() -> None:
+        barrier.wait()
+        for _ in range(100):
+            instances.append(MyEnv())
+
+    threads = [threading.Thread(target=load) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["value"]
+    assert len(instances) == num_threads * 100
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test__env_loader__singleton_failed_load_retries(monkeypatch: pytest.MonkeyPatch):
+    class MyEnv(typedenv.EnvLoader, singleton=True):
+        MY_KEY: str
+
+    with pytest.raises(ValueError):
+        MyEnv()
+
+    monkeypatch.setenv("MY_KEY", "value")
+    assert MyEnv() is MyEnv()
+
+
+def test__env_loader__invalid_on_fork():
+    with pytest.raises(ValueError):
+
+        class MyEnv(typedenv.EnvLoader, singleton=True, on_fork="invalid"):  # type: ignore
+            MY_KEY: str
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.parametrize(
+    ["on_fork", "expected"],
+    [pytest.param("keep", "before", id="keep"), pytest.param("reset", "after", id="reset")],
+)
+def test__env_loader__singleton_on_fork(
+    on_fork: str, expected: str, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("MY_KEY", "before")
+
+    class MyEnv(typedenv.EnvLoader, singleton=True, on_fork=on_fork):  # type: ignore
+        MY_KEY: str
+
+    MyEnv()
+    monkeypatch.setenv("MY_KEY", "after")
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, MyEnv().MY_KEY.encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as pipe:
+        assert pipe.read() == expected
+
+    assert MyEnv().MY_KEY == "before"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test__env_loader__fork_replaces_held_locks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+    monkeypatch.setenv("MY_JSON", "[1]")
+    cache = typedenv.ConverterCache()
+
+    def upper(value: str) -> str:
+        return value.upper()
+
+    class MyEnv(typedenv.EnvLoader, cache=cache):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(upper)]
+        MY_JSON: typing.Annotated[typedenv.Json[list[int]], typedenv.Lazy(False)]
+
+    # Locks held by another thread at the time of the fork
+    locks = [cache._lock, JSON_CACHE._lock, profiling._LOCK]
+    for lock in locks:
+        lock.acquire()
+
+    profiling.enable()
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                env = MyEnv()
+                os.write(write_fd, f"{env.MY_KEY},{env.MY_JSON}".encode())
+            finally:
+                os._exit(0)
+    finally:
+        profiling.disable()
+        for lock in locks:
+            lock.release()
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as pipe:
+        assert pipe.read() == "VALUE,(1,)"
+
+
+@pytest.mark.parametrize("ttl", [0, -1])
+def test__env_loader__invalid_ttl(ttl: float):
+    with pytest.raises(ValueError):
+
+        class MyEnv(typedenv.EnvLoader, singleton=True, ttl=ttl):
+            MY_KEY: str
+
+
+def test__env_loader__ttl_requires_singleton():
+    with pytest.raises(ValueError):
+
+        class MyEnv(typedenv.EnvLoader, ttl=60):
+            MY_KEY: str
+
+
+def test__env_loader__singleton_ttl_refresh(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "before")
+
+    class MyEnv(typedenv.EnvLoader, singleton=True, ttl=0.05):
+        MY_KEY: str
+
+    first = MyEnv()
+    monkeypatch.setenv("MY_KEY", "after")
+    assert MyEnv() is first
+
+    time.sleep(0.06)
+    refreshed = MyEnv()
+    assert refreshed is not first
+    assert refreshed.MY_KEY == "after"
+    assert first.MY_KEY == "before"
+    assert MyEnv() is refreshed
+
+
+def test__env_loader__singleton_ttl_single_refresher(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+    refreshing = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def blocking_str(value: str) -> str:
+        calls.append(value)
+        if len(calls) > 1:
+            refreshing.set()
+            release.wait(5)
+        return value
+
+    class MyEnv(typedenv.EnvLoader, singleton=True, ttl=0.01):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(blocking_str)]
+
+    stale = MyEnv()
+    time.sleep(0.02)
+
+    refreshed = []
+    refresher = threading.Thread(target=lambda: refreshed.append(MyEnv()))
+    refresher.start()
+    assert refreshing.wait(5)
+
+    # Other callers are served the stale instance while it refreshes
+    assert all(MyEnv() is stale for _ in range(10))
+    release.set()
+    refresher.join()
+
+    assert len(calls) == 2
+    assert refreshed[0] is not stale
+    assert MyEnv() is refreshed[0]
+
+
+def test__env_loader__singleton_ttl_refresh_error(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "1")
+    errors: list[Exception] = []
+
+    class MyEnv(
+        typedenv.EnvLoader, singleton=True, ttl=0.05, on_refresh_error=errors.append
+    ):
+        MY_KEY: int
+
+    good = MyEnv()
+    monkeypatch.setenv("MY_KEY", "invalid")
+    time.sleep(0.06)
+
+    assert MyEnv() is good
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+
+    # The failed refresh is not retried until the ttl expires again
+    assert MyEnv() is good
+    assert len(errors) == 1
+
+    monkeypatch.setenv("MY_KEY", "2")
+    time.sleep(0.06)
+    assert MyEnv().MY_KEY == 2
+
+
+def test__env_loader__singleton_ttl_refresh_error_is_logged(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    monkeypatch.setenv("MY_KEY", "1")
+
+    class MyEnv(typedenv.EnvLoader, singleton=True, ttl=0.05):
+        MY_KEY: int
+
+    good = MyEnv()
+    monkeypatch.setenv("MY_KEY", "invalid")
+    time.sleep(0.06)
+
+    with caplog.at_level("ERROR", logger="typedenv"):
+        assert MyEnv() is good
+    assert "Failed to refresh MyEnv" in caplog.text
+
+
+def test__env_loader__singleton_ttl_aload(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "before")
+
+    async def convert(value: str) -> str:
+        return value
+
+    class MyEnv(typedenv.EnvLoader, singleton=True, ttl=0.05):
+        MY_KEY: typing.Annotated[str, typedenv.Converter(convert)]
+
+    first = asyncio.run(MyEnv.aload())
+    monkeypatch.setenv("MY_KEY", "after")
+    assert asyncio.run(MyEnv.aload()) is first
+
+    time.sleep(0.06)
+    refreshed = asyncio.run(MyEnv.aload())
+    assert refreshed.MY_KEY == "after"
+    assert asyncio.run(MyEnv.aload()) is refreshed
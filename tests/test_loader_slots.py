@@ -0,0 +1,186 @@
+import asyncio
+import pickle
+import typing
+
+import pytest
+
+import typedenv
+
+
+class PickledEnv(typedenv.EnvLoader, slots=True):
+    STR_KEY: str
+    INT_KEY: int
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("STR_KEY", "value")
+    monkeypatch.setenv("INT_KEY", "1")
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__slots_instance(compiled: bool):
+    class MyEnv(typedenv.EnvLoader, slots=True, compiled=compiled):
+        STR_KEY: str
+        INT_KEY: int
+        OPTIONAL_KEY: str | None
+        DEFAULT_KEY: int = 5
+
+    env = MyEnv()
+    assert isinstance(env, MyEnv)
+    assert type(env) is not MyEnv
+    assert type(env).__name__ == "MyEnv"
+    assert type(env).__qualname__ == MyEnv.__qualname__
+    assert env.STR_KEY == "value"
+    assert env.INT_KEY == 1
+    assert env.OPTIONAL_KEY is None
+    assert env.DEFAULT_KEY == 5
+    assert MyEnv.DEFAULT_KEY == 5
+
+    # Values live in slots, and the key set is shared by every instance
+    assert "STR_KEY" not in getattr(env, "__dict__", {})
+    assert env._env_keys is MyEnv()._env_keys
+    assert env._env_keys == {"STR_KEY", "INT_KEY", "OPTIONAL_KEY", "DEFAULT_KEY"}
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__slots_frozen(compiled: bool):
+    class MyEnv(typedenv.EnvLoader, slots=True, compiled=compiled):
+        STR_KEY: str
+
+    env = MyEnv()
+    with pytest.raises(AttributeError):
+        env.STR_KEY = "other"
+
+    env.other_attr = 1
+    assert getattr(env, "other_attr") == 1
+
+
+def test__env_loader__slots_unfrozen():
+    class MyEnv(typedenv.EnvLoader, slots=True, frozen=False):
+        STR_KEY: str
+
+    env = MyEnv()
+    env.STR_KEY = "other"
+    assert env.STR_KEY == "other"
+
+
+def test__env_loader__slots_keeps_class_options():
+    class MyEnv(typedenv.EnvLoader, slots=True, singleton=True):
+        STR_KEY: str
+
+    assert MyEnv() is MyEnv()
+    assert typedenv.fields(MyEnv()) == typedenv.fields(MyEnv)
+
+
+def test__env_loader__slots_lazy_key():
+    calls = []
+
+    def convert(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    class MyEnv(typedenv.EnvLoader, slots=True, compiled=True):
+        STR_KEY: str
+        INT_KEY: typing.Annotated[int, typedenv.Converter(convert), typedenv.Lazy]
+
+    env = MyEnv()
+    assert calls == []
+    assert env.INT_KEY == 1
+    assert env.INT_KEY == 1
+    assert calls == ["1"]
+
+    with pytest.raises(AttributeError):
+        env.INT_KEY = 2
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__env_loader__slots_lazy_default(compiled: bool, monkeypatch: pytest.MonkeyPatch):
+    class MyEnv(typedenv.EnvLoader, slots=True, compiled=compiled):
+        INT_KEY: int
+        LAZY_KEY: typing.Annotated[int, typedenv.Lazy] = 5
+        JSON_KEY: typedenv.Json[dict[str, int]] | None = None
+
+    env = MyEnv.from_mapping({"INT_KEY": "1"})
+    assert (env.LAZY_KEY, env.JSON_KEY) == (5, None)
+    with pytest.raises(AttributeError):
+        env.LAZY_KEY = 6
+
+    bulk = MyEnv.load_many([{"INT_KEY": "1"}])
+    assert bulk.instances[0] is not None
+    assert bulk.instances[0].LAZY_KEY == 5
+
+    monkeypatch.setenv("LAZY_KEY", "7")
+    env = MyEnv()
+    monkeypatch.delenv("LAZY_KEY")
+    assert env.reload() == {"LAZY_KEY"}
+    assert env.LAZY_KEY == 5
+
+
+def test__env_loader__slots_reload(monkeypatch: pytest.MonkeyPatch):
+    class MyEnv(typedenv.EnvLoader, slots=True):
+        STR_KEY: str
+        INT_KEY: int
+
+    env = MyEnv()
+    monkeypatch.setenv("INT_KEY", "2")
+
+    assert env.reload() == {"INT_KEY"}
+    assert env.INT_KEY == 2
+
+
+def test__env_loader__slots_aload():
+    async def convert(value: str) -> int:
+        return int(value)
+
+    class MyEnv(typedenv.EnvLoader, slots=True):
+        INT_KEY: typing.Annotated[int, typedenv.Converter(convert)]
+
+    env = asyncio.run(MyEnv.aload())
+    assert env.INT_KEY == 1
+
+
+def test__env_loader__slots_from_mapping():
+    class MyEnv(typedenv.EnvLoader, slots=True):
+        STR_KEY: str
+
+    env = MyEnv.from_mapping({"STR_KEY": "mapped"})
+    assert env.STR_KEY == "mapped"
+    assert typedenv.origins(env) == {"STR_KEY": env._env_sources[0]}
+
+
+def test__env_loader__slots_shares_raw_values(monkeypatch: pytest.MonkeyPatch):
+    class MyEnv(typedenv.EnvLoader, slots=True):
+        STR_KEY: str
+
+    first, second = MyEnv(), MyEnv()
+    assert second._env_raw is first._env_raw
+    assert second._env_origins is first._env_origins
+
+    monkeypatch.setenv("STR_KEY", "other")
+    third = MyEnv()
+    assert third._env_raw == {"STR_KEY": "other"}
+    assert first._env_raw == {"STR_KEY": "value"}
+
+
+def test__env_loader__slots_pickle():
+    env = PickledEnv()
+    restored = pickle.loads(pickle.dumps(env))
+
+    assert type(restored) is type(env)
+    assert (restored.STR_KEY, restored.INT_KEY) == ("value", 1)
+    assert typedenv.origins(restored) == typedenv.origins(env)
+    with pytest.raises(AttributeError):
+        restored.STR_KEY = "other"
+
+
+def test__env_loader__slots_not_inherited():
+    class Parent(typedenv.EnvLoader, slots=True):
+        STR_KEY: str
+
+    class Child(Parent):
+        INT_KEY: int
+
+    env = Child()
+    assert type(env) is Child
+    assert env.__dict__["STR_KEY"] == "value"
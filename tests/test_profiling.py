@@ -0,0 +1,120 @@
+import typing
+
+import pytest
+
+import typedenv
+from typedenv import profiling
+
+
+@pytest.fixture(autouse=True)
+def reset_profiling():
+    yield
+    for hook in list(profiling._HOOKS):
+        profiling.remove_hook(hook)
+    profiling.disable()
+    profiling.clear()
+
+
+def test__profiling__disabled_by_default(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+
+    MyEnv()
+
+    assert profiling.ENABLED is False
+    assert MyEnv not in profiling.registry()
+
+
+def test__profiling__hook(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "42")
+    received: list[profiling.LoadStats] = []
+
+    def to_list(value: str) -> list[str]:
+        return value.split(",")
+
+    cache = typedenv.ConverterCache()
+
+    class MyEnv(typedenv.EnvLoader, cache=cache):
+        MY_KEY: int
+        LIST_KEY: typing.Annotated[list[str], typedenv.Converter(to_list)] = []
+
+    profiling.add_hook(received.append)
+    MyEnv()
+
+    assert len(received) == 1
+    stats = received[0]
+    assert stats.cls is MyEnv
+    assert stats.singleton_hit is False
+    assert stats.total_ns >= stats.sources_ns
+    assert [field.name for field in stats.fields] == ["MY_KEY", "LIST_KEY"]
+    assert isinstance(stats.fields[0].source, typedenv.Environ)
+    assert stats.fields[0].cache_hit is None
+    assert stats.fields[1].source is None
+    assert all(f.lookup_ns >= 0 and f.convert_ns >= 0 for f in stats.fields)
+
+    profiling.remove_hook(received.append)
+    MyEnv()
+
+    assert profiling.ENABLED is False
+    assert len(received) == 1
+
+
+def test__profiling__cache_hits(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "a,b")
+    received: list[profiling.LoadStats] = []
+
+    def to_list(value: str) -> list[str]:
+        return value.split(",")
+
+    class MyEnv(typedenv.EnvLoader, cache=typedenv.ConverterCache()):
+        MY_KEY: typing.Annotated[list[str], typedenv.Converter(to_list)]
+
+    profiling.add_hook(received.append)
+    MyEnv()
+    MyEnv()
+
+    assert [stats.fields[0].cache_hit for stats in received] == [False, True]
+
+
+def test__profiling__registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    class MyEnv(typedenv.EnvLoader):
+        MY_KEY: str
+
+    class MySingleton(typedenv.EnvLoader, singleton=True):
+        MY_KEY: str
+
+    profiling.enable()
+    MyEnv()
+    MyEnv()
+    MySingleton()
+    MySingleton()
+    MySingleton()
+
+    registry = profiling.registry()
+    assert registry[MyEnv].loads == 2
+    assert registry[MyEnv].total_ns > 0
+    assert registry[MyEnv].last is not None
+    assert registry[MySingleton].loads == 1
+    assert registry[MySingleton].singleton_hits == 2
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test__profiling__same_values(compiled: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "1")
+    monkeypatch.setenv("LAZY_KEY", "2")
+
+    class MyEnv(typedenv.EnvLoader, compiled=compiled):
+        MY_KEY: int
+        LAZY_KEY: typing.Annotated[int, typedenv.Lazy]
+        DEFAULT_KEY: str = "default"
+
+    profiling.enable()
+    env = MyEnv()
+
+    assert (env.MY_KEY, env.LAZY_KEY, env.DEFAULT_KEY) == (1, 2, "default")
+    with pytest.raises(AttributeError):
+        env.MY_KEY = 3
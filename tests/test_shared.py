@@ -0,0 +1,192 @@
+import os
+import typing
+
+import pytest
+
+import typedenv
+from typedenv import shared
+from typedenv.loader import _SINGLETONS
+
+CONVERT_CALLS: list[str] = []
+
+
+def counting_int(value: str) -> int:
+    CONVERT_CALLS.append(value)
+    return int(value)
+
+
+class SharedEnv(typedenv.EnvLoader):
+    SHARED_STR: str
+    SHARED_INT: typing.Annotated[int, typedenv.Converter(counting_int)]
+
+
+class SingletonSharedEnv(typedenv.EnvLoader, singleton=True):
+    SHARED_STR: str
+
+
+class JsonSharedEnv(typedenv.EnvLoader):
+    SHARED_JSON: typedenv.Json[dict[str, int]]
+
+
+class NestedSharedEnv(typedenv.EnvLoader):
+    NESTED: typing.Annotated[SingletonSharedEnv, typedenv.Prefix("")]
+
+
+@pytest.fixture(autouse=True)
+def shared_env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SHARED_STR", "value")
+    monkeypatch.setenv("SHARED_INT", "1")
+    CONVERT_CALLS.clear()
+    yield
+    _SINGLETONS.pop(SingletonSharedEnv, None)
+
+
+@pytest.fixture
+def published() -> typing.Iterator[shared.SharedLoader[SharedEnv]]:
+    published = shared.publish(SharedEnv())
+    yield published
+    published.close()
+    published.unlink()
+
+
+def test__shared__attach_reads_published_instance(
+    published: shared.SharedLoader[SharedEnv],
+):
+    attached = shared.attach(SharedEnv, published.name)
+    try:
+        instance = attached.get()
+        assert CONVERT_CALLS == ["1"]
+        assert isinstance(instance, SharedEnv)
+        assert instance.SHARED_STR == "value"
+        assert instance.SHARED_INT == 1
+        origin = typedenv.origins(instance)["SHARED_STR"]
+        assert origin is SharedEnv._env_class_sources()[0]
+
+        # Unchanged versions are not unpickled again
+        assert attached.get() is instance
+        assert attached.version == 1
+    finally:
+        attached.close()
+
+
+def test__shared__reload_publishes_new_version(
+    published: shared.SharedLoader[SharedEnv], monkeypatch: pytest.MonkeyPatch
+):
+    attached = shared.attach(SharedEnv, published.name)
+    try:
+        first = attached.get()
+
+        monkeypatch.setenv("SHARED_INT", "2")
+        assert published.get().reload() == {"SHARED_INT"}
+        assert published.version == 2
+
+        second = attached.get()
+        assert second is not first
+        assert second.SHARED_INT == 2
+        assert CONVERT_CALLS == ["1", "2"]
+    finally:
+        attached.close()
+
+
+def test__shared__replaces_singleton(monkeypatch: pytest.MonkeyPatch):
+    published = shared.publish(SingletonSharedEnv())
+    try:
+        monkeypatch.setenv("SHARED_STR", "changed")
+        SingletonSharedEnv().reload()
+        _SINGLETONS.pop(SingletonSharedEnv)
+
+        attached = shared.attach(SingletonSharedEnv, published.name)
+        instance = attached.get()
+        assert instance.SHARED_STR == "changed"
+        assert SingletonSharedEnv() is instance
+        attached.close()
+    finally:
+        published.close()
+        published.unlink()
+
+
+def test__shared__nested_values():
+    singleton = SingletonSharedEnv()
+    published = shared.publish(NestedSharedEnv())
+    try:
+        attached = shared.attach(NestedSharedEnv, published.name)
+        instance = attached.get()
+        assert instance.NESTED.SHARED_STR == "value"
+        assert instance.NESTED is not singleton
+        assert SingletonSharedEnv() is singleton
+        attached.close()
+    finally:
+        published.close()
+        published.unlink()
+
+
+def test__shared__json_object(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SHARED_JSON", '{"a": 1}')
+    published = shared.publish(JsonSharedEnv())
+    try:
+        attached = shared.attach(JsonSharedEnv, published.name)
+        assert attached.get().SHARED_JSON == {"a": 1}
+        attached.close()
+    finally:
+        published.close()
+        published.unlink()
+
+
+def test__shared__schema_mismatch(published: shared.SharedLoader[SharedEnv]):
+    class OtherEnv(typedenv.EnvLoader):
+        SHARED_STR: str
+
+    attached = shared.attach(OtherEnv, published.name)
+    try:
+        with pytest.raises(ValueError):
+            attached.get()
+    finally:
+        attached.close()
+
+
+def test__shared__interrupted_write_times_out(
+    published: shared.SharedLoader[SharedEnv],
+):
+    # A publisher that stopped while writing leaves the counter odd
+    counter, length = shared._HEADER.unpack_from(published._buf)
+    shared._HEADER.pack_into(published._buf, 0, counter + 1, length)
+
+    attached = shared.attach(SharedEnv, published.name)
+    try:
+        with pytest.raises(TimeoutError):
+            attached.get(timeout=0.05)
+
+        shared._HEADER.pack_into(published._buf, 0, counter + 2, length)
+        assert attached.get().SHARED_INT == 1
+    finally:
+        attached.close()
+
+
+def test__shared__instance_too_large():
+    with pytest.raises(ValueError, match="larger size"):
+        shared.publish(SharedEnv(), size=32)
+
+
+def test__shared__rejects_other_instances(published: shared.SharedLoader[SharedEnv]):
+    with pytest.raises(ValueError):
+        published.publish(SharedEnv.from_mapping({"SHARED_STR": "a", "SHARED_INT": "1"}))
+    with pytest.raises(TypeError):
+        published.publish(SingletonSharedEnv())  # type: ignore[arg-type]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test__shared__forked_worker(published: shared.SharedLoader[SharedEnv]):
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            instance = shared.attach(SharedEnv, published.name).get()
+            os.write(write_fd, f"{instance.SHARED_INT},{len(CONVERT_CALLS)}".encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as pipe:
+        # The worker reads the value converted by the parent
+        assert pipe.read() == "1,1"
@@ -0,0 +1,317 @@
+import os
+import pathlib
+import stat
+import subprocess
+import sys
+import threading
+import typing
+
+import pytest
+
+import typedenv
+from typedenv import snapshot
+from typedenv.loader import _SINGLETONS
+
+CONVERT_CALLS: list[str] = []
+
+
+def counting_int(value: str) -> int:
+    CONVERT_CALLS.append(value)
+    return int(value)
+
+
+class SnapshotEnv(typedenv.EnvLoader):
+    SNAPSHOT_STR: str
+    SNAPSHOT_INT: typing.Annotated[int, typedenv.Converter(counting_int)]
+    SNAPSHOT_OPTIONAL: str | None = None
+
+
+class SlotsSnapshotEnv(typedenv.EnvLoader, slots=True):
+    SNAPSHOT_STR: str
+    SNAPSHOT_INT: typing.Annotated[int, typedenv.Converter(counting_int)]
+
+
+class LazySnapshotEnv(typedenv.EnvLoader, lazy=True):
+    SNAPSHOT_INT: typing.Annotated[int, typedenv.Converter(counting_int)]
+
+
+class SingletonSnapshotEnv(typedenv.EnvLoader, singleton=True):
+    SNAPSHOT_STR: str
+
+
+class JsonSnapshotEnv(typedenv.EnvLoader):
+    SNAPSHOT_JSON: typedenv.Json[dict[str, int]]
+
+
+class NestedSnapshotEnv(typedenv.EnvLoader):
+    NESTED: typing.Annotated[SingletonSnapshotEnv, typedenv.Prefix("")]
+
+
+def to_lock(value: str) -> typing.Any:
+    return threading.Lock()
+
+
+class UnpicklableEnv(typedenv.EnvLoader):
+    SNAPSHOT_STR: typing.Annotated[typing.Any, typedenv.Converter(to_lock)]
+
+
+@pytest.fixture(autouse=True)
+def snapshot_env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SNAPSHOT_STR", "value")
+    monkeypatch.setenv("SNAPSHOT_INT", "1")
+    CONVERT_CALLS.clear()
+    yield
+    _SINGLETONS.pop(SingletonSnapshotEnv, None)
+
+
+def test__snapshot__load_writes_then_restores(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+
+    first = snapshot.load(SnapshotEnv, path)
+    assert path.exists()
+    assert CONVERT_CALLS == ["1"]
+
+    second = snapshot.load(SnapshotEnv, path)
+    assert second is not first
+    assert CONVERT_CALLS == ["1"]
+    assert second.SNAPSHOT_STR == "value"
+    assert second.SNAPSHOT_INT == 1
+    assert second.SNAPSHOT_OPTIONAL is None
+    assert typedenv.origins(second) == {
+        "SNAPSHOT_STR": first._env_sources[0],
+        "SNAPSHOT_INT": first._env_sources[0],
+        "SNAPSHOT_OPTIONAL": None,
+    }
+
+
+def test__snapshot__slots_class(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.load(SlotsSnapshotEnv, path)
+
+    restored = snapshot.load(SlotsSnapshotEnv, path)
+    assert CONVERT_CALLS == ["1"]
+    assert isinstance(restored, SlotsSnapshotEnv)
+    assert restored.SNAPSHOT_INT == 1
+    with pytest.raises(AttributeError):
+        restored.SNAPSHOT_INT = 2
+
+
+def test__snapshot__restored_instance_is_frozen(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.load(SnapshotEnv, path)
+
+    restored = snapshot.load(SnapshotEnv, path)
+    with pytest.raises(AttributeError):
+        restored.SNAPSHOT_STR = "other"
+
+
+RESTORE_SCRIPT = """
+import sys
+from typedenv import snapshot
+from tests.test_snapshot import {cls}
+
+restored = snapshot.load({cls}, sys.argv[1])
+try:
+    restored.SNAPSHOT_STR = "other"
+except AttributeError:
+    print(restored.SNAPSHOT_STR, restored.SNAPSHOT_INT)
+"""
+
+
+@pytest.mark.parametrize("cls", [SnapshotEnv, SlotsSnapshotEnv])
+def test__snapshot__restored_in_new_process(
+    cls: type[typedenv.EnvLoader], tmp_path: pathlib.Path
+):
+    path = tmp_path / "env.snapshot"
+    snapshot.save(cls(), path)
+
+    # A new process restores the instance without having loaded the class
+    result = subprocess.run(
+        [sys.executable, "-c", RESTORE_SCRIPT.format(cls=cls.__name__), str(path)],
+        cwd=pathlib.Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["value", "1"]
+
+
+NESTED_RESTORE_SCRIPT = """
+import sys
+from typedenv import snapshot
+from tests.test_snapshot import NestedSnapshotEnv, SingletonSnapshotEnv
+
+singleton = SingletonSnapshotEnv()
+restored = snapshot.load(NestedSnapshotEnv, sys.argv[1])
+print(
+    restored.NESTED.SNAPSHOT_STR,
+    restored.NESTED is not singleton,
+    SingletonSnapshotEnv() is singleton,
+)
+"""
+
+
+def test__snapshot__nested_restored_in_new_process(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.save(NestedSnapshotEnv(), path)
+
+    # The nested singleton class keeps its own singleton
+    result = subprocess.run(
+        [sys.executable, "-c", NESTED_RESTORE_SCRIPT, str(path)],
+        cwd=pathlib.Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["value", "True", "True"]
+
+
+def test__snapshot__changed_environment_is_a_miss(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    path = tmp_path / "env.snapshot"
+    snapshot.load(SnapshotEnv, path)
+
+    monkeypatch.setenv("SNAPSHOT_INT", "2")
+    assert snapshot.load(SnapshotEnv, path).SNAPSHOT_INT == 2
+    assert CONVERT_CALLS == ["1", "2"]
+
+    # The snapshot was rewritten for the new environment
+    assert snapshot.load(SnapshotEnv, path).SNAPSHOT_INT == 2
+    assert CONVERT_CALLS == ["1", "2"]
+
+
+def test__snapshot__changed_schema_is_a_miss(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.save(SnapshotEnv(), path)
+
+    class SnapshotEnv2(typedenv.EnvLoader):
+        SNAPSHOT_STR: str
+
+    assert snapshot.schema_key(SnapshotEnv) != snapshot.schema_key(SnapshotEnv2)
+    assert snapshot._restore(SnapshotEnv2, path) is None
+
+
+def test__snapshot__schema_key_depends_on_defaults():
+    class DefaultEnv(typedenv.EnvLoader):
+        SNAPSHOT_STR: str = "a"
+
+    key = snapshot.schema_key(DefaultEnv)
+
+    class DefaultEnv(typedenv.EnvLoader):  # type: ignore[no-redef]
+        SNAPSHOT_STR: str = "b"
+
+    assert snapshot.schema_key(DefaultEnv) != key
+
+
+def test__snapshot__schema_key_depends_on_converter_code():
+    def scale(value: str) -> int:
+        return int(value) * 1
+
+    def scale_more(value: str) -> int:
+        return int(value) * 1000
+
+    def scale_by(factor: int) -> typing.Callable[[str], int]:
+        def scale(value: str) -> int:
+            return int(value) * factor
+
+        return scale
+
+    keys = set()
+    for convert in (scale, scale_more, scale_by(1), scale_by(1000)):
+        # As if the same converter had been edited between deploys
+        convert.__qualname__ = "scale"
+
+        class ScaledEnv(typedenv.EnvLoader):
+            SNAPSHOT_INT: typing.Annotated[int, typedenv.Converter(convert)]
+
+        keys.add(snapshot.schema_key(ScaledEnv))
+
+    assert len(keys) == 4
+
+
+def test__snapshot__schema_key_depends_on_nested_classes():
+    class ChildEnv(typedenv.EnvLoader):
+        SNAPSHOT_STR: str
+
+    class ParentEnv(typedenv.EnvLoader):
+        CHILD: ChildEnv | None
+
+    key = snapshot.schema_key(ParentEnv)
+    ChildEnv.__annotations__["SNAPSHOT_INT"] = int
+    assert snapshot.schema_key(ParentEnv) != key
+
+
+def test__snapshot__json_object(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SNAPSHOT_JSON", '{"a": 1}')
+    path = tmp_path / "env.snapshot"
+    snapshot.load(JsonSnapshotEnv, path)
+    assert path.exists()
+
+    restored = snapshot.load(JsonSnapshotEnv, path)
+    assert restored.SNAPSHOT_JSON == {"a": 1}
+
+
+def test__snapshot__corrupt_file_is_a_miss(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    path.write_bytes(b"not a pickle")
+
+    assert snapshot.load(SnapshotEnv, path, write=False).SNAPSHOT_STR == "value"
+    assert path.read_bytes() == b"not a pickle"
+
+
+def test__snapshot__lazy_values_are_converted_before_saving(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.load(LazySnapshotEnv, path)
+    assert CONVERT_CALLS == ["1"]
+
+    assert snapshot.load(LazySnapshotEnv, path).SNAPSHOT_INT == 1
+    assert CONVERT_CALLS == ["1"]
+
+
+def test__snapshot__restored_singleton_is_registered(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.save(SingletonSnapshotEnv(), path)
+    _SINGLETONS.pop(SingletonSnapshotEnv)
+
+    restored = snapshot.load(SingletonSnapshotEnv, path)
+    assert SingletonSnapshotEnv() is restored
+    assert snapshot.load(SingletonSnapshotEnv, path) is restored
+
+
+def test__snapshot__unpicklable_value_skips_writing(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+
+    assert snapshot.load(UnpicklableEnv, path).SNAPSHOT_STR is not None
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test__snapshot__save_rejects_instances_from_other_sources(tmp_path: pathlib.Path):
+    instance = SnapshotEnv.from_mapping({"SNAPSHOT_STR": "a", "SNAPSHOT_INT": "1"})
+
+    with pytest.raises(ValueError):
+        snapshot.save(instance, tmp_path / "env.snapshot")
+
+
+def test__snapshot__schema_key_is_stable_after_loading():
+    class DefaultEnv(typedenv.EnvLoader, lazy=True):
+        SNAPSHOT_STR: str
+        SNAPSHOT_INT: int = 3
+
+    class FrozenEnv(typedenv.EnvLoader):
+        SNAPSHOT_STR: str
+        SNAPSHOT_INT: int = 3
+
+    for cls in (DefaultEnv, FrozenEnv):
+        key = snapshot.schema_key(cls)
+        cls()
+        assert snapshot.schema_key(cls) == key
+
+
+@pytest.mark.skipif(os.name != "posix", reason="requires POSIX permissions")
+def test__snapshot__only_readable_by_owner(tmp_path: pathlib.Path):
+    path = tmp_path / "env.snapshot"
+    snapshot.save(SnapshotEnv(), path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
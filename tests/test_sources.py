@@ -0,0 +1,187 @@
+import os
+import pathlib
+
+import pytest
+
+from typedenv.sources import (
+    EnvFile,
+    Environ,
+    EnvironSnapshot,
+    MappingSource,
+    SecretFiles,
+    merge_sources,
+    parse_env_file,
+    read_secret_file,
+)
+
+
+def test__environ_snapshot__reads_environ(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+
+    snapshot = EnvironSnapshot()
+
+    assert snapshot["MY_KEY"] == "value"
+    assert snapshot.get("MY_KEY") == "value"
+    assert snapshot.get("MISSING_SNAPSHOT_KEY") is None
+    assert "MY_KEY" in snapshot
+    assert dict(snapshot) == dict(os.environ)
+
+
+def test__environ_snapshot__isolated_from_changes(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "before")
+
+    snapshot = EnvironSnapshot()
+    monkeypatch.setenv("MY_KEY", "after")
+    monkeypatch.setenv("NEW_KEY", "new")
+
+    assert snapshot["MY_KEY"] == "before"
+    assert "NEW_KEY" not in snapshot
+
+
+ENV_FILE_CONTENTS = r"""
+# a comment
+PLAIN=value
+export EXPORTED=exported value
+SPACED = spaced   # trailing comment
+HASH_IN_VALUE=a#b
+EMPTY=
+SINGLE='literal \n value # not a comment'
+DOUBLE="escaped\tvalue \"quoted\"\nnext line"
+PEM="-----BEGIN KEY-----
+abc
+NOT_A_KEY=inside value
+-----END KEY-----"
+  INDENTED=indented
+DUPLICATE=first
+DUPLICATE=second
+"""
+
+
+@pytest.fixture
+def env_file(tmp_path) -> str:
+    path = tmp_path / ".env"
+    path.write_text(ENV_FILE_CONTENTS)
+    return str(path)
+
+
+def test__parse_env_file__all_keys(env_file: str):
+    assert parse_env_file(env_file) == {
+        "PLAIN": "value",
+        "EXPORTED": "exported value",
+        "SPACED": "spaced",
+        "HASH_IN_VALUE": "a#b",
+        "EMPTY": "",
+        "SINGLE": r"literal \n value # not a comment",
+        "DOUBLE": 'escaped\tvalue "quoted"\nnext line',
+        "PEM": "-----BEGIN KEY-----\nabc\nNOT_A_KEY=inside value\n-----END KEY-----",
+        "INDENTED": "indented",
+        "DUPLICATE": "second",
+    }
+
+
+def test__parse_env_file__selected_keys(env_file: str):
+    assert parse_env_file(env_file, keys=["PLAIN", "PEM", "NOT_A_KEY", "UNKNOWN"]) == {
+        "PLAIN": "value",
+        "PEM": "-----BEGIN KEY-----\nabc\nNOT_A_KEY=inside value\n-----END KEY-----",
+    }
+
+
+def test__parse_env_file__unterminated_quote(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text('BROKEN="' + "x" * 5000 + "\nNEXT=value\n")
+
+    # Falls back to a bare value rather than backtracking through the line
+    assert parse_env_file(path) == {"BROKEN": '"' + "x" * 5000, "NEXT": "value"}
+
+
+def test__parse_env_file__escaped_line_break(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text('KEY="a\\\nb"\nNEXT=value\n')
+
+    # Like other unknown escapes, the backslash is kept
+    assert parse_env_file(path) == {"KEY": "a\\\nb", "NEXT": "value"}
+
+
+def test__parse_env_file__empty_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("")
+
+    assert parse_env_file(path) == {}
+
+
+def test__env_file__missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        EnvFile(tmp_path / ".env").read()
+
+    assert EnvFile(tmp_path / ".env", missing_ok=True).read() == {}
+
+
+def test__merge_sources__precedence():
+    first = MappingSource({"A": "first"})
+    second = MappingSource({"A": "second", "B": "second", "C": "second"})
+
+    values, origins = merge_sources([first, second], ["A", "B"])
+
+    assert values == {"A": "first", "B": "second"}
+    assert origins == {"A": first, "B": second}
+
+
+def test__environ__reads_declared_keys(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MY_KEY", "value")
+    monkeypatch.setenv("OTHER_KEY", "other")
+
+    assert Environ().read(["MY_KEY", "MISSING_SOURCE_KEY"]) == {"MY_KEY": "value"}
+
+
+def test__secret_files__reads_file_when_key_unset(tmp_path: pathlib.Path):
+    secret = tmp_path / "password"
+    secret.write_text("hunter2\n")
+    source = MappingSource(
+        {"PASSWORD_FILE": str(secret), "USER": "admin", "USER_FILE": str(secret)}
+    )
+
+    assert SecretFiles(source).read(["PASSWORD", "USER", "MISSING"]) == {
+        "PASSWORD": "hunter2",
+        "USER": "admin",
+    }
+
+
+def test__secret_files__reads_environ_by_default(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    secret = tmp_path / "token"
+    secret.write_text("abc")
+    monkeypatch.setenv("API_TOKEN_PATH", str(secret))
+
+    assert SecretFiles(suffix="_PATH").read(["API_TOKEN"]) == {"API_TOKEN": "abc"}
+
+
+def test__read_secret_file__cached_by_mtime_and_size(tmp_path: pathlib.Path):
+    secret = tmp_path / "password"
+    secret.write_text("first")
+    stat = secret.stat()
+    assert read_secret_file(secret, max_size=100) == "first"
+
+    # Same size and modification time, so the file is not read again
+    secret.write_text("other")
+    os.utime(secret, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert read_secret_file(secret, max_size=100) == "first"
+
+    secret.write_text("second")
+    assert read_secret_file(secret, max_size=100) == "second"
+
+
+def test__read_secret_file__size_limit(tmp_path: pathlib.Path):
+    secret = tmp_path / "password"
+    secret.write_bytes(b"x" * 11)
+
+    with pytest.raises(ValueError, match="larger than 10 bytes"):
+        read_secret_file(secret, max_size=10)
+    assert read_secret_file(secret, max_size=11) == "x" * 11
+
+
+def test__secret_files__invalid_file(tmp_path: pathlib.Path):
+    source = MappingSource({"PASSWORD_FILE": str(tmp_path / "missing")})
+
+    with pytest.raises(ValueError, match="PASSWORD from PASSWORD_FILE"):
+        SecretFiles(source).read(["PASSWORD"])
@@ -0,0 +1,70 @@
+import os
+import time
+
+import pytest
+
+import typedenv
+from typedenv.watch import FileWatcher
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("MY_KEY=1\n")
+    return path
+
+
+def _rewrite(path, contents: str) -> None:
+    stat = path.stat()
+    path.write_text(contents)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test__file_watcher__poll(env_file):
+    class MyEnv(typedenv.EnvLoader, sources=[typedenv.EnvFile(env_file)]):
+        MY_KEY: int
+
+    env = MyEnv()
+    watcher = FileWatcher(env)
+
+    assert watcher.paths == [env_file]
+    assert watcher.poll() == frozenset()
+
+    _rewrite(env_file, "MY_KEY=2\n")
+    assert watcher.poll() == {"MY_KEY"}
+    assert env.MY_KEY == 2
+
+
+def test__file_watcher__reload_error(env_file):
+    class MyEnv(typedenv.EnvLoader, sources=[typedenv.EnvFile(env_file)]):
+        MY_KEY: int
+
+    errors: list[Exception] = []
+    env = MyEnv()
+    watcher = FileWatcher(env, on_error=errors.append)
+
+    _rewrite(env_file, "MY_KEY=not an int\n")
+
+    assert watcher.poll() == frozenset()
+    assert env.MY_KEY == 1
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+
+
+def test__file_watcher__thread(env_file):
+    class MyEnv(typedenv.EnvLoader, sources=[typedenv.EnvFile(env_file)]):
+        MY_KEY: int
+
+    env = MyEnv()
+    changed = []
+    env.on_reload(lambda _, keys: changed.append(keys))
+
+    with FileWatcher(env, interval=0.01):
+        _rewrite(env_file, "MY_KEY=3\n")
+        for _ in range(500):
+            if changed:
+                break
+            time.sleep(0.01)
+
+    assert changed == [{"MY_KEY"}]
+    assert env.MY_KEY == 3
@@ -1,2 +1,4 @@
-from .converters import Converter
-from .loader import EnvLoader
+from .annotations import Delimited, Json, Lazy, Prefix
+from .converters import Converter, ConverterCache
+from .loader import BulkLoad, EnvField, EnvLoader, fields, origins
+from .sources import EnvFile, Environ, MappingSource, SecretFiles, Source
@@ -0,0 +1,5 @@
+import sys
+
+from typedenv.cli import main
+
+sys.exit(main())
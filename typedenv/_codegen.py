@@ -0,0 +1,83 @@
+import typing
+
+from typedenv._internals import _MISSING
+
+if typing.TYPE_CHECKING:
+    from typedenv.loader import EnvField
+
+_LoadFunc = typing.Callable[[typing.Any, typing.Callable[[str], str | None]], None]
+
+
+def create_load_fn(
+    env_fields: "typing.Sequence[EnvField]", slots_class: type | None = None
+) -> _LoadFunc:
+    """Generates a straight-line loader for the given fields.
+
+    The generated function takes the instance being loaded and a `getenv`
+    callable, and writes every converted value directly into the instance
+    `__dict__`. Defaults, converters and null checks are bound per field
+    so no branching on field metadata happens at load time.
+
+    If `slots_class` is given, keys with a slot on that class are written
+    through the slot descriptors instead.
+    """
+    globals_: dict[str, typing.Any] = {"__builtins__": {}, "ValueError": ValueError}
+    has_lazy = any(field.lazy for field in env_fields)
+    body = []
+    if slots_class is None or has_lazy:
+        body.append("    values = self.__dict__")
+    if has_lazy:
+        body.append("    lazy_values = {}")
+
+    for i, field in enumerate(env_fields):
+        name = repr(field.name)
+        store = f"values[{name}] = value"
+        if slots_class is not None and not field.lazy:
+            globals_[f"_set_{i}"] = slots_class.__dict__[field.name].__set__
+            store = f"_set_{i}(self, value)"
+        body.append(f"    value = getenv({name})")
+
+        if field.is_async:
+            message = repr(f"{field.name} has an async converter; load it with aload()")
+            globals_["TypeError"] = TypeError
+            body.append(f"    if value is not None:")
+            body.append(f"        raise TypeError({message})")
+            body.append(f"    else:")
+        elif field.lazy:
+            body.append(f"    if value is not None:")
+            body.append(f"        lazy_values[{name}] = value")
+            body.append(f"    else:")
+        elif field.convert is str:
+            body.append(f"    if value is None:")
+        else:
+            globals_[f"_convert_{i}"] = field.convert
+            body.append(f"    if value is not None:")
+            body.append(f"        value = _convert_{i}(value)")
+            body.append(f"    else:")
+
+        if field.default is _MISSING:
+            message = repr(f"Missing environment variable: {field.name}")
+            body.append(f"        raise ValueError({message})")
+        elif field.default is None and not field.nullable:
+            message = repr(f"Cannot set {field.name} to None")
+            body.append(f"        raise ValueError({message})")
+        else:
+            globals_[f"_default_{i}"] = field.default
+            body.append(f"        value = _default_{i}")
+
+        if field.lazy or field.is_async:
+            body.append(f"        {store}")
+        else:
+            body.append(f"    {store}")
+
+    if has_lazy:
+        body.append("    if lazy_values:")
+        body.append("        values['_env_lazy'] = lazy_values")
+
+    if not body:
+        body.append("    pass")
+
+    source = "def __typedenv_load__(self, getenv):\n" + "\n".join(body)
+    locals_: dict[str, typing.Any] = {}
+    exec(source, globals_, locals_)
+    return locals_["__typedenv_load__"]
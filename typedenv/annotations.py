@@ -1,6 +1,9 @@
+import dataclasses
 import types
 import typing
 
+_T = typing.TypeVar("_T")
+
 
 def get_unioned_with_none(t: typing.Any) -> typing.Any:
     """Parses an annotation that Unions a type with None and returns that type.
@@ -47,3 +50,72 @@ def get_annotated_args(t: typing.Any) -> tuple[typing.Any, ...] | None:
         return None
 
     return typing.get_args(t)
+
+
+@dataclasses.dataclass(frozen=True)
+class Lazy:
+    """Marks a key to be converted on first access instead of on load.
+
+    Can be used either as `typing.Annotated[T, Lazy]` or `typing.Annotated[T, Lazy()]`.
+    `Lazy(False)` forces eager conversion of a key in a class with `lazy=True`.
+    """
+
+    enabled: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class Prefix:
+    """Sets the prefix of the keys that a nested `EnvLoader` key is loaded from.
+
+    Used as `typing.Annotated[DatabaseEnv, Prefix("DB_")]`. Nested keys
+    without a `Prefix` use their own name followed by an underscore.
+    """
+
+    prefix: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Delimited:
+    """Configures how the raw value of a collection key is split into items.
+
+    Used as `typing.Annotated[list[int], Delimited(";")]`. Items are stripped
+    of surrounding whitespace unless `strip` is unset, and the keys and values
+    of `dict` items are separated by `kv_sep`. For `array.array` keys,
+    `typecode` selects the item type, defaulting to signed 64-bit integers.
+    """
+
+    sep: str = ","
+    kv_sep: str = "="
+    strip: bool = True
+    typecode: str | None = None
+
+    def __post_init__(self):
+        if not self.sep or not self.kv_sep:
+            raise ValueError("Delimiters must not be empty")
+        if self.sep == self.kv_sep:
+            raise ValueError(f"sep and kv_sep must differ; got {self.sep!r} for both")
+
+
+@dataclasses.dataclass(frozen=True)
+class JsonSpec:
+    """Marks a key as holding JSON, parsed and validated against `type_`.
+
+    Created by `Json[T]`, which annotates `T` with this marker.
+    """
+
+    type_: typing.Any
+
+
+if typing.TYPE_CHECKING:
+    Json = typing.Annotated[_T, JsonSpec]
+else:
+
+    class Json:
+        """Annotates a key as holding JSON: `Json[T]` is `typing.Annotated[T, JsonSpec(T)]`.
+
+        Keys are parsed on first access, and every instance that loaded the
+        same raw value shares one immutable parsed value.
+        """
+
+        def __class_getitem__(cls, type_: typing.Any) -> typing.Any:
+            return typing.Annotated[type_, JsonSpec(type_)]
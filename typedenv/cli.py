@@ -0,0 +1,149 @@
+"""Command line tools, run with `python -m typedenv`.
+
+`check` validates `.env` files against an `EnvLoader` class, and writes one
+JSON report per file to stdout, in the order the files were given:
+
+    python -m typedenv check myapp.config:Config deploy/*.env
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import json
+import os
+import sys
+import time
+import typing
+from collections.abc import Sequence
+
+from typedenv.loader import EnvLoader
+from typedenv.sources import EnvFile
+
+Report = dict[str, typing.Any]
+
+# The loader class checked by a pool worker, imported once per process
+_WORKER_LOADER: type[EnvLoader] | None = None
+
+
+def import_loader(spec: str) -> type[EnvLoader]:
+    """Imports the `EnvLoader` class named by a `module:Class` spec."""
+    module_name, _, qualname = spec.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"Expected a loader class as module:Class, got {spec!r}")
+
+    loader: typing.Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        loader = getattr(loader, name)
+
+    if not isinstance(loader, type) or not issubclass(loader, EnvLoader):
+        raise TypeError(f"{spec} is not an EnvLoader class")
+    return loader
+
+
+def _error(key: str | None, error: BaseException) -> dict[str, str | None]:
+    return {"key": key, "error": type(error).__name__, "message": str(error)}
+
+
+def check_files(
+    cls: type[EnvLoader], paths: Sequence[str | os.PathLike[str]]
+) -> list[Report]:
+    """Loads every file with `cls`, returning a report of its errors per file.
+
+    Files are read on their own, without falling back to the class sources,
+    and every failing key of a file is reported rather than only the first.
+    """
+    cls._resolve_env_fields()
+    reports: list[Report] = []
+    mappings: list[dict[str, str]] = []
+    readable: list[Report] = []
+    for path in paths:
+        report: Report = {"file": os.fspath(path), "ok": True, "errors": []}
+        reports.append(report)
+        try:
+            mappings.append(EnvFile(path).read(cls.__env_source_keys__))
+        except (OSError, UnicodeDecodeError) as e:
+            report["ok"] = False
+            report["errors"].append(_error(None, e))
+        else:
+            readable.append(report)
+
+    # Lazy keys, such as `Json` keys, would otherwise never be validated
+    result = cls.load_many(mappings, eager=True)
+    for index, errors in result.errors.items():
+        readable[index]["ok"] = False
+        readable[index]["errors"].extend(_error(k, e) for k, e in errors.items())
+
+    return reports
+
+
+def _init_worker(spec: str) -> None:
+    global _WORKER_LOADER
+    _WORKER_LOADER = import_loader(spec)
+    _WORKER_LOADER._resolve_env_fields()
+
+
+def _check_chunk(paths: list[str]) -> list[Report]:
+    assert _WORKER_LOADER is not None
+    return check_files(_WORKER_LOADER, paths)
+
+
+def check(spec: str, paths: Sequence[str], jobs: int | None = None) -> list[Report]:
+    """Validates `paths` against the loader class `spec`, across `jobs` processes.
+
+    Files are split into chunks, several per process, so that a few slow
+    files do not hold up a whole share of the work. With a single job, files
+    are checked in the current process.
+    """
+    # Imported up front, so import errors are raised here rather than in workers
+    cls = import_loader(spec)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) <= 1:
+        return check_files(cls, paths)
+
+    chunk_size = max(1, -(-len(paths) // (jobs * 4)))
+    chunks = [list(paths[i : i + chunk_size]) for i in range(0, len(paths), chunk_size)]
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(jobs, len(chunks)),
+        initializer=_init_worker,
+        initargs=(spec,),
+    ) as executor:
+        results = executor.map(_check_chunk, chunks)
+        return [report for reports in results for report in reports]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m typedenv")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check_parser = commands.add_parser(
+        "check", help="validate .env files against an EnvLoader class"
+    )
+    check_parser.add_argument("loader", help="the loader class, as module:Class")
+    check_parser.add_argument("files", nargs="+", help=".env files to validate")
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+
+    args = parser.parse_args(argv)
+    try:
+        import_loader(args.loader)
+    except (ImportError, AttributeError, TypeError, ValueError) as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    reports = check(args.loader, args.files, args.jobs)
+
+    for report in reports:
+        print(json.dumps(report))
+
+    failed = sum(not report["ok"] for report in reports)
+    elapsed = time.perf_counter() - start
+    print(
+        f"checked {len(reports)} files in {elapsed:.2f}s, {failed} failed",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
@@ -1,6 +1,18 @@
+import array
+import collections
 import dataclasses
+import enum
 import functools
+import inspect
+import json
+import os
+import threading
+import types
 import typing
+import weakref
+from collections.abc import Collection, Mapping, Sequence
+
+from typedenv.annotations import Delimited
 
 T = typing.TypeVar("T")
 _ConvertFunc = typing.Callable[[str], T]
@@ -9,6 +21,7 @@ _ConvertFunc = typing.Callable[[str], T]
 @dataclasses.dataclass(frozen=True)
 class Converter(typing.Generic[T]):
     convert: _ConvertFunc[T]
+    cacheable: bool = True
 
     def __post_init__(self):
         if not callable(self.convert):
@@ -28,9 +41,114 @@ class Converter(typing.Generic[T]):
         return return_val
 
 
+class LookupConverter:
+    """Converts raw values by looking them up in a precomputed table.
+
+    Used for `enum.Enum` subclasses and `typing.Literal` types. Lookups are
+    cheaper than a `ConverterCache` lookup, so they are never cached.
+    """
+
+    def __init__(self, type_: typing.Any, table: Mapping[str, typing.Any]) -> None:
+        self.type_ = type_
+        self.table = table
+
+    def __call__(self, value: str) -> typing.Any:
+        try:
+            return self.table[value]
+        except KeyError:
+            choices = ", ".join(map(repr, self.table))
+            raise ValueError(
+                f"{value!r} is not a valid {self.type_}; expected one of {choices}"
+            ) from None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.type_!r})"
+
+
+class _LiteralStrConverter(LookupConverter):
+    """A `LookupConverter` for literals of only strings, which are returned as is."""
+
+    def __init__(self, type_: typing.Any, values: frozenset[str]) -> None:
+        super().__init__(type_, dict.fromkeys(sorted(values)))
+        self.values = values
+
+    def __call__(self, value: str) -> typing.Any:
+        if value in self.values:
+            return value
+        return super().__call__(value)
+
+
+class _LiteralBoolConverter(LookupConverter):
+    """A `LookupConverter` for literals with bools, which accept `cast_to_bool` spellings."""
+
+    def __init__(
+        self, type_: typing.Any, table: Mapping[str, typing.Any], bools: frozenset[bool]
+    ) -> None:
+        super().__init__(type_, table)
+        self.bools = bools
+
+    def __call__(self, value: str) -> typing.Any:
+        if value in self.table:
+            return self.table[value]
+        try:
+            result = cast_to_bool(value)
+        except ValueError:
+            pass
+        else:
+            if result in self.bools:
+                return result
+        return super().__call__(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_converter(enum_type: type[enum.Enum]) -> LookupConverter:
+    table: dict[str, enum.Enum] = {}
+    for member in enum_type:
+        table.setdefault(str(member.value), member)
+    # Member names are accepted too, unless they clash with a value
+    for name, member in enum_type.__members__.items():
+        table.setdefault(name, member)
+    return LookupConverter(enum_type, table)
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_converter(literal_type: typing.Any) -> LookupConverter:
+    args = typing.get_args(literal_type)
+    if all(isinstance(arg, str) for arg in args):
+        return _LiteralStrConverter(literal_type, frozenset(args))
+
+    table: dict[str, typing.Any] = {}
+    for arg in args:
+        if isinstance(arg, bool):
+            table[str(arg).lower()] = arg
+        elif isinstance(arg, enum.Enum):
+            table[str(arg.value)] = arg
+        elif isinstance(arg, (str, int)):
+            table[str(arg)] = arg
+        elif arg is not None:
+            raise TypeError(f"Unsupported Literal value: {arg!r}")
+
+    bools = frozenset(arg for arg in args if isinstance(arg, bool))
+    if bools:
+        return _LiteralBoolConverter(literal_type, table, bools)
+    return LookupConverter(literal_type, table)
+
+
 class ConverterDict(dict[type, _ConvertFunc]):
+    """Maps types to their converters.
+
+    Besides exact lookups, `resolve` derives converters for `enum.Enum`
+    subclasses, `typing.Literal` types, `typing.NewType`s and subclasses of
+    registered types.
+    """
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._resolved: dict[typing.Any, _ConvertFunc | None] = {}
+
     def __setitem__(self, key: type[T], value: _ConvertFunc[T]) -> None:
         super().__setitem__(key, value)
+        self._resolved.clear()
 
     def __getitem__(self, key: type[T]) -> _ConvertFunc[T]:
         return super().__getitem__(key)
@@ -38,6 +156,46 @@ class ConverterDict(dict[type, _ConvertFunc]):
     def __missing__(self, key: type[T]) -> _ConvertFunc[T]:
         raise KeyError(key)
 
+    def resolve(self, type_: typing.Any) -> _ConvertFunc | None:
+        """Returns the converter for `type_`, or None if none can be derived.
+
+        Results are cached by annotation until another converter is registered.
+        """
+        try:
+            return self._resolved[type_]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable annotations are resolved every time
+            return self._resolve(type_)
+
+        convert = self._resolved[type_] = self._resolve(type_)
+        return convert
+
+    def _resolve(self, type_: typing.Any) -> _ConvertFunc | None:
+        try:
+            if type_ in self:
+                return self[type_]
+        except TypeError:
+            return None
+
+        if isinstance(type_, typing.NewType):
+            return self.resolve(type_.__supertype__)
+        if typing.get_origin(type_) is typing.Literal:
+            return _literal_converter(type_)
+        if not isinstance(type_, type):
+            return None
+        if issubclass(type_, enum.Enum):
+            return _enum_converter(type_)
+
+        for base in type_.__mro__[1:]:
+            if base is not object and base in self:
+                subclass: typing.Callable[[typing.Any], typing.Any] = type_
+                base_convert: _ConvertFunc[typing.Any] = self[base]
+                return lambda value: subclass(base_convert(value))
+
+        return None
+
 
 def cast_to_bool(value: str) -> bool:
     if value.lower() in ("true", "1"):
@@ -45,3 +203,353 @@ def cast_to_bool(value: str) -> bool:
     if value.lower() in ("false", "0"):
         return False
     raise ValueError(f"Unsupported boolean value: {value}")
+
+
+_SEQUENCE_TYPES: dict[typing.Any, type] = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    tuple: tuple,
+    typing.List: list,
+    typing.Set: set,
+    typing.FrozenSet: frozenset,
+    typing.Tuple: tuple,
+}
+_IMMUTABLE_TYPES = (frozenset, tuple)
+_ARRAY_INT_TYPECODES = frozenset("bBhHiIlLqQ")
+_ARRAY_FLOAT_TYPECODES = frozenset("fd")
+
+
+def _item_converter(
+    type_: typing.Any, converters: ConverterDict, strip: bool
+) -> _ConvertFunc:
+    convert = converters.resolve(type_)
+    if convert is None:
+        raise TypeError(f"Unsupported collection item type: {type_}")
+
+    if inspect.iscoroutinefunction(convert):
+        raise TypeError(f"Collection items cannot use the async converter of {type_}")
+    if not strip or convert is int or convert is float:
+        # `int` and `float` already ignore surrounding whitespace
+        return convert
+    if convert is str:
+        return str.strip
+    return lambda item: convert(item.strip())
+
+
+def create_collection_converter(
+    type_: typing.Any,
+    converters: ConverterDict,
+    delimited: Delimited | None = None,
+    uncacheable: Collection[_ConvertFunc] = (),
+) -> tuple[_ConvertFunc, bool] | None:
+    """Builds a converter that splits a raw value into a collection in a single pass.
+
+    Supports `list`, `set`, `frozenset`, `tuple` (variadic or fixed length),
+    `dict` and `array.array`, with items converted by `converters`. Returns
+    the converter, and whether its results are immutable and can therefore
+    be cached; or None if `type_` is not a supported collection type.
+    Collections are never cacheable if an item converter is in `uncacheable`.
+    """
+    delimited = delimited or Delimited()
+    sep = delimited.sep
+    origin = typing.get_origin(type_) or type_
+    args = typing.get_args(type_)
+
+    def split(value: str) -> list[str]:
+        return value.split(sep) if value else []
+
+    if origin is array.array:
+        typecode = delimited.typecode or ("d" if args == (float,) else "q")
+        if typecode in _ARRAY_INT_TYPECODES:
+            item: _ConvertFunc = int
+        elif typecode in _ARRAY_FLOAT_TYPECODES:
+            item = float
+        else:
+            raise TypeError(f"Unsupported array typecode: {typecode!r}")
+        return (lambda value: array.array(typecode, map(item, split(value)))), False
+
+    if origin is dict or origin is typing.Dict:
+        if len(args) != 2:
+            raise TypeError(f"Unsupported type: {type_}")
+
+        kv_sep = delimited.kv_sep
+        convert_key = _item_converter(args[0], converters, delimited.strip)
+        convert_value = _item_converter(args[1], converters, delimited.strip)
+
+        def convert_dict(value: str) -> dict:
+            result = {}
+            for entry in split(value):
+                key, found, item = entry.partition(kv_sep)
+                if not found:
+                    raise ValueError(f"Expected {kv_sep!r} in dict item {entry!r}")
+                result[convert_key(key)] = convert_value(item)
+            return result
+
+        return convert_dict, False
+
+    container = _SEQUENCE_TYPES.get(origin)
+    if container is None:
+        return None
+
+    cacheable = container in _IMMUTABLE_TYPES and not any(
+        converters.resolve(arg) in uncacheable for arg in args if arg is not Ellipsis
+    )
+    if container is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        if not args:
+            raise TypeError(f"Unsupported type: {type_}")
+
+        items = [_item_converter(arg, converters, delimited.strip) for arg in args]
+
+        def convert_tuple(value: str) -> tuple:
+            parts = split(value)
+            if len(parts) != len(items):
+                raise ValueError(f"Expected {len(items)} items; got {len(parts)}")
+            return tuple(convert(part) for convert, part in zip(items, parts))
+
+        return convert_tuple, cacheable
+
+    if len(args) != 1 and container is not tuple:
+        raise TypeError(f"Unsupported type: {type_}")
+
+    item = _item_converter(args[0], converters, delimited.strip)
+    return (lambda value: container(map(item, split(value)))), cacheable
+
+
+_JSON_MAPPINGS = (dict, typing.Dict, Mapping)
+_JSON_SEQUENCES = (list, tuple, typing.List, typing.Tuple, Sequence)
+
+
+class FrozenDict(dict):
+    """A read-only `dict`, which JSON objects and TypedDicts load as.
+
+    Unlike `types.MappingProxyType`, it can be pickled, so instances with
+    JSON keys can be snapshotted and shared between processes.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: typing.Any, **kwargs: typing.Any) -> typing.NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (type(self), (dict(self),))
+
+
+def _freeze_json(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return FrozenDict({k: _freeze_json(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_json(item) for item in value)
+    return value
+
+
+def _check_json_type(type_: typing.Any) -> None:
+    """Raises TypeError if values of `type_` cannot be loaded from JSON."""
+    origin = typing.get_origin(type_) or type_
+    args = [arg for arg in typing.get_args(type_) if arg is not Ellipsis]
+
+    if type_ in (typing.Any, object, None, types.NoneType, bool, int, float, str):
+        return
+    elif origin is typing.Union or origin is types.UnionType:
+        pass
+    elif origin in _JSON_MAPPINGS:
+        if args and args[0] is not str:
+            raise TypeError(f"JSON object keys must be str; got {type_}")
+        args = args[1:]
+    elif origin in _JSON_SEQUENCES:
+        pass
+    elif typing.is_typeddict(type_):
+        args = list(typing.get_type_hints(type_).values())
+    elif dataclasses.is_dataclass(type_) and isinstance(type_, type):
+        if not type_.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            raise TypeError(f"{type_} must be a frozen dataclass to be shared")
+        args = list(typing.get_type_hints(type_).values())
+    else:
+        raise TypeError(f"Unsupported JSON type: {type_}")
+
+    for arg in args:
+        _check_json_type(arg)
+
+
+def _validate_json(type_: typing.Any, value: typing.Any, path: str) -> typing.Any:
+    origin = typing.get_origin(type_) or type_
+    args = typing.get_args(type_)
+
+    def invalid() -> ValueError:
+        return ValueError(f"Invalid JSON at {path}: expected {type_}; got {value!r}")
+
+    if type_ is typing.Any or type_ is object:
+        return _freeze_json(value)
+    elif type_ is None or type_ is types.NoneType:
+        if value is not None:
+            raise invalid()
+        return None
+    elif type_ is bool or type_ is str:
+        if not isinstance(value, type_):
+            raise invalid()
+        return value
+    elif type_ is int or type_ is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise invalid()
+        if type_ is int and not isinstance(value, int):
+            raise invalid()
+        return type_(value)
+    elif origin is typing.Union or origin is types.UnionType:
+        for arg in args:
+            try:
+                return _validate_json(arg, value, path)
+            except ValueError:
+                continue
+        raise invalid()
+    elif origin in _JSON_MAPPINGS:
+        if not isinstance(value, dict):
+            raise invalid()
+        value_type = args[1] if args else typing.Any
+        return FrozenDict(
+            {k: _validate_json(value_type, v, f"{path}.{k}") for k, v in value.items()}
+        )
+    elif origin in _JSON_SEQUENCES:
+        if not isinstance(value, list):
+            raise invalid()
+        if origin in (tuple, typing.Tuple) and args and args[-1] is not Ellipsis:
+            if len(args) != len(value):
+                raise invalid()
+            item_types = args
+        else:
+            item_types = (args[0] if args else typing.Any,) * len(value)
+        return tuple(
+            _validate_json(item_type, item, f"{path}[{i}]")
+            for i, (item_type, item) in enumerate(zip(item_types, value))
+        )
+
+    # TypedDicts and dataclasses
+    if not isinstance(value, dict):
+        raise invalid()
+
+    hints = typing.get_type_hints(type_)
+    if unknown := value.keys() - hints.keys():
+        raise ValueError(f"Invalid JSON at {path}: unexpected keys {sorted(unknown)}")
+
+    required = getattr(type_, "__required_keys__", None)
+    if required is None:
+        required = {
+            field.name
+            for field in dataclasses.fields(type_)
+            if field.default is dataclasses.MISSING
+            and field.default_factory is dataclasses.MISSING
+        }
+    if missing := required - value.keys():
+        raise ValueError(f"Invalid JSON at {path}: missing keys {sorted(missing)}")
+
+    items = {k: _validate_json(hints[k], v, f"{path}.{k}") for k, v in value.items()}
+    if typing.is_typeddict(type_):
+        return FrozenDict(items)
+    return type_(**items)
+
+
+@dataclasses.dataclass(frozen=True)
+class JsonConverter:
+    """Parses a raw JSON value, and validates it against `type_`.
+
+    Parsed values are immutable, so that they can be shared by every loader
+    instance: objects become `FrozenDict`s, and arrays become tuples.
+    TypedDicts load as `FrozenDict`s too, and frozen dataclasses are
+    instantiated from objects with matching keys.
+    """
+
+    type_: typing.Any
+
+    def __post_init__(self):
+        _check_json_type(self.type_)
+
+    def __call__(self, value: str) -> typing.Any:
+        return _validate_json(self.type_, json.loads(value), "$")
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Every live cache, so that their locks can be replaced in forked children
+_CACHES: "weakref.WeakSet[ConverterCache]" = weakref.WeakSet()
+
+
+class ConverterCache:
+    """A thread-safe LRU cache of converter results, keyed on (converter, raw value).
+
+    Cached results are shared between every loader and instance using the
+    cache, so converters returning mutable values will also share them.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive; got {maxsize}")
+
+        self.maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._values: collections.OrderedDict[
+            tuple[_ConvertFunc, str], typing.Any
+        ] = collections.OrderedDict()
+        _CACHES.add(self)
+
+    def convert(self, convert: _ConvertFunc[T], value: str) -> T:
+        key = (convert, value)
+        with self._lock:
+            if key in self._values:
+                self._hits += 1
+                self._values.move_to_end(key)
+                return self._values[key]
+            self._misses += 1
+
+        result = convert(value)
+
+        with self._lock:
+            self._values[key] = result
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+        return result
+
+    def wrap(self, convert: _ConvertFunc[T]) -> _ConvertFunc[T]:
+        """Returns `convert` with its results stored in this cache."""
+
+        @functools.wraps(convert)
+        def cached_convert(value: str) -> T:
+            return self.convert(convert, value)
+
+        cached_convert.cache = self  # type: ignore[attr-defined]
+        return cached_convert
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._values))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = 0
+
+
+DEFAULT_CACHE = ConverterCache()
+JSON_CACHE = ConverterCache(maxsize=256)
+"""Shares parsed `Json[T]` values across every loader class and instance."""
+
+
+def _after_fork_in_child() -> None:
+    # A cache lock held by another thread at the time of the fork can never
+    # be released in the child, so every cache gets a new one
+    for cache in list(_CACHES):
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,31 +1,285 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+import functools
+import inspect
+import logging
 import os
+import threading
+import time
 import typing
-from collections.abc import Sequence
+import weakref
+from collections.abc import Iterable, Mapping, Sequence
 
+from typedenv import profiling
+from typedenv._codegen import create_load_fn
 from typedenv._internals import _MISSING
-from typedenv.annotations import get_annotated_args, get_unioned_with_none
-from typedenv.converters import Converter, ConverterDict, cast_to_bool
+from typedenv.annotations import (
+    Delimited,
+    JsonSpec,
+    Lazy,
+    Prefix,
+    get_annotated_args,
+    get_unioned_with_none,
+)
+from typedenv.converters import (
+    DEFAULT_CACHE,
+    JSON_CACHE,
+    Converter,
+    ConverterCache,
+    ConverterDict,
+    JsonConverter,
+    LookupConverter,
+    cast_to_bool,
+    create_collection_converter,
+)
+from typedenv.sources import EnvFile, Environ, MappingSource, Source, merge_sources
 
 _T = typing.TypeVar("_T", bound="EnvLoader")
+_logger = logging.getLogger("typedenv")
 _SINGLETONS: dict[type, typing.Any] = {}
+# The `time.monotonic()` after which the singleton of a class with a `ttl` expires
+_SINGLETON_DEADLINES: dict[type, float] = {}
+_SINGLETON_CLASSES: "weakref.WeakSet[type[EnvLoader]]" = weakref.WeakSet()
+_RELOAD_LOCK = threading.RLock()
+_BUILTIN_CONVERTERS: frozenset[typing.Callable] = frozenset(
+    (str, int, float, cast_to_bool)
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class EnvField:
+    """The resolved instructions for loading a single environment key.
+
+    Keys with a `prefix` hold a nested `EnvLoader`, loaded from every key of
+    the nested class under that prefix.
+    """
+
+    name: str
+    type_: typing.Any
+    nullable: bool
+    default: typing.Any
+    convert: typing.Callable[[str], typing.Any]
+    lazy: bool = False
+    is_async: bool = False
+    prefix: str | None = None
+
+    def resolve(self, value: str | None) -> typing.Any:
+        """Converts a raw value of the key, falling back to its default if unset."""
+        if value is not None and self.is_async:
+            raise TypeError(f"{self.name} has an async converter; load it with aload()")
+        elif value is not None:
+            return self.convert(value)
+        elif self.default is _MISSING:
+            raise ValueError(f"Missing environment variable: {self.name}")
+        elif self.default is None and not self.nullable:
+            raise ValueError(f"Cannot set {self.name} to None")
+        return self.default
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkLoad(typing.Generic[_T]):
+    """The instances created by `EnvLoader.load_many`, one per mapping in order.
+
+    Mappings that failed to load have None in `instances`, and the error of
+    every failing key in `errors`, keyed by the index of the mapping.
+    """
+
+    instances: list[_T | None]
+    errors: dict[int, dict[str, Exception]]
+
+    def column(self, name: str) -> list[typing.Any]:
+        """Returns the value of key `name` for every mapping, or None for failed mappings."""
+        return [
+            None if instance is None else getattr(instance, name)
+            for instance in self.instances
+        ]
+
+    def raise_errors(self) -> None:
+        """Raises the first error of the first failing mapping, if any mapping failed."""
+        for index, errors in self.errors.items():
+            name, error = next(iter(errors.items()))
+            raise ValueError(f"Mapping {index} failed to load {name}") from error
+
+
+class _FieldDescriptor:
+    """Stands in for a key on a loader class whose parent installed a frozen descriptor.
+
+    Class access returns the default of the key. Loaded values are kept in
+    the instance `__dict__`, which takes precedence over this (non-data)
+    descriptor. `declared` is the value the class itself assigned to the
+    key, if any, before the descriptor replaced it.
+    """
+
+    def __init__(self, field: EnvField, default: typing.Any, declared: typing.Any) -> None:
+        self.field = field
+        self.default = default
+        self.declared = declared
+
+    def __get__(self, instance: typing.Any, owner: type | None = None) -> typing.Any:
+        if instance is None and self.default is not _MISSING:
+            return self.default
+        raise AttributeError(self.field.name)
+
+
+class _LazyField(_FieldDescriptor):
+    """Converts the raw value of a lazy key on first access.
+
+    The converted value is cached in the instance `__dict__`, which takes
+    precedence over this (non-data) descriptor on every later access.
+    """
+
+    def __get__(self, instance: typing.Any, owner: type | None = None) -> typing.Any:
+        if instance is None:
+            return super().__get__(instance, owner)
+
+        raw_values = instance.__dict__.get("_env_lazy", {})
+        if self.field.name not in raw_values:
+            raise AttributeError(self.field.name)
+
+        value = self.field.convert(raw_values[self.field.name])
+        instance.__dict__[self.field.name] = value
+        raw_values.pop(self.field.name, None)
+        return value
+
+
+class _FrozenField:
+    """Rejects assignments to a key of a frozen loader class.
+
+    Loaders write values straight into the instance `__dict__`, bypassing
+    it. Class access returns the default of the key, and raises
+    `AttributeError` like a plain class attribute if there is none.
+    """
+
+    def __init__(self, field: EnvField, default: typing.Any, declared: typing.Any) -> None:
+        self.field = field
+        self.name = field.name
+        self.default = default
+        self.declared = declared
+
+    def __get__(self, instance: typing.Any, owner: type | None = None) -> typing.Any:
+        # Kept to a single lookup, as every read of the key goes through it
+        try:
+            return instance.__dict__[self.name]
+        except AttributeError:
+            # Class access, where `instance` is None
+            if instance is None and self.default is not _MISSING:
+                return self.default
+            raise AttributeError(self.name) from None
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, instance: typing.Any, value: typing.Any) -> None:
+        raise AttributeError(f"{self.field.name} is frozen and cannot be modified")
+
+    def __delete__(self, instance: typing.Any) -> None:
+        raise AttributeError(f"{self.field.name} is frozen and cannot be modified")
+
+
+class _FrozenLazyField(_FrozenField, _LazyField):
+    def __get__(self, instance: typing.Any, owner: type | None = None) -> typing.Any:
+        if instance is not None and self.field.name in instance.__dict__:
+            return instance.__dict__[self.field.name]
+        return _LazyField.__get__(self, instance, owner)
+
+
+def _frozen_slots_setattr(self: typing.Any, name: str, value: typing.Any) -> None:
+    # Slot descriptors of generated slots classes shadow the `_FrozenField`
+    # descriptors of the declared class, so frozen keys are checked here
+    if name in self._env_keys:
+        raise AttributeError(f"{name} is frozen and cannot be modified")
+    object.__setattr__(self, name, value)
+
+
+def _frozen_slots_delattr(self: typing.Any, name: str) -> None:
+    if name in self._env_keys:
+        raise AttributeError(f"{name} is frozen and cannot be modified")
+    object.__delattr__(self, name)
 
 
 class EnvLoader:
+    # Subclasses decide the layout of their instances
+    __slots__ = ()
+
     __frozen: typing.ClassVar[bool]
     __singleton: typing.ClassVar[bool]
+    __singleton_lock: typing.ClassVar[threading.Lock]
+    __refresh_lock: typing.ClassVar[threading.Lock]
+    __ttl: typing.ClassVar[float | None]
+    __on_refresh_error: typing.ClassVar[typing.Callable[[Exception], None] | None]
+    __on_fork: typing.ClassVar[typing.Literal["keep", "reset"]]
+    __compiled: typing.ClassVar[bool]
+    __lazy: typing.ClassVar[bool]
+    __cache: typing.ClassVar[ConverterCache | None]
+    __executor: typing.ClassVar[concurrent.futures.Executor | None]
+    __slots: typing.ClassVar[bool]
+    __uncacheable: typing.ClassVar[set[typing.Callable]]
+    __sources: typing.ClassVar[tuple[Source, ...]]
+    __last_inputs: typing.ClassVar[tuple[dict[str, str], dict[str, Source]] | None]
     __converters: typing.ClassVar[ConverterDict]
-    _env_keys: set[str]
+    __env_fields__: typing.ClassVar[tuple[EnvField, ...]]
+    __env_names__: typing.ClassVar[frozenset[str]]
+    __env_source_keys__: typing.ClassVar[frozenset[str]]
+    __env_groups__: typing.ClassVar[tuple[tuple[EnvField, tuple[tuple[str, str], ...]], ...]]
+    __env_load_fn__: typing.ClassVar[typing.Callable[..., None]]
+    __env_slots_class__: typing.ClassVar[type]
+    __env_slots_of__: typing.ClassVar[type | None] = None
+    __env_slot_names__: typing.ClassVar[frozenset[str]]
+    _env_keys: typing.ClassVar[frozenset[str]]
+    _env_sources: tuple[Source, ...]
+    _env_raw: dict[str, str]
+    _env_origins: dict[str, Source]
+
+    if typing.TYPE_CHECKING:
+        # Frozen keys are guarded by descriptors, so any other attribute can be
+        # set like on a plain object; this tells type checkers as much
+        def __setattr__(self, name: str, value: typing.Any) -> None: ...
 
     def __init_subclass__(
         cls,
         frozen: bool = True,
         singleton: bool = False,
         converters: Sequence[Converter] | None = None,
+        compiled: bool = False,
+        sources: Sequence[Source] | None = None,
+        lazy: bool = False,
+        cache: ConverterCache | bool = False,
+        on_fork: typing.Literal["keep", "reset"] = "keep",
+        executor: concurrent.futures.Executor | None = None,
+        slots: bool = False,
+        ttl: float | None = None,
+        on_refresh_error: typing.Callable[[Exception], None] | None = None,
         **kwargs,
     ) -> None:
+        if cls.__dict__.get("__env_slots_of__") is not None:
+            # Generated slots classes keep the options of the class they extend
+            return super().__init_subclass__(**kwargs)
+
+        if on_fork not in ("keep", "reset"):
+            raise ValueError(f"on_fork must be 'keep' or 'reset'; got {on_fork!r}")
+        if ttl is not None and not singleton:
+            raise ValueError("ttl can only be set on singleton classes")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive; got {ttl!r}")
+
         cls.__frozen = frozen
         cls.__singleton = singleton
+        cls.__singleton_lock = threading.Lock()
+        cls.__refresh_lock = threading.Lock()
+        cls.__ttl = ttl
+        cls.__on_refresh_error = on_refresh_error
+        cls.__on_fork = on_fork
+        if singleton:
+            _SINGLETON_CLASSES.add(cls)
+        cls.__compiled = compiled
+        cls.__executor = executor
+        cls.__lazy = lazy
+        cls.__slots = slots
+        cls.__sources = (Environ(),) if sources is None else tuple(sources)
+        cls.__last_inputs = None
+        cls.__cache = DEFAULT_CACHE if cache is True else (cache or None)
         cls.__converters = ConverterDict()
+        cls.__uncacheable = set()
 
         cls.__converters[str] = str
         cls.__converters[int] = int
@@ -35,40 +289,424 @@ class EnvLoader:
         if converters is not None:
             for converter in converters:
                 cls.__converters[converter.type_] = converter.convert
+                if not converter.cacheable:
+                    cls.__uncacheable.add(converter.convert)
 
         return super().__init_subclass__(**kwargs)
 
     def __new__(cls: type[_T], *args, **kwargs) -> _T:
         global _SINGLETONS
-        if cls.__singleton and cls in _SINGLETONS:
-            return _SINGLETONS[cls]
+        if not cls.__singleton:
+            instance = cls.__allocate(*args, **kwargs)
+            instance.__populate(cls.__sources)
+            return instance
+
+        # Hits are served without locking; only the first load is serialized
+        cached: _T | None
+        if (cached := _SINGLETONS.get(cls)) is not None:
+            if cls.__ttl is not None and time.monotonic() >= _SINGLETON_DEADLINES[cls]:
+                return cls.__refresh(cached)
+            if profiling.ENABLED:
+                profiling.record(profiling.LoadStats(cls, 0, singleton_hit=True))
+            return cached
+
+        with cls.__singleton_lock:
+            if (cached := _SINGLETONS.get(cls)) is not None:
+                return cached
+
+            instance = cls.__allocate(*args, **kwargs)
+            instance.__populate(cls.__sources)
+            return cls.__register_singleton(instance)
+
+    @classmethod
+    def __register_singleton(cls: type[_T], instance: _T) -> _T:
+        """Caches `instance` as the singleton unless one already is, and returns the cached one."""
+        if cls.__ttl is not None and cls not in _SINGLETONS:
+            # Set before the instance is visible, so hits always find a deadline
+            _SINGLETON_DEADLINES[cls] = time.monotonic() + cls.__ttl
+        return _SINGLETONS.setdefault(cls, instance)
+
+    @classmethod
+    def __refresh(cls: type[_T], stale: _T) -> _T:
+        """Replaces the expired singleton with a new load, and returns the instance to serve.
+
+        Only one caller refreshes at a time; everyone else is served the stale
+        instance meanwhile. If the load fails, the stale instance is kept for
+        another `ttl` and the error is reported.
+        """
+        if not cls.__refresh_lock.acquire(blocking=False):
+            return stale
+
+        try:
+            if (current := _SINGLETONS.get(cls)) is not stale:
+                # Refreshed by another caller since it was read
+                return current or stale
+
+            instance = cls.__allocate()
+            instance.__populate(cls.__sources)
+        except Exception as e:
+            cls.__refresh_failed(e)
+            return stale
+        else:
+            cls.__refreshed(instance)
+            return instance
+        finally:
+            cls.__refresh_lock.release()
+
+    @classmethod
+    def __refreshed(cls, instance: "EnvLoader") -> None:
+        assert cls.__ttl is not None
+        _SINGLETON_DEADLINES[cls] = time.monotonic() + cls.__ttl
+        _SINGLETONS[cls] = instance
+
+    @classmethod
+    def __refresh_failed(cls, error: Exception) -> None:
+        assert cls.__ttl is not None
+        _SINGLETON_DEADLINES[cls] = time.monotonic() + cls.__ttl
+        if cls.__on_refresh_error is None:
+            _logger.error("Failed to refresh %s", cls.__name__, exc_info=error)
+        else:
+            cls.__on_refresh_error(error)
+
+    @classmethod
+    def __allocate(cls: type[_T], *args, **kwargs) -> _T:
+        """Creates an empty instance, of the generated slots class if the class uses slots."""
+        target = cls
+        if cls.__slots:
+            cls._resolve_env_fields()
+            target = cls.__dict__["__env_slots_class__"]
+        return super(EnvLoader, target).__new__(target, *args, **kwargs)
+
+    @classmethod
+    def _env_class(cls) -> type["EnvLoader"]:
+        """Returns the declared loader class, even when called on its generated slots class."""
+        return cls.__env_slots_of__ or cls
+
+    @classmethod
+    def _env_class_sources(cls) -> tuple[Source, ...]:
+        return cls.__sources
+
+    @classmethod
+    def _env_converters(cls) -> ConverterDict:
+        return cls.__converters
+
+    @classmethod
+    def _restore(
+        cls: type[_T],
+        values: dict[str, typing.Any],
+        environ: dict[str, str],
+        env_origins: dict[str, Source],
+        replace: bool = False,
+        sources: tuple[Source, ...] | None = None,
+    ) -> _T:
+        """Creates an instance from already converted values, without resolving the load plan.
+
+        For singleton classes, an instance that has already been loaded is
+        returned instead, unless `replace` is set to make the new instance
+        the singleton. Instances restored with explicit `sources` are never the
+        singleton, like those of `from_sources`.
+        """
+        global _SINGLETONS
+        if "__env_fields__" not in cls.__dict__:
+            cls.__guard_restored_keys(values)
+
+        instance = cls.__allocate()
+        instance.__store(values)
+        instance.__store(
+            {
+                "_env_sources": cls.__sources if sources is None else sources,
+                "_env_raw": environ,
+                "_env_origins": env_origins,
+            }
+        )
 
-        instance = super().__new__(cls, *args, **kwargs)
-        instance._env_keys = set()
-        instance.__load_env__()
+        if cls.__singleton and sources is None:
+            with cls.__singleton_lock:
+                if replace:
+                    _SINGLETONS.pop(cls, None)
+                instance = cls.__register_singleton(instance)
+
+        return instance
+
+    @classmethod
+    async def aload(cls: type[_T], *, limit: int | None = None) -> _T:
+        """Creates an instance from the class sources, awaiting async converters.
+
+        All keys with async converters are converted concurrently, with at most
+        `limit` conversions running at once if given. Sync converters are called
+        as usual. For singleton classes, the cached instance is returned if
+        it has already been loaded, and refreshed like on instantiation once
+        its `ttl` has expired.
+        """
+        global _SINGLETONS
+        if cls.__singleton and (stale := _SINGLETONS.get(cls)) is not None:
+            if cls.__ttl is None or time.monotonic() < _SINGLETON_DEADLINES[cls]:
+                return stale
+            elif not cls.__refresh_lock.acquire(blocking=False):
+                # Another caller is refreshing
+                return stale
+
+            try:
+                instance = cls.__allocate()
+                instance.__populate(cls.__sources, skip_async=True)
+                await instance.__aload_env__(limit)
+            except Exception as e:
+                cls.__refresh_failed(e)
+                return stale
+            else:
+                cls.__refreshed(instance)
+                return instance
+            finally:
+                cls.__refresh_lock.release()
+
+        instance = cls.__allocate()
+        instance.__populate(cls.__sources, skip_async=True)
+        await instance.__aload_env__(limit)
 
         if cls.__singleton:
-            _SINGLETONS[cls] = instance
+            # Concurrent loads can race while awaiting; the first one wins
+            instance = cls.__register_singleton(instance)
+
+        return instance
+
+    async def __aload_env__(self, limit: int | None) -> None:
+        semaphore = asyncio.Semaphore(limit) if limit else None
+
+        async def convert(field: EnvField, value: str) -> typing.Any:
+            if semaphore is None:
+                return await field.convert(value)
+            async with semaphore:
+                return await field.convert(value)
+
+        pending = [
+            field
+            for field in self._resolve_env_fields()
+            if field.is_async and self._env_raw.get(field.name) is not None
+        ]
+        results = await asyncio.gather(
+            *(convert(field, self._env_raw[field.name]) for field in pending),
+            return_exceptions=True,
+        )
+
+        # Raise the error of the first failing key in declaration order
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        self.__store({field.name: result for field, result in zip(pending, results)})
+
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        cls.__singleton_lock = threading.Lock()
+        cls.__refresh_lock = threading.Lock()
+        if cls.__on_fork == "reset":
+            _SINGLETONS.pop(cls, None)
 
+    @classmethod
+    def from_sources(cls: type[_T], sources: Sequence[Source]) -> _T:
+        """Creates a new instance loaded from `sources` instead of the class sources.
+
+        Sources are ordered from highest to lowest precedence. The instance is
+        never cached, even for singleton classes.
+        """
+        instance = cls.__allocate()
+        instance.__populate(tuple(sources))
         return instance
 
-    def __load_env__(self) -> None:
+    @classmethod
+    def from_mapping(cls: type[_T], mapping: Mapping[str, str]) -> _T:
+        """Creates a new instance loaded from `mapping` instead of the class sources."""
+        return cls.from_sources([MappingSource(mapping)])
+
+    @classmethod
+    def load_many(
+        cls: type[_T], mappings: Iterable[Mapping[str, str]], *, eager: bool = False
+    ) -> BulkLoad[_T]:
+        """Creates an instance from each of `mappings`, converting one key at a time.
+
+        The load plan is resolved once, then each key is converted for every
+        mapping before moving on to the next key. A failing key does not stop
+        the load; its error is collected and the mapping is left out.
+
+        Lazy keys are still converted on first access, so their errors are
+        only collected if `eager` is set to convert them with the other keys.
+        """
+        env_fields = cls._resolve_env_fields()
+        sources = [(MappingSource(mapping),) for mapping in mappings]
+        merged = [merge_sources(source, cls.__env_source_keys__) for source in sources]
+        environs = [cls.__group_environ(environ) for environ, _ in merged]
+
+        rows: list[dict[str, typing.Any]] = [{} for _ in environs]
+        lazy_rows: list[dict[str, str]] = [{} for _ in environs]
+        errors: dict[int, dict[str, Exception]] = {}
+        for field in env_fields:
+            name, lazy, resolve = field.name, field.lazy and not eager, field.resolve
+            for index, environ in enumerate(environs):
+                value = environ.get(name)
+                if value is not None and lazy:
+                    lazy_rows[index][name] = value
+                    continue
+                try:
+                    rows[index][name] = resolve(value)
+                except Exception as e:
+                    errors.setdefault(index, {})[name] = e
+
+        instances: list[_T | None] = []
+        for index, (source, (environ, env_origins)) in enumerate(zip(sources, merged)):
+            if index in errors:
+                instances.append(None)
+                continue
+
+            instance = cls.__allocate()
+            object.__setattr__(instance, "_env_sources", source)
+            object.__setattr__(instance, "_env_raw", environ)
+            object.__setattr__(instance, "_env_origins", env_origins)
+            instance.__store(rows[index], lazy_rows[index])
+            instances.append(instance)
+
+        return BulkLoad(instances, errors)
+
+    @classmethod
+    def from_env_file(
+        cls: type[_T], path: str | os.PathLike[str], encoding: str = "utf-8"
+    ) -> _T:
+        """Creates a new instance loaded from a `.env` file instead of the class sources.
+
+        Only the keys declared on the class are read from the file.
+        """
+        return cls.from_sources([EnvFile(path, encoding=encoding)])
+
+    def __populate(self, sources: tuple[Source, ...], skip_async: bool = False) -> None:
+        if profiling.ENABLED and not skip_async:
+            return self.__populate_profiled(sources)
+
+        self._resolve_env_fields()
+        environ, env_origins = self.__share_inputs(
+            *merge_sources(sources, self.__env_source_keys__)
+        )
+        object.__setattr__(self, "_env_sources", sources)
+        object.__setattr__(self, "_env_raw", environ)
+        object.__setattr__(self, "_env_origins", env_origins)
+
+        environ = self.__group_environ(environ)
+        if self.__compiled and not skip_async and not self.__executor:
+            self.__compile_load_fn()(self, environ.get)
+        else:
+            self.__load_env__(environ, skip_async)
+
+    def __populate_profiled(self, sources: tuple[Source, ...]) -> None:
+        """Loads the instance like `__populate`, timing the lookup and conversion of every key.
+
+        Profiled loads always run one key at a time through the generic loader.
+        """
+        start = time.perf_counter_ns()
+        env_fields = self._resolve_env_fields()
+        environ, env_origins = self.__share_inputs(
+            *merge_sources(sources, self.__env_source_keys__)
+        )
+        object.__setattr__(self, "_env_sources", sources)
+        object.__setattr__(self, "_env_raw", environ)
+        object.__setattr__(self, "_env_origins", env_origins)
+
+        environ = self.__group_environ(environ)
+        sources_ns = time.perf_counter_ns() - start
+
+        values: dict[str, typing.Any] = {}
+        lazy_values: dict[str, str] = {}
+        field_stats: list[profiling.FieldStats] = []
+        for field in env_fields:
+            lookup_start = time.perf_counter_ns()
+            value = environ.get(field.name)
+            convert_start = time.perf_counter_ns()
+
+            cache: ConverterCache | None = getattr(field.convert, "cache", None)
+            hits = cache.cache_info().hits if cache else 0
+
+            if value is not None and field.lazy:
+                lazy_values[field.name] = value
+            else:
+                values[field.name] = field.resolve(value)
+            convert_end = time.perf_counter_ns()
+
+            cache_hit = None
+            if cache and value is not None and not field.lazy:
+                cache_hit = cache.cache_info().hits > hits
+
+            field_stats.append(
+                profiling.FieldStats(
+                    name=field.name,
+                    source=env_origins.get(field.name),
+                    lookup_ns=convert_start - lookup_start,
+                    convert_ns=convert_end - convert_start,
+                    cache_hit=cache_hit,
+                )
+            )
+
+        self.__store(values, lazy_values)
+        profiling.record(
+            profiling.LoadStats(
+                cls=self._env_class(),
+                total_ns=time.perf_counter_ns() - start,
+                sources_ns=sources_ns,
+                fields=tuple(field_stats),
+            )
+        )
+
+    @classmethod
+    def _resolve_env_fields(cls) -> tuple[EnvField, ...]:
+        """Returns the load plan of the class, building it on first use.
+
+        The plan is stored in the class' own namespace, so every subclass
+        resolves its own annotations and defaults instead of inheriting
+        the plan of its parent.
+        """
+        if "__env_fields__" in cls.__dict__:
+            return cls.__env_fields__
+
+        env_fields: list[EnvField] = []
         for env_name, cast_type in typing.get_type_hints(
-            type(self), include_extras=True
+            cls, include_extras=True
         ).items():
             if not env_name.isupper():
                 continue
 
-            default: typing.Literal[_MISSING] | str | typing.Any | None = _MISSING
+            default: typing.Literal[_MISSING] | typing.Any | None = _MISSING
+            class_default = getattr(cls, env_name, _MISSING)
             bespoke_cvtr: Converter | None = None
+            delimited: Delimited | None = None
+            json_spec: JsonSpec | None = None
+            prefix: Prefix | None = None
+            group_prefix: str | None = None
+            is_lazy = cls.__lazy
+
+            # The metadata of a nullable annotated type, such as `Json[T] | None`,
+            # applies to the key as if it was spelled `Annotated[T | None, ...]`
+            unioned_type = get_unioned_with_none(cast_type)
+            if unioned_type is not None and (
+                inner_args := get_annotated_args(unioned_type)
+            ) is not None:
+                inner_type, *inner_metadata = inner_args
+                cast_type = typing.Annotated[(inner_type | None, *inner_metadata)]
 
             annotated_args = get_annotated_args(cast_type)
             if annotated_args is not None:
                 cast_type, *metadata_args = annotated_args
                 for metadata in metadata_args:
-                    if isinstance(metadata, Converter):
+                    if isinstance(metadata, Converter) and bespoke_cvtr is None:
                         bespoke_cvtr = metadata
-                        break
+                    elif metadata is Lazy:
+                        is_lazy = True
+                    elif isinstance(metadata, Lazy):
+                        is_lazy = metadata.enabled
+                    elif isinstance(metadata, Delimited):
+                        delimited = metadata
+                    elif isinstance(metadata, Prefix):
+                        prefix = metadata
+                    elif isinstance(metadata, JsonSpec):
+                        # JSON is parsed on first access, unless a later
+                        # `Lazy(False)` forces it to load eagerly
+                        json_spec = metadata
+                        is_lazy = True
 
             unioned_type = get_unioned_with_none(cast_type)
             if is_nullable := unioned_type is not None:
@@ -80,30 +718,398 @@ class EnvLoader:
                     f"expected Converter for {env_name} to return {cast_type}; got {bespoke_cvtr.type_} instead"
                 )
 
-            if bespoke_cvtr is None and cast_type not in self.__converters:
+            if bespoke_cvtr:
+                convert = bespoke_cvtr.convert
+                is_cacheable = bespoke_cvtr.cacheable
+            elif json_spec:
+                # Parsed values are immutable, and always shared through
+                # the JSON cache, whether or not the class has a cache
+                convert = JSON_CACHE.wrap(JsonConverter(json_spec.type_))
+                is_cacheable = False
+            elif (resolved := cls.__converters.resolve(cast_type)) is not None:
+                convert = resolved
+                is_cacheable = convert not in cls.__uncacheable and not isinstance(
+                    convert, LookupConverter
+                )
+            elif isinstance(cast_type, type) and issubclass(cast_type, EnvLoader):
+                # The nested class resolves its own plan once, however many
+                # keys of other classes it is nested under
+                cast_type._resolve_env_fields()
+                group_prefix = prefix.prefix if prefix else f"{env_name}_"
+                convert = functools.partial(_load_group, cast_type, group_prefix)
+                is_cacheable = False
+            elif collection := create_collection_converter(
+                cast_type, cls.__converters, delimited, cls.__uncacheable
+            ):
+                # Mutable collections must not be shared through the cache
+                convert, is_cacheable = collection
+            else:
                 raise TypeError(f"Unsupported type: {cast_type}")
 
-            convert = (
-                bespoke_cvtr.convert if bespoke_cvtr else self.__converters[cast_type]
+            if prefix and group_prefix is None:
+                raise TypeError(f"Prefix of {env_name} requires an EnvLoader type; got {cast_type}")
+
+            # Async results must be awaited on every load, so they are neither
+            # cached nor deferred to attribute access
+            if is_async := inspect.iscoroutinefunction(convert):
+                is_cacheable = is_lazy = False
+
+            # Built-in conversions are cheaper than a cache lookup
+            if cls.__cache and is_cacheable and convert not in _BUILTIN_CONVERTERS:
+                convert = cls.__cache.wrap(convert)
+
+            env_fields.append(
+                EnvField(
+                    name=env_name,
+                    type_=cast_type,
+                    nullable=is_nullable,
+                    default=default if class_default is _MISSING else class_default,
+                    convert=convert,
+                    lazy=is_lazy,
+                    is_async=is_async,
+                    prefix=group_prefix,
+                )
+            )
+
+        for field in env_fields:
+            cls.__install_descriptor(field)
+
+        groups = []
+        source_keys = {field.name for field in env_fields if field.prefix is None}
+        for field in env_fields:
+            if field.prefix is not None:
+                keys = tuple(
+                    (key, field.prefix + key)
+                    for key in sorted(field.type_.__env_source_keys__)
+                )
+                groups.append((field, keys))
+                source_keys.update(prefixed for _, prefixed in keys)
+
+        cls.__env_groups__ = tuple(groups)
+        cls.__env_source_keys__ = frozenset(source_keys)
+        cls.__env_names__ = cls._env_keys = frozenset(field.name for field in env_fields)
+        cls.__env_fields__ = tuple(env_fields)
+        if cls.__slots:
+            cls.__env_slots_class__ = cls.__create_slots_class()
+        return cls.__env_fields__
+
+    @classmethod
+    def __group_environ(cls, environ: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        """Adds the raw values of every nested key to the merged source values.
+
+        The raw value of a nested key is a tuple of the (unprefixed) keys and
+        values of the nested class that are set, or None if none are set and
+        the key is nullable.
+        """
+        if not cls.__env_groups__:
+            return environ
+
+        environ = dict(environ)
+        for field, keys in cls.__env_groups__:
+            items = tuple(
+                (key, value)
+                for key, prefixed in keys
+                if (value := environ.get(prefixed)) is not None
+            )
+            environ[field.name] = None if not items and field.nullable else items
+        return environ
+
+    @classmethod
+    def __install_descriptor(cls, field: EnvField) -> None:
+        """Installs the descriptor that implements laziness and frozenness of a key."""
+        declared = cls.__dict__.get(field.name, _MISSING)
+        if isinstance(declared, (_FieldDescriptor, _FrozenField)):
+            # The plan is being resolved again
+            declared = declared.declared
+
+        default = declared
+        if default is _MISSING:
+            default = getattr(cls, field.name, _MISSING)
+
+        descriptor: _FieldDescriptor | _FrozenField
+        if cls.__frozen and field.lazy:
+            descriptor = _FrozenLazyField(field, default, declared)
+        elif field.lazy:
+            descriptor = _LazyField(field, default, declared)
+        elif cls.__frozen:
+            descriptor = _FrozenField(field, default, declared)
+        elif declared is _MISSING and cls.__has_frozen_parent():
+            # Unfrozen subclasses must not inherit the frozen descriptors that
+            # their parents install, whether or not they have done so yet
+            descriptor = _FieldDescriptor(field, default, declared)
+        else:
+            return
+
+        setattr(cls, field.name, descriptor)
+
+    @classmethod
+    def __guard_restored_keys(cls, names: Iterable[str]) -> None:
+        """Installs the descriptors of keys restored before the load plan was resolved.
+
+        Without type hints, no key is known to be lazy, so each key gets the
+        descriptor of an eager key. Resolving the plan later replaces them.
+        """
+        for name in names:
+            if not isinstance(cls.__dict__.get(name), (_FieldDescriptor, _FrozenField)):
+                cls.__install_descriptor(
+                    EnvField(name, typing.Any, nullable=False, default=_MISSING, convert=str)
+                )
+
+    @classmethod
+    def __has_frozen_parent(cls) -> bool:
+        return any(
+            klass.__frozen
+            for klass in cls.__mro__[1:]
+            if issubclass(klass, EnvLoader) and klass is not EnvLoader
+        )
+
+    @classmethod
+    def __share_inputs(
+        cls, environ: dict[str, str], env_origins: dict[str, Source]
+    ) -> tuple[dict[str, str], dict[str, Source]]:
+        """Returns the raw values and origins of a load, reusing those of the last load if equal.
+
+        Instances loaded from unchanged sources then share a single copy of
+        them, which is never mutated, rather than holding one each.
+        """
+        last = cls.__last_inputs
+        if last is not None and last[0] == environ and last[1] == env_origins:
+            return last
+        cls.__last_inputs = (environ, env_origins)
+        return environ, env_origins
+
+    @classmethod
+    def __create_slots_class(cls) -> type:
+        """Generates the subclass that instances of a `slots=True` class are created from.
+
+        Every key except lazy ones is stored in a slot, and the key set is
+        shared by all instances as a frozenset. Lazy keys are left out so
+        their descriptors on the class stay reachable.
+        """
+        slots = (
+            *(field.name for field in cls.__env_fields__ if not field.lazy),
+            "_env_sources",
+            "_env_raw",
+            "_env_origins",
+        )
+        namespace: dict[str, typing.Any] = {
+            "__slots__": slots,
+            "__env_slot_names__": frozenset(slots),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "__env_slots_of__": cls,
+            "__env_fields__": cls.__env_fields__,
+            "__env_names__": cls.__env_names__,
+        }
+        if cls.__frozen:
+            namespace["__setattr__"] = _frozen_slots_setattr
+            namespace["__delattr__"] = _frozen_slots_delattr
+        metaclass: type = type(cls)
+        return metaclass(cls.__name__, (cls,), namespace)
+
+    @classmethod
+    def __compile_load_fn(cls) -> typing.Callable[..., None]:
+        if "__env_load_fn__" not in cls.__dict__:
+            slots_class = cls if cls.__env_slots_of__ is not None else None
+            cls.__env_load_fn__ = create_load_fn(cls._resolve_env_fields(), slots_class)
+        return cls.__env_load_fn__
+
+    def __load_env__(self, environ: Mapping[str, str], skip_async: bool = False) -> None:
+        values: dict[str, typing.Any] = {}
+        lazy_values: dict[str, str] = {}
+        futures = self.__submit_conversions(environ) if self.__executor else {}
+
+        try:
+            for field in self._resolve_env_fields():
+                value = environ.get(field.name)
+
+                if value is not None and field.is_async and skip_async:
+                    # Converted and set by `__aload_env__`
+                    continue
+                elif value is not None and field.lazy:
+                    lazy_values[field.name] = value
+                elif field.name in futures:
+                    values[field.name] = futures.pop(field.name).result()
+                else:
+                    values[field.name] = field.resolve(value)
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+        self.__store(values, lazy_values)
+
+    def __store(
+        self, values: Mapping[str, typing.Any], lazy_values: dict[str, str] | None = None
+    ) -> None:
+        """Writes loaded values to the instance, bypassing the frozen check.
+
+        Instances of generated slots classes store values in their slots;
+        everything else, including lazy keys that fell back to their default,
+        goes to `__dict__`.
+        """
+        if type(self).__env_slots_of__ is None:
+            self.__dict__.update(values)
+        else:
+            slot_names = type(self).__env_slot_names__
+            for name, value in values.items():
+                if name in slot_names:
+                    object.__setattr__(self, name, value)
+                else:
+                    self.__dict__[name] = value
+
+        if lazy_values:
+            # Lazy keys have no slot, so the descriptor on the class is reachable
+            self.__dict__["_env_lazy"] = lazy_values
+
+    def __submit_conversions(
+        self, environ: Mapping[str, str]
+    ) -> dict[str, concurrent.futures.Future]:
+        """Starts converting every key with a custom sync converter on the class executor.
+
+        Built-in conversions are cheaper than a round trip through the
+        executor, so they are left to run inline. So are nested groups, whose
+        loads may submit to the same executor and must not wait on it from
+        one of its own workers.
+        """
+        assert self.__executor is not None
+
+        futures: dict[str, concurrent.futures.Future] = {}
+        for field in self._resolve_env_fields():
+            value = environ.get(field.name)
+            if (
+                value is None
+                or field.lazy
+                or field.is_async
+                or field.prefix is not None
+                or field.convert in _BUILTIN_CONVERTERS
+            ):
+                continue
+            futures[field.name] = self.__executor.submit(field.convert, value)
+
+        return futures
+
+    def reload(self) -> frozenset[str]:
+        """Reloads the instance in place from the sources it was loaded from.
+
+        Only keys whose raw values changed since the last load are converted
+        again. If any of them fails to load, the instance is left unchanged.
+        Otherwise the new values are swapped in together, every callback
+        registered with `on_reload` is called, and the changed keys are returned.
+        """
+        with _RELOAD_LOCK:
+            environ, env_origins = self.__share_inputs(
+                *merge_sources(self._env_sources, self.__env_source_keys__)
+            )
+            raw_environ = environ
+            environ = self.__group_environ(environ)
+            previous = self.__group_environ(self._env_raw)
+
+            values: dict[str, typing.Any] = {}
+            lazy_values: dict[str, str] = {}
+            for field in self._resolve_env_fields():
+                value = environ.get(field.name)
+                if value == previous.get(field.name):
+                    continue
+
+                if value is not None and field.lazy:
+                    lazy_values[field.name] = value
+                else:
+                    values[field.name] = field.resolve(value)
+
+            changed = frozenset(values.keys() | lazy_values.keys())
+            if lazy_values:
+                pending = self.__dict__.setdefault("_env_lazy", {})
+                pending.update(lazy_values)
+                for name in lazy_values:
+                    self.__dict__.pop(name, None)
+
+            self.__store(
+                {**values, "_env_raw": raw_environ, "_env_origins": env_origins}
             )
-            default = getattr(self, env_name, default)
-            value = os.getenv(env_name, default)
+            callbacks = list(self.__dict__.get("_env_reload_callbacks", ()))
+
+        if changed:
+            for callback in callbacks:
+                callback(self, changed)
+
+        return changed
+
+    def on_reload(
+        self, callback: typing.Callable[[typing.Any, frozenset[str]], None]
+    ) -> None:
+        """Registers `callback(instance, changed_keys)` to run after each reload that changes keys."""
+        self.__dict__.setdefault("_env_reload_callbacks", []).append(callback)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Pickles the converted values of the instance, to be restored without loading it again.
+
+        Unpickled instances are never the singleton of their class. Only the
+        loaded keys, raw values and origins are kept; reload callbacks are not.
+        """
+        cls = type(self)._env_class()
+        values = {
+            # Read through `getattr` so that lazy keys get converted
+            field.name: getattr(self, field.name)
+            for field in self._resolve_env_fields()
+        }
+        sources = self._env_sources
+        if sources is cls._env_class_sources():
+            # Stored as indexes, so that the instance is restored with the
+            # class sources of the unpickling process
+            origins = {
+                name: sources.index(source)
+                for name, source in self._env_origins.items()
+            }
+            return (_unpickle, (cls, values, self._env_raw, origins))
+        return (_unpickle, (cls, values, self._env_raw, self._env_origins, sources))
+
+
+def _unpickle(
+    cls: type[_T],
+    values: dict[str, typing.Any],
+    environ: dict[str, str],
+    env_origins: dict[str, typing.Any],
+    sources: tuple[Source, ...] | None = None,
+) -> _T:
+    if sources is None:
+        sources = cls._env_class_sources()
+        env_origins = {name: sources[i] for name, i in env_origins.items()}
+    return cls._restore(values, environ, env_origins, sources=sources)
+
+
+def _load_group(cls: type[_T], prefix: str, items: tuple[tuple[str, str], ...]) -> _T:
+    try:
+        return cls.from_sources([MappingSource(dict(items))])
+    except ValueError as e:
+        raise ValueError(f"{e} (nested under {prefix!r})") from e
+
+
+def _after_fork_in_child() -> None:
+    global _RELOAD_LOCK
+    # Locks held by other threads at the time of the fork can never be
+    # released in the child, so they are replaced rather than reused.
+    _RELOAD_LOCK = threading.RLock()
+    for cls in list(_SINGLETON_CLASSES):
+        cls._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
 
-            if value is _MISSING:
-                raise ValueError(f"Missing environment variable: {env_name}")
-            elif isinstance(value, str) and value != default:
-                value = convert(value)
-            elif value is None and not is_nullable:
-                raise ValueError(f"Cannot set {env_name} to None")
 
-            setattr(self, env_name, value)
-            self._env_keys.add(env_name)
+def fields(loader: EnvLoader | type[EnvLoader]) -> tuple[EnvField, ...]:
+    """Returns the resolved `EnvField` load plan for an `EnvLoader` class or instance."""
+    cls = loader if isinstance(loader, type) else type(loader)
+    return cls._resolve_env_fields()
 
-    def __setattr__(self, name: str, value: typing.Any) -> None:
-        if name == f"_env_keys" and getattr(self, "_env_keys", None) is None:
-            return object.__setattr__(self, name, value)
 
-        if self.__frozen and name in self._env_keys:
-            raise AttributeError(f"{name} is frozen and cannot be modified")
+def origins(loader: EnvLoader) -> dict[str, Source | None]:
+    """Returns the source each key of a loaded `EnvLoader` instance was read from.
 
-        return super().__setattr__(name, value)
+    Keys that fell back to their class default map to `None`.
+    """
+    return {
+        field.name: loader._env_origins.get(field.name)
+        for field in loader._resolve_env_fields()
+    }
@@ -0,0 +1,111 @@
+import dataclasses
+import os
+import threading
+import typing
+import weakref
+
+from typedenv.sources import Source
+
+ENABLED = False
+"""Whether loads are being profiled. Loaders only time their work while set."""
+
+_HOOKS: list[typing.Callable[["LoadStats"], None]] = []
+_REGISTRY: "weakref.WeakKeyDictionary[type, ClassStats]" = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldStats:
+    """The timings of a single key of a profiled load.
+
+    `source` is None for keys that fell back to their default, and `cache_hit`
+    is None for keys whose converter does not use a `ConverterCache`.
+    """
+
+    name: str
+    source: Source | None
+    lookup_ns: int
+    convert_ns: int
+    cache_hit: bool | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadStats:
+    cls: type
+    total_ns: int
+    sources_ns: int = 0
+    fields: tuple[FieldStats, ...] = ()
+    singleton_hit: bool = False
+
+
+@dataclasses.dataclass
+class ClassStats:
+    loads: int = 0
+    singleton_hits: int = 0
+    total_ns: int = 0
+    last: LoadStats | None = None
+
+
+def enable() -> None:
+    """Starts profiling loads, recording them in the registry."""
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stops profiling loads. Has no effect while hooks are registered."""
+    global ENABLED
+    ENABLED = bool(_HOOKS)
+
+
+def add_hook(hook: typing.Callable[[LoadStats], None]) -> None:
+    """Registers `hook` to be called with the `LoadStats` of every load, and enables profiling."""
+    global ENABLED
+    with _LOCK:
+        _HOOKS.append(hook)
+        ENABLED = True
+
+
+def remove_hook(hook: typing.Callable[[LoadStats], None]) -> None:
+    """Unregisters `hook`. Profiling is disabled once no hooks remain."""
+    global ENABLED
+    with _LOCK:
+        _HOOKS.remove(hook)
+        ENABLED = bool(_HOOKS)
+
+
+def registry() -> dict[type, ClassStats]:
+    """Returns the profiled stats of every loader class loaded while profiling."""
+    with _LOCK:
+        return {cls: dataclasses.replace(stats) for cls, stats in _REGISTRY.items()}
+
+
+def clear() -> None:
+    with _LOCK:
+        _REGISTRY.clear()
+
+
+def record(stats: LoadStats) -> None:
+    """Adds the stats of a load to the registry, and passes them to every hook."""
+    with _LOCK:
+        class_stats = _REGISTRY.setdefault(stats.cls, ClassStats())
+        if stats.singleton_hit:
+            class_stats.singleton_hits += 1
+        else:
+            class_stats.loads += 1
+            class_stats.total_ns += stats.total_ns
+            class_stats.last = stats
+        hooks = list(_HOOKS)
+
+    for hook in hooks:
+        hook(stats)
+
+
+def _after_fork_in_child() -> None:
+    global _LOCK
+    # The lock may have been held by another thread at the time of the fork
+    _LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
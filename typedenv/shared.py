@@ -0,0 +1,205 @@
+"""Converted `EnvLoader` instances shared between processes through shared memory.
+
+A parent process, such as the arbiter of a pre-forked server, loads a class
+once and publishes the converted instance. Worker processes attach to the
+published instance by name, and only unpickle it again when a new version
+has been published since they last read it:
+
+    # In the parent, before forking
+    published = shared.publish(Config())
+
+    # In each worker, whenever the latest values are needed
+    config = shared.attach(Config, published.name).get()
+
+Values are pickled, so only attach to shared memory published by processes
+you trust.
+"""
+
+import pickle
+import struct
+import sys
+import threading
+import time
+import typing
+from multiprocessing import shared_memory
+
+from typedenv.loader import EnvLoader
+from typedenv.snapshot import _dump_values, _load_values, schema_key
+
+_T = typing.TypeVar("_T", bound=EnvLoader)
+
+# The header holds the version counter, then the length of the payload after it.
+# The counter is odd while a payload is being written (a sequence lock), so
+# readers can detect, and retry, reads that overlap with a write.
+_HEADER = struct.Struct("QQ")
+_MIN_SIZE = 64 * 1024
+# Readers waiting for a write to finish sleep for exponentially longer, up to this long
+_MAX_BACKOFF = 0.01
+
+
+def _dumps(instance: EnvLoader) -> bytes:
+    return pickle.dumps(
+        {**_dump_values(instance), "raw": instance._env_raw},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+class SharedLoader(typing.Generic[_T]):
+    """An instance of a loader class published in a shared memory block.
+
+    Created by `publish` in the process that loads the class, and by `attach`
+    in the processes that read it.
+    """
+
+    def __init__(self, cls: type[_T], memory: shared_memory.SharedMemory) -> None:
+        self.cls = cls
+        self._memory = memory
+        self._schema = schema_key(cls)
+        self._lock = threading.Lock()
+        self._counter = -1
+        self._instance: _T | None = None
+
+    @property
+    def name(self) -> str:
+        """The name that other processes attach to the shared memory block by."""
+        return self._memory.name
+
+    @property
+    def version(self) -> int:
+        """The number of instances published so far."""
+        counter, _ = _HEADER.unpack_from(self._buf)
+        return counter // 2
+
+    @property
+    def _buf(self) -> memoryview:
+        buf = self._memory.buf
+        if buf is None:
+            raise ValueError(f"{self.name} has been closed")
+        return buf
+
+    def publish(self, instance: _T) -> None:
+        """Publishes a new version of the instance, replacing the current one.
+
+        Only instances loaded from the sources of their class can be
+        published. Publishing is serialized within a process, but only a
+        single process should publish to a block.
+        """
+        if type(instance)._env_class() is not self.cls:
+            raise TypeError(f"Expected an instance of {self.cls.__name__}")
+
+        payload = _dumps(instance)
+        buf = self._buf
+        if _HEADER.size + len(payload) > len(buf):
+            raise ValueError(
+                f"The instance needs {_HEADER.size + len(payload)} bytes, but "
+                f"{self.name} only has {len(buf)}; publish it with a larger size"
+            )
+
+        with self._lock:
+            counter, _ = _HEADER.unpack_from(buf)
+            _HEADER.pack_into(buf, 0, counter + 1, len(payload))
+            buf[_HEADER.size : _HEADER.size + len(payload)] = payload
+            _HEADER.pack_into(buf, 0, counter + 2, len(payload))
+            self._counter, self._instance = counter + 2, instance
+
+    def get(self, timeout: float = 1.0) -> _T:
+        """Returns the latest published instance.
+
+        The instance is only unpickled when a new version was published since
+        the last call; otherwise the same instance is returned. For singleton
+        classes, the new instance also replaces the singleton, so that the
+        class returns it when instantiated.
+
+        Reads that overlap with a write are retried with a growing backoff. If
+        no complete version can be read within `timeout` seconds, such as when
+        the publisher died while writing, a `TimeoutError` is raised.
+        """
+        buf = self._buf
+        counter, _ = _HEADER.unpack_from(buf)
+        if counter == self._counter and self._instance is not None:
+            return self._instance
+
+        deadline = time.monotonic() + timeout
+        backoff = 1e-6
+        while True:
+            counter, length = _HEADER.unpack_from(buf)
+            if counter == self._counter and self._instance is not None:
+                return self._instance
+            elif counter == 0:
+                raise LookupError(f"Nothing has been published to {self.name}")
+            elif not counter % 2:
+                data = bytes(buf[_HEADER.size : _HEADER.size + length])
+                if _HEADER.unpack_from(buf)[0] == counter:
+                    break
+
+            # A new version is being written
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"No complete version of {self.name} could be read within "
+                    f"{timeout}s; its publisher may have stopped while writing"
+                )
+            time.sleep(backoff)
+            backoff = min(backoff * 2, _MAX_BACKOFF)
+
+        with self._lock:
+            # Another thread may have read this or a later version meanwhile
+            if counter <= self._counter and self._instance is not None:
+                return self._instance
+
+            payload = pickle.loads(data)
+            if payload["schema"] != self._schema:
+                raise ValueError(
+                    f"{self.name} was published for another definition of "
+                    f"{self.cls.__name__}"
+                )
+
+            instance = _load_values(self.cls, payload, payload["raw"], replace=True)
+            self._counter, self._instance = counter, instance
+            return instance
+
+    def close(self) -> None:
+        """Detaches from the shared memory block."""
+        self._instance = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block. Only the publishing process should call it."""
+        self._memory.unlink()
+
+
+def publish(
+    instance: _T, name: str | None = None, size: int | None = None
+) -> SharedLoader[_T]:
+    """Creates a shared memory block, and publishes the loaded `instance` to it.
+
+    Every later reload of the instance publishes a new version. The block is
+    `size` bytes, or large enough for several times the current instance if
+    not given; instances that outgrow it can no longer be published.
+    """
+    cls = typing.cast(type[_T], type(instance)._env_class())
+    if size is None:
+        size = max(_MIN_SIZE, 4 * (_HEADER.size + len(_dumps(instance))))
+
+    memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+    shared = SharedLoader(cls, memory)
+    try:
+        shared.publish(instance)
+    except BaseException:
+        memory.close()
+        memory.unlink()
+        raise
+
+    instance.on_reload(lambda reloaded, _: shared.publish(reloaded))
+    return shared
+
+
+def attach(cls: type[_T], name: str) -> SharedLoader[_T]:
+    """Attaches to the shared memory block that an instance of `cls` was published to."""
+    if sys.version_info >= (3, 13):
+        memory = shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    else:
+        # Before Python 3.13, attaching also registers the block with the
+        # resource tracker. Forked workers share the tracker of the publisher,
+        # so the block outlives them; other processes unlink it when they exit.
+        memory = shared_memory.SharedMemory(name=name)
+    return SharedLoader(cls, memory)
@@ -0,0 +1,276 @@
+"""Persisted snapshots of loaded `EnvLoader` instances.
+
+A snapshot stores the converted values of an instance together with a key
+derived from the class schema and the raw values of its sources. Processes
+that load the same class from the same inputs can restore the snapshot
+instead of resolving type hints and running converters again.
+
+Snapshots are pickled, so only load snapshots from locations you trust.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import types
+import typing
+
+from typedenv.converters import Converter
+from typedenv._internals import _MISSING
+from typedenv.loader import _SINGLETONS, EnvLoader, _FieldDescriptor, _FrozenField
+from typedenv.sources import merge_sources
+
+_T = typing.TypeVar("_T", bound=EnvLoader)
+_FORMAT_VERSION = 2
+
+
+def _stable_repr(obj: typing.Any, memo: dict[tuple[type, typing.Any], str] | None = None) -> str:
+    """Returns a repr of an annotation or default that is identical across processes."""
+    if memo is not None:
+        try:
+            return memo[type(obj), obj]
+        except (KeyError, TypeError):
+            pass
+
+    result = _uncached_stable_repr(obj)
+    if memo is not None:
+        try:
+            memo[type(obj), obj] = result
+        except TypeError:
+            pass
+    return result
+
+
+def _code_digest(code: types.CodeType) -> str:
+    """Returns a hash of the bytecode, constants and names of a code object, and of its nested code."""
+    digest = hashlib.sha256(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            digest.update(_code_digest(const).encode())
+        else:
+            digest.update(repr(const).encode())
+    digest.update(repr(code.co_names).encode())
+    return digest.hexdigest()
+
+
+def _function_repr(func: types.FunctionType, closures: bool = True) -> str:
+    """Returns the name of a function with a hash of its code, so that editing its body changes it.
+
+    Values captured by the function are included too, though functions among
+    them only contribute their own code, which keeps recursive closures finite.
+    """
+    parts = [_code_digest(func.__code__), repr(func.__defaults__)]
+    cells = (func.__closure__ or ()) if closures else ()
+    for cell in cells:
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            # The variable is not assigned yet
+            continue
+        if isinstance(value, types.FunctionType):
+            parts.append(_function_repr(value, closures=False))
+        else:
+            parts.append(_stable_repr(value))
+
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return f"{func.__module__}.{func.__qualname__}#{digest}"
+
+
+def _uncached_stable_repr(obj: typing.Any) -> str:
+    if isinstance(obj, Converter):
+        return f"Converter({_stable_repr(obj.convert)}, cacheable={obj.cacheable})"
+    if isinstance(obj, types.FunctionType):
+        return _function_repr(obj)
+    if isinstance(obj, functools.partial):
+        args = ", ".join(_stable_repr(arg) for arg in obj.args)
+        kwargs = ", ".join(f"{k}={_stable_repr(v)}" for k, v in obj.keywords.items())
+        return f"partial({_stable_repr(obj.func)}, {args}, {kwargs})"
+    if isinstance(obj, (type, types.BuiltinFunctionType)):
+        return f"{obj.__module__}.{obj.__qualname__}"
+
+    origin = typing.get_origin(obj)
+    if origin is not None:
+        args = ", ".join(_stable_repr(arg) for arg in typing.get_args(obj))
+        return f"{_stable_repr(origin)}[{args}]"
+
+    return repr(obj)
+
+
+def _nested_loaders(annotation: typing.Any) -> typing.Iterator[type[EnvLoader]]:
+    """Yields the `EnvLoader` classes that an annotation nests, however deeply wrapped."""
+    if isinstance(annotation, type) and issubclass(annotation, EnvLoader):
+        yield annotation
+    for arg in typing.get_args(annotation):
+        yield from _nested_loaders(arg)
+
+
+def schema_key(cls: type[EnvLoader]) -> str:
+    """Returns a hash of the annotations, defaults and converters of a loader class.
+
+    Unlike the load plan, the hash does not resolve type hints, so it is cheap
+    to compute in a fresh process. Converters are hashed with their code, so
+    deploying a changed converter invalidates snapshots of the old one. Nested loader classes are hashed with
+    their own schema, so changing them changes the key of every class they
+    are nested in.
+    """
+    return _schema_key(cls, frozenset())
+
+
+def _schema_key(cls: type[EnvLoader], parents: frozenset[type]) -> str:
+    # Many keys usually share the same annotation
+    memo: dict[tuple[type, typing.Any], str] = {}
+    parts = [f"{cls.__module__}.{cls.__qualname__}"]
+    nested: dict[type[EnvLoader], None] = {}
+    for klass in cls.__mro__:
+        if not issubclass(klass, EnvLoader):
+            continue
+
+        annotations = klass.__dict__.get("__annotations__", {})
+        for name, annotation in annotations.items():
+            parts.append(f"{klass.__qualname__}.{name}: {_stable_repr(annotation, memo)}")
+            nested.update(dict.fromkeys(_nested_loaders(annotation)))
+        for name, value in klass.__dict__.items():
+            if not name.isupper():
+                continue
+
+            # Descriptors are installed once the load plan is built, and
+            # must hash like the value the class declared before that
+            if isinstance(value, (_FieldDescriptor, _FrozenField)):
+                value = value.declared
+                if value is _MISSING:
+                    continue
+            parts.append(f"{klass.__qualname__}.{name} = {_stable_repr(value, memo)}")
+
+    for type_, convert in cls._env_converters().items():
+        parts.append(f"converter {_stable_repr(type_)}: {_stable_repr(convert)}")
+
+    for loader in nested:
+        # Classes nesting themselves cannot be loaded, but must still hash
+        if loader not in parents and loader is not cls:
+            key = _schema_key(loader, parents | {cls})
+            parts.append(f"nested {_stable_repr(loader)}: {key}")
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def inputs_key(environ: typing.Mapping[str, str]) -> str:
+    """Returns a hash of the raw values a loader instance was loaded from."""
+    digest = hashlib.sha256()
+    for name in sorted(environ):
+        digest.update(f"{name}={environ[name]}\0".encode())
+    return digest.hexdigest()
+
+
+def _dump_values(instance: EnvLoader) -> dict[str, typing.Any]:
+    """Returns the schema key, converted values and origins of an instance to persist.
+
+    Only instances loaded from the sources of their class can be dumped, as
+    origins are stored as indexes into those sources.
+    """
+    cls = type(instance)._env_class()
+    sources = cls._env_class_sources()
+    if instance._env_sources is not sources:
+        raise ValueError(f"{instance} was not loaded from the sources of its class")
+
+    names = sorted(field.name for field in instance._resolve_env_fields())
+    return {
+        "schema": schema_key(cls),
+        # Values are read through `getattr` so that lazy keys get converted
+        "values": {name: getattr(instance, name) for name in names},
+        "origins": {
+            name: sources.index(source)
+            for name, source in instance._env_origins.items()
+        },
+    }
+
+
+def _load_values(
+    cls: type[_T],
+    payload: dict[str, typing.Any],
+    environ: dict[str, str],
+    replace: bool = False,
+) -> _T:
+    """Creates an instance from the values of a payload created by `_dump_values`."""
+    sources = cls._env_class_sources()
+    env_origins = {name: sources[i] for name, i in payload["origins"].items()}
+    return cls._restore(payload["values"], environ, env_origins, replace=replace)
+
+
+def save(instance: EnvLoader, path: str | os.PathLike[str]) -> None:
+    """Writes a snapshot of a loaded instance to `path`, replacing it atomically.
+
+    Only instances loaded from the sources of their class can be saved.
+    """
+    cls = type(instance)._env_class()
+    payload = {
+        **_dump_values(instance),
+        "format": _FORMAT_VERSION,
+        "python": sys.version_info[:2],
+        "keys": sorted(cls.__env_source_keys__),
+        "inputs": inputs_key(instance._env_raw),
+    }
+
+    # `tempfile` is not used, as importing it would add to the cold start
+    # that snapshots are meant to shorten
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # Snapshots hold every converted value, secrets included, so they are
+        # only readable by their owner
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "wb") as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _restore(cls: type[_T], path: str | os.PathLike[str]) -> _T | None:
+    try:
+        with open(path, "rb") as file:
+            payload = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != _FORMAT_VERSION
+        or payload.get("python") != sys.version_info[:2]
+        or payload.get("schema") != schema_key(cls)
+    ):
+        return None
+
+    sources = cls._env_class_sources()
+    environ, _ = merge_sources(sources, payload["keys"])
+    if payload["inputs"] != inputs_key(environ):
+        return None
+
+    return _load_values(cls, payload, environ)
+
+
+def load(cls: type[_T], path: str | os.PathLike[str], write: bool = True) -> _T:
+    """Returns an instance of `cls`, restored from the snapshot at `path` if it is current.
+
+    A snapshot is current if it was written for the same class schema, the
+    same raw source values, and the same Python version. Otherwise the class is
+    loaded as usual and, if `write` is set, a new snapshot is written to `path`.
+    """
+    if (instance := _SINGLETONS.get(cls)) is not None:
+        return instance
+
+    if (instance := _restore(cls, path)) is not None:
+        return instance
+
+    instance = cls()
+    if write:
+        try:
+            save(instance, path)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError):
+            # Snapshots are only an optimization; a value that cannot be
+            # pickled, or a path that cannot be written, does not fail the load
+            pass
+
+    return instance
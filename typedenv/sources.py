@@ -0,0 +1,277 @@
+import mmap
+import os
+import re
+import typing
+from collections.abc import Collection, Iterator, Mapping, Sequence
+
+# Every match consumes a full line (or a full multi-line quoted entry), so
+# `finditer` never has to retry the pattern at each position of a line it
+# cannot parse; such lines simply match without a `key` group.
+_ENV_FILE_ENTRY = re.compile(
+    rb"""
+    [ \t]*
+    (?:
+        (?:export[ \t]+)?
+        (?P<key>[A-Za-z_][A-Za-z0-9_.]*)
+        [ \t]*=[ \t]*
+        (?:
+            # Unrolled, so an unterminated quote fails in linear time
+            "(?P<double>[^"\\]*(?:\\[\s\S][^"\\]*)*)"
+          | '(?P<single>[^']*)'
+          | (?P<bare>[^\r\n]*)
+        )
+    )?
+    [^\n]*\n?
+    """,
+    re.VERBOSE,
+)
+_ESCAPE_SEQUENCE = re.compile(rb"\\(.)", re.DOTALL)
+_ESCAPED_CHARS = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b'"': b'"', b"\\": b"\\"}
+_INLINE_COMMENT = re.compile(rb"[ \t]+#.*$|[ \t]+$")
+
+
+class Source(typing.Protocol):
+    """A layer that environment keys can be loaded from."""
+
+    def read(self, keys: Collection[str]) -> Mapping[str, str]:
+        """Returns the values of the given keys that are set in this source."""
+        ...
+
+
+def _identity(value: typing.Any) -> typing.Any:
+    return value
+
+
+class EnvironSnapshot(Mapping[str, str]):
+    """A point-in-time copy of `os.environ`.
+
+    The copy is taken in a single step so that every key read from the
+    snapshot comes from the same state of the environment, even if another
+    thread modifies `os.environ` while a loader is reading from it.
+    """
+
+    __slots__ = ("_data", "_encodekey", "_decodekey", "_decodevalue")
+
+    _encodekey: typing.Callable[[str], typing.Any]
+    _decodekey: typing.Callable[[typing.Any], str]
+    _decodevalue: typing.Callable[[typing.Any], str]
+
+    def __init__(self) -> None:
+        environ = os.environ
+        data = getattr(environ, "_data", None)
+
+        if data is None:
+            self._data: dict[typing.Any, typing.Any] = dict(environ)
+            self._encodekey = self._decodekey = self._decodevalue = _identity
+        else:
+            # `os.environ` keeps its encoded keys and values in `_data`.
+            # Copying that dict is atomic, and much cheaper than
+            # `os.environ.copy()`, which decodes every entry up front.
+            self._data = data.copy()
+            self._encodekey = environ.encodekey
+            self._decodekey = environ.decodekey
+            self._decodevalue = environ.decodevalue
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:  # type: ignore[override]
+        value = self._data.get(self._encodekey(key))
+        return default if value is None else self._decodevalue(value)
+
+    def __getitem__(self, key: str) -> str:
+        return self._decodevalue(self._data[self._encodekey(key)])
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self._decodekey, self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class Environ:
+    """The process environment, read through a single `EnvironSnapshot`."""
+
+    def read(self, keys: Collection[str]) -> dict[str, str]:
+        snapshot = EnvironSnapshot()
+        return {key: value for key in keys if (value := snapshot.get(key)) is not None}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MappingSource:
+    """An in-memory mapping of environment keys."""
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        self.mapping = mapping
+
+    def read(self, keys: Collection[str]) -> dict[str, str]:
+        mapping = self.mapping
+        return {key: mapping[key] for key in keys if key in mapping}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.mapping!r})"
+
+
+# The last read contents of each secret file, with the (mtime, size) they were read at
+_SECRET_CACHE: dict[tuple[str, str], tuple[tuple[int, int], str]] = {}
+
+
+def read_secret_file(
+    path: str | os.PathLike[str], max_size: int, encoding: str = "utf-8"
+) -> str:
+    """Reads a secret file, without its trailing line breaks.
+
+    Contents are cached by the path, modification time and size of the file,
+    so unchanged files are only read once. Files larger than `max_size` bytes
+    are rejected rather than read into memory.
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    state = (stat.st_mtime_ns, stat.st_size)
+    cached = _SECRET_CACHE.get((path, encoding))
+    if cached is not None and cached[0] == state:
+        return cached[1]
+
+    with open(path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        # Files in /proc report a size of 0, so the read is capped as well
+        if stat.st_size > max_size or len(data := file.read(max_size + 1)) > max_size:
+            raise ValueError(f"{path} is larger than {max_size} bytes")
+
+    value = data.decode(encoding).rstrip("\r\n")
+    _SECRET_CACHE[(path, encoding)] = ((stat.st_mtime_ns, stat.st_size), value)
+    return value
+
+
+class SecretFiles:
+    """Reads each key from `source`, or from the file named by the key with `suffix` if unset.
+
+    Follows the Docker and Kubernetes convention of mounting secrets as files,
+    such as `DB_PASSWORD_FILE=/run/secrets/db_password`. Trailing line breaks
+    of the file are removed. The process environment is used if no `source`
+    is given.
+    """
+
+    def __init__(
+        self,
+        source: Source | None = None,
+        *,
+        suffix: str = "_FILE",
+        max_size: int = 1024 * 1024,
+        encoding: str = "utf-8",
+    ) -> None:
+        self.source = Environ() if source is None else source
+        self.suffix = suffix
+        self.max_size = max_size
+        self.encoding = encoding
+
+    def read(self, keys: Collection[str]) -> dict[str, str]:
+        suffix = self.suffix
+        values = self.source.read([*keys, *(key + suffix for key in keys)])
+
+        result: dict[str, str] = {}
+        for key in keys:
+            if (value := values.get(key)) is not None:
+                result[key] = value
+            elif (path := values.get(key + suffix)) is not None:
+                try:
+                    result[key] = read_secret_file(path, self.max_size, self.encoding)
+                except (OSError, ValueError) as e:
+                    raise ValueError(f"Cannot read {key} from {key}{suffix}: {e}") from e
+        return result
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r})"
+
+
+def merge_sources(
+    sources: Sequence[Source], keys: Collection[str]
+) -> tuple[dict[str, str], dict[str, Source]]:
+    """Merges the given keys of each source into a single lookup index.
+
+    Sources are ordered from highest to lowest precedence. Returns the merged
+    values together with the source that each value was taken from.
+    """
+    if len(sources) == 1:
+        values = dict(sources[0].read(keys))
+        return values, dict.fromkeys(values, sources[0])
+
+    merged: dict[str, str] = {}
+    origins: dict[str, Source] = {}
+    for source in reversed(sources):
+        source_values = source.read(keys)
+        merged.update(source_values)
+        origins.update(dict.fromkeys(source_values, source))
+
+    return merged, origins
+
+
+def _unescape(match: re.Match[bytes]) -> bytes:
+    char = match.group(1)
+    return _ESCAPED_CHARS.get(char, b"\\" + char)
+
+
+def parse_env_file(
+    path: str | os.PathLike[str],
+    keys: Collection[str] | None = None,
+    encoding: str = "utf-8",
+) -> dict[str, str]:
+    """Parses a `.env` file into a dict, in a single pass over the file.
+
+    Supports `export` prefixes, comments, single quoted (literal) values and
+    double quoted values, both of which may span multiple lines. Double quoted
+    values support the `\\n`, `\\r`, `\\t`, `\\"` and `\\\\` escapes. When a key
+    appears more than once, the last value wins.
+
+    If `keys` is given, only those keys are decoded and returned; every other
+    entry is skipped without being materialized.
+    """
+    wanted = None if keys is None else {key.encode(encoding) for key in keys}
+    values: dict[str, str] = {}
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return values
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for match in _ENV_FILE_ENTRY.finditer(buffer):  # type: ignore[call-overload]
+                key = match["key"]
+                if key is None or (wanted is not None and key not in wanted):
+                    continue
+
+                if (value := match["double"]) is not None:
+                    value = _ESCAPE_SEQUENCE.sub(_unescape, value)
+                elif (value := match["single"]) is None:
+                    value = _INLINE_COMMENT.sub(b"", match["bare"])
+
+                values[key.decode(encoding)] = value.decode(encoding)
+
+    return values
+
+
+class EnvFile:
+    """A `.env` file that can be read as a source of environment keys.
+
+    If `missing_ok` is set, a file that does not exist is read as empty.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        encoding: str = "utf-8",
+        missing_ok: bool = False,
+    ) -> None:
+        self.path = path
+        self.encoding = encoding
+        self.missing_ok = missing_ok
+
+    def read(self, keys: Collection[str] | None = None) -> dict[str, str]:
+        try:
+            return parse_env_file(self.path, keys, self.encoding)
+        except FileNotFoundError:
+            if self.missing_ok:
+                return {}
+            raise
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({os.fspath(self.path)!r})"
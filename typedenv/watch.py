@@ -0,0 +1,87 @@
+import logging
+import os
+import threading
+import typing
+from collections.abc import Iterable
+
+from typedenv.loader import EnvLoader
+from typedenv.sources import EnvFile
+
+_logger = logging.getLogger("typedenv")
+_FileState = tuple[int, int] | None
+
+
+def _file_state(path: str | os.PathLike[str]) -> _FileState:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """Polls files for changes, and reloads an `EnvLoader` instance when any change.
+
+    By default, the watched files are the `EnvFile` sources the instance was
+    loaded from. Errors raised by a reload are passed to `on_error`, or logged
+    if it is not set; the instance then keeps its previous values.
+    """
+
+    def __init__(
+        self,
+        loader: EnvLoader,
+        paths: Iterable[str | os.PathLike[str]] | None = None,
+        interval: float = 1.0,
+        on_error: typing.Callable[[Exception], None] | None = None,
+    ) -> None:
+        if paths is None:
+            paths = [s.path for s in loader._env_sources if isinstance(s, EnvFile)]
+
+        self.loader = loader
+        self.paths = list(paths)
+        self.interval = interval
+        self.on_error = on_error
+        self._states = [_file_state(path) for path in self.paths]
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll(self) -> frozenset[str]:
+        """Checks the watched files once, and returns the keys changed by a reload."""
+        states = [_file_state(path) for path in self.paths]
+        if states == self._states:
+            return frozenset()
+
+        self._states = states
+        try:
+            return self.loader.reload()
+        except Exception as e:
+            if self.on_error is None:
+                _logger.exception("Failed to reload %s", type(self.loader).__name__)
+            else:
+                self.on_error(e)
+            return frozenset()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("FileWatcher has already been started")
+
+        self._thread = threading.Thread(
+            target=self._run, name="typedenv-file-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.poll()
+
+    def __enter__(self) -> "FileWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.stop()